@@ -17,6 +17,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from trade_up_calculator import TradeUpContract
+from listing import Listing
+from operator import attrgetter
 import time
 import keyboard
 
@@ -952,7 +954,7 @@ class ConsoleUI:
             Text(f"Time Elapsed: {stats['elapsed_time']}", style="magenta"),
             Rule(style="cyan"),
             Text("\nLatest Items:", style="bold cyan"),
-            *(Text(f"• {item['name']}: {item['price']}", style="white") 
+            *(Text(f"• {item.name}: {item.price_text}", style="white") 
               for item in stats['recent_items'][-3:])  # Show last 3 items
         )
         
@@ -966,7 +968,7 @@ class ConsoleUI:
         if self.live:
             self.live.refresh()
 
-    def display_results(self, items: List[Dict[str, Any]]):
+    def display_results(self, items: List[Listing]):
         """Display scraped items in a formatted table with enhanced visuals."""
         if not items:
             self.show_warning("No items found!")
@@ -991,18 +993,17 @@ class ConsoleUI:
         table.add_column("Profit Potential", style="red", justify="right")
 
         # Sort items by price for better visualization
-        items.sort(key=lambda x: float(x["price"].replace("$", "").replace(",", "")))
+        items.sort(key=attrgetter("price_cents"))
 
         for item in items:
-            price = float(item["price"].replace("$", "").replace(",", ""))
-            profit_potential = self._calculate_profit_potential(price)
+            profit_potential = self._calculate_profit_potential(item.price)
             
             table.add_row(
-                item["name"],
-                item["price"],
-                item.get("wear", "N/A"),
-                "✓" if item["stat"] else "✗",
-                "✓" if item["souv"] else "✗",
+                item.name,
+                item.price_text,
+                item.wear_label or "N/A",
+                "✓" if item.stat else "✗",
+                "✓" if item.souv else "✗",
                 f"{profit_potential:+.2f}%" if profit_potential else "N/A"
             )
 
@@ -1042,11 +1043,11 @@ class ConsoleUI:
         table.add_column("Success", style="green", justify="right")
 
         for contract in opportunities:
-            input_names = ", ".join(item["name"].split("|")[1].strip() for item in contract.input_items[:3])
+            input_names = ", ".join(item.name.split("|")[1].strip() for item in contract.input_items[:3])
             if len(contract.input_items) > 3:
                 input_names += f" +{len(contract.input_items)-3} more"
 
-            output_names = ", ".join(item["name"].split("|")[1].strip() for item in contract.potential_outputs[:2])
+            output_names = ", ".join(item.name.split("|")[1].strip() for item in contract.potential_outputs[:2])
             if len(contract.potential_outputs) > 2:
                 output_names += f" +{len(contract.potential_outputs)-2} more"
 
@@ -1081,9 +1082,9 @@ class ConsoleUI:
         
         for item in contract.input_items:
             input_table.add_row(
-                item["name"],
-                item["wear"],
-                item["price"]
+                item.name,
+                item.wear_label or "N/A",
+                item.price_text
             )
 
         # Output items table
@@ -1094,9 +1095,9 @@ class ConsoleUI:
         
         for item in contract.potential_outputs:
             output_table.add_row(
-                item["name"],
-                item["wear"],
-                item["price"]
+                item.name,
+                item.wear_label or "N/A",
+                item.price_text
             )
 
         # Summary table
@@ -1106,6 +1107,7 @@ class ConsoleUI:
         summary_table.add_row("Profit Margin", f"{contract.profit_margin:+.1f}%")
         summary_table.add_row("Risk Level", contract.risk_level)
         summary_table.add_row("Success Chance", f"{contract.success_chance*100:.0f}%")
+        summary_table.add_row("Priced Outcomes", f"{contract.priced_coverage*100:.0f}%")
         summary_table.add_row("Float Range", f"{contract.float_range[0]:.3f} - {contract.float_range[1]:.3f}")
 
         # Update using existing live context
@@ -1133,12 +1135,12 @@ class ConsoleUI:
             return 0
         return ((self.config['analysis']['max_price'] - price) / price) * 100
 
-    def show_market_analysis(self, items: List[Dict[str, Any]]):
+    def show_market_analysis(self, items: List[Listing]):
         """Show detailed market analysis."""
         if not items:
             return
 
-        prices = [float(item["price"].replace("$", "").replace(",", "")) for item in items]
+        prices = [item.price for item in items]
         avg_price = sum(prices) / len(prices)
         min_price = min(prices)
         max_price = max(prices)
@@ -1146,7 +1148,7 @@ class ConsoleUI:
         # Create wear distribution
         wear_dist = {}
         for item in items:
-            wear = item.get("wear", "Unknown")
+            wear = item.wear_label or "Unknown"
             wear_dist[wear] = wear_dist.get(wear, 0) + 1
 
         # Create price distribution
@@ -1180,6 +1182,21 @@ class ConsoleUI:
         price_table.add_row("Maximum Price", f"${max_price:.2f}")
         price_table.add_row("Total Items", str(len(items)))
 
+        # Day-over-day movement from the price history rollups
+        if self.scraper:
+            rising = falling = compared = 0
+            for item in items:
+                previous_close = self.scraper.price_history.previous_close(
+                    item.name, item.wear_label, item.stat, item.souv
+                )
+                if previous_close is None:
+                    continue
+                compared += 1
+                rising += item.price_cents > previous_close
+                falling += item.price_cents < previous_close
+            price_table.add_row("Up Since Yesterday", str(rising) if compared else "n/a")
+            price_table.add_row("Down Since Yesterday", str(falling) if compared else "n/a")
+
         dist_table = Table(title="Price Distribution")
         dist_table.add_column("Range", style="cyan")
         dist_table.add_column("Count", style="green", justify="right")
@@ -1334,14 +1351,15 @@ class ConsoleUI:
 
             # Scrape items
             items = []
-            for item in self.scraper.get_items(weapon):
+            total_cents = 0
+            for item in self.scraper.get_recorded_items(weapon):
                 items.append(item)
+                total_cents += item.price_cents
                 
                 # Update stats
                 stats['items'] = len(items)
                 stats['pages'] = (len(items) - 1) // 10 + 1
-                prices = [float(i['price'].replace('$', '').replace(',', '').replace(' USD', '')) for i in items]
-                stats['avg_price'] = sum(prices) / len(prices)
+                stats['avg_price'] = total_cents / len(items) / 100
                 stats['elapsed_time'] = str(datetime.timedelta(seconds=int(time.time() - start_time)))
                 stats['recent_items'] = items[-3:] if len(items) > 3 else items
 
@@ -1403,7 +1421,7 @@ class ConsoleUI:
                             Text(f"Time Elapsed: {progress_info['elapsed_time']}", style="blue"),
                             Rule(style="cyan"),
                             Text("\nRecent Items:", style="bold cyan"),
-                            *(Text(f"• {item['name']}: {item['price']}", style="white") 
+                            *(Text(f"• {item.name}: {item.price_text}", style="white") 
                               for item in progress_info['recent_items'][-3:])
                         ),
                         title="Market Analysis Progress",
@@ -1431,7 +1449,7 @@ class ConsoleUI:
                 self.live.refresh()
 
             # Scrape items
-            items = self.scraper.get_items(weapon)
+            items = list(self.scraper.get_recorded_items(weapon))
             
             if items:
                 # Show market analysis
@@ -0,0 +1,179 @@
+import json
+import time
+import logging
+import datetime
+import multiprocessing
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+from checkpoint import ScrapeCheckpoint
+from rate_limiter import AdaptiveRateLimiter
+from vpn_controller import VPNRotationController
+
+logger = logging.getLogger(__name__)
+
+# Per-process scraper, created once by the pool initializer
+_worker_scraper = None
+
+
+@dataclass
+class WeaponScanResult:
+    weapon: str
+    status: str
+    items: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def _init_worker(base_url: str, request_semaphore, rate_limit_state, vpn_state):
+    """Create this worker's scraper (one HTTP session / browser per process).
+
+    All workers pace requests from one shared rate limiter bucket and gate
+    them on the parent's VPN rotations, and the scraper is cleaned up
+    (browsers, price history) when the worker exits.
+    """
+    global _worker_scraper
+    from scraper import Scraper
+    from temp import items_dict
+
+    _worker_scraper = Scraper(base_url, items_dict, show_progress=False, vpn_state=vpn_state)
+    _worker_scraper.request_semaphore = request_semaphore
+    _worker_scraper.rate_limiter = AdaptiveRateLimiter.from_config(
+        _worker_scraper.config, name="batch", shared_state=rate_limit_state
+    )
+    # Pool workers exit through multiprocessing's finalizers, not atexit
+    Finalize(_worker_scraper, _worker_scraper.cleanup, exitpriority=10)
+
+
+def _scan_weapon(weapon: str, resume: bool = False) -> WeaponScanResult:
+    """Scrape one weapon in a worker process and save it to the data directory."""
+    started = time.monotonic()
+    try:
+        # Listings are written to disk as they are scraped
+        count = _worker_scraper.save_weapon_data(weapon, _worker_scraper.get_items(weapon, resume))
+        return WeaponScanResult(
+            weapon=weapon,
+            status="ok" if count else "empty",
+            items=count,
+            seconds=time.monotonic() - started
+        )
+    except Exception as e:
+        return WeaponScanResult(
+            weapon=weapon,
+            status="failed",
+            items=0,
+            seconds=time.monotonic() - started,
+            error=str(e)
+        )
+
+
+def scan_all(config: Dict[str, Any], weapons: Optional[List[str]] = None,
+             on_result: Optional[Callable[[WeaponScanResult], None]] = None,
+             resume: bool = False) -> List[WeaponScanResult]:
+    """Scrape many weapons in parallel and write a per-weapon summary to the data directory.
+
+    Weapons are spread over `performance.limits.max_parallel_weapons` worker
+    processes. A semaphore shared by all workers caps the number of requests in
+    flight at `performance.limits.max_concurrent_requests`, and all workers
+    share one adaptive rate limiter, so the combined request rate is the
+    configured one and a 429 slows every worker down. The VPN tunnel is
+    system-wide, so this process owns it and runs the rotations; workers only
+    hold their requests while it rotates. With `resume`,
+    weapons whose checkpoint is complete (younger than the cache max age and
+    scraped under the same price window and extraction mode) are skipped and interrupted ones continue from their last page.
+    """
+    from temp import items_dict
+
+    weapons = weapons or list(items_dict.keys())
+    limits = config['performance']['limits']
+    base_url = config['scraping']['steam_market']['base_url']
+
+    results = []
+    pending = weapons
+    if resume:
+        data_config = config['scraping']['data_management']
+        checkpoint_dir = Path(data_config['data_directory']) / "checkpoints"
+        max_age = data_config['cache']['max_age_hours'] * 3600
+        max_price = config['analysis']['price_limits']['max_price_usd']
+        extraction_mode = config['scraping']['steam_market'].get('extraction_mode', 'selenium')
+        pending = []
+        for weapon in weapons:
+            checkpoint = ScrapeCheckpoint.load(checkpoint_dir, weapon)
+            if checkpoint and checkpoint.completed and not checkpoint.is_stale(max_age, max_price, extraction_mode):
+                logger.info(f"Skipping {weapon}: checkpoint complete, {checkpoint.age_seconds / 60:.0f} min old")
+                result = WeaponScanResult(weapon, "skipped", checkpoint.listing_count, 0.0)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            else:
+                pending.append(weapon)
+        logger.info(f"Resuming scan: {len(weapons) - len(pending)} weapons already complete")
+
+    if not pending:
+        _write_summary(config, results)
+        return results
+
+    max_workers = min(limits['max_parallel_weapons'], len(pending))
+    manager = multiprocessing.Manager()
+    request_semaphore = manager.BoundedSemaphore(limits['max_concurrent_requests'])
+    rate_limit_state = AdaptiveRateLimiter.shared_state_from_config(config)
+    vpn_state, vpn_controller = _start_vpn(config, manager)
+
+    logger.info(f"Scanning {len(pending)} weapons with {max_workers} workers")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(base_url, request_semaphore, rate_limit_state, vpn_state)) as pool:
+            futures = {pool.submit(_scan_weapon, weapon, resume): weapon for weapon in pending}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. browser crash took it down)
+                    result = WeaponScanResult(futures[future], "failed", 0, 0.0, str(e))
+                results.append(result)
+                logger.info(f"{result.weapon}: {result.status} ({result.items} items, {result.seconds:.1f}s)")
+                if on_result:
+                    on_result(result)
+    finally:
+        if vpn_controller:
+            vpn_controller.stop()
+            logger.info(f"VPN rotations during scan: {len(vpn_controller.rotations)}")
+        manager.shutdown()
+
+    results.sort(key=lambda result: weapons.index(result.weapon))
+    _write_summary(config, results)
+    return results
+
+
+def _start_vpn(config: Dict[str, Any], manager) -> Tuple[Optional[Dict[str, Any]], Optional[VPNRotationController]]:
+    """Connect the VPN and start rotating it from this process, with state shared with the workers.
+
+    Returns (None, None) without VPN. If the tunnel can't be brought up the
+    workers still get the (never rotating) shared state, so none of them
+    starts a controller of its own.
+    """
+    vpn_config = config['scraping']['vpn']
+    if not vpn_config['enabled']:
+        return None, None
+    vpn_state = VPNRotationController.create_shared_state(manager)
+    vpn_controller = VPNRotationController.for_platform(vpn_config, vpn_state)
+    if not vpn_controller.ensure_connected():
+        logger.warning("VPN unavailable, scanning without rotation")
+        return vpn_state, None
+    vpn_controller.start()
+    return vpn_state, vpn_controller
+
+
+def _write_summary(config: Dict[str, Any], results: List[WeaponScanResult]):
+    """Save the per-weapon status summary next to the scraped data."""
+    data_dir = Path(config['scraping']['data_management']['data_directory'])
+    data_dir.mkdir(exist_ok=True)
+    summary = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "weapons": [asdict(result) for result in results]
+    }
+    with open(data_dir / "scan_summary.json", 'w') as f:
+        json.dump(summary, f, indent=4)
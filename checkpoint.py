@@ -0,0 +1,142 @@
+import os
+import json
+import datetime
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from listing import Listing
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeCheckpoint:
+    """Progress of one weapon's scrape, written after every results page.
+
+    The state (page index, cursor, listing count, completion, and the price
+    window and extraction mode the scrape ran under) lives in
+    `<weapon>.json` and is replaced atomically; the listings themselves are
+    appended to `<weapon>.listings.jsonl`, one page batch per line, so each
+    checkpoint costs one page of writes instead of rewriting everything.
+    """
+
+    def __init__(self, checkpoint_dir: Path, weapon: str, max_price_usd: Optional[float] = None,
+                 extraction_mode: Optional[str] = None):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.weapon = weapon
+        self.max_price_usd = max_price_usd
+        self.extraction_mode = extraction_mode
+        self.page_index = 0
+        self.cursor: Optional[int] = None
+        self.listing_count = 0
+        self.completed = False
+        self.updated: Optional[str] = None
+
+    @property
+    def state_path(self) -> Path:
+        return self.checkpoint_dir / f"{self.weapon}.json"
+
+    @property
+    def listings_path(self) -> Path:
+        return self.checkpoint_dir / f"{self.weapon}.listings.jsonl"
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the checkpoint was last written."""
+        if not self.updated:
+            return 0.0
+        return (datetime.datetime.now() - datetime.datetime.fromisoformat(self.updated)).total_seconds()
+
+    def is_stale(self, max_age_seconds: float, max_price_usd: Optional[float] = None,
+                 extraction_mode: Optional[str] = None) -> bool:
+        """Whether a finished scrape can't be served instead of re-scraping.
+
+        That is when it is too old, or ran under another price window (a price
+        cutoff leaves it truncated) or extraction mode.
+        """
+        if not self.completed:
+            return False
+        return (self.age_seconds > max_age_seconds or self.max_price_usd != max_price_usd
+                or self.extraction_mode != extraction_mode)
+
+    @classmethod
+    def start(cls, checkpoint_dir: Path, weapon: str, max_price_usd: Optional[float] = None,
+              extraction_mode: Optional[str] = None) -> "ScrapeCheckpoint":
+        """Begin a fresh checkpoint, discarding any previous one for the weapon."""
+        checkpoint = cls(checkpoint_dir, weapon, max_price_usd, extraction_mode)
+        checkpoint.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint.listings_path.unlink(missing_ok=True)
+        checkpoint._save_state()
+        return checkpoint
+
+    @classmethod
+    def load(cls, checkpoint_dir: Path, weapon: str) -> Optional["ScrapeCheckpoint"]:
+        """Load the checkpoint for a weapon, or None if there is none."""
+        checkpoint = cls(checkpoint_dir, weapon)
+        try:
+            with open(checkpoint.state_path, 'r') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        checkpoint.page_index = state['page_index']
+        checkpoint.cursor = state['cursor']
+        checkpoint.listing_count = state['listing_count']
+        checkpoint.completed = state['completed']
+        checkpoint.updated = state['updated']
+        # Missing in checkpoints written before they were recorded (never served as complete)
+        checkpoint.max_price_usd = state.get('max_price_usd')
+        checkpoint.extraction_mode = state.get('extraction_mode')
+        return checkpoint
+
+    def load_listings(self) -> List[Listing]:
+        """Read the listings collected so far.
+
+        A batch appended after the last state save (a crash between the two
+        writes) is truncated away so resumed pages follow the recorded ones.
+        """
+        listings = []
+        try:
+            with open(self.listings_path, 'r+b') as f:
+                while len(listings) < self.listing_count:
+                    line = f.readline()
+                    if not line:
+                        break
+                    listings.extend(Listing.from_dict(item) for item in json.loads(line))
+                f.truncate(f.tell())
+        except FileNotFoundError:
+            pass
+        return listings[:self.listing_count]
+
+    def record_page(self, page_index: int, cursor: Optional[int], batch: List[Listing]):
+        """Append a finished page's listings and advance the checkpoint."""
+        with open(self.listings_path, 'a') as f:
+            f.write(json.dumps([listing.to_dict() for listing in batch]) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.page_index = page_index
+        self.cursor = cursor
+        self.listing_count += len(batch)
+        self._save_state()
+
+    def mark_complete(self):
+        """Mark the scrape as finished so resumed runs skip it."""
+        self.completed = True
+        self._save_state()
+        logger.debug(f"Checkpoint for {self.weapon} complete ({self.listing_count} listings)")
+
+    def _save_state(self):
+        self.updated = datetime.datetime.now().isoformat()
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                "weapon": self.weapon,
+                "page_index": self.page_index,
+                "cursor": self.cursor,
+                "listing_count": self.listing_count,
+                "completed": self.completed,
+                "max_price_usd": self.max_price_usd,
+                "extraction_mode": self.extraction_mode,
+                "updated": self.updated
+            }, f, indent=4)
+        os.replace(tmp_path, self.state_path)
@@ -15,7 +15,9 @@ from datetime import datetime
 import logging
 import json
 from typing import Dict, Any, List, Generator
+from operator import attrgetter
 from scraper import Scraper
+from listing import Listing
 from trade_up_calculator import TradeUpCalculator, TradeUpContract
 import sys
 import os
@@ -519,6 +521,9 @@ class ConsoleUI:
         # Get VPN preference
         options['use_vpn'] = Confirm.ask("\n[cyan]Enable VPN for analysis?[/cyan]", default=False)
         
+        # Continue an interrupted scrape from its checkpoint
+        options['resume'] = Confirm.ask("\n[cyan]Resume from checkpoint if available?[/cyan]", default=True)
+        
         # Get page limit
         while True:
             try:
@@ -563,12 +568,13 @@ class ConsoleUI:
         # Confirm options
         self.console.print("\n[bold cyan]Selected Options:[/bold cyan]")
         self.console.print(f"• VPN Enabled: [{'green' if options['use_vpn'] else 'red'}]{options['use_vpn']}[/]")
+        self.console.print(f"• Resume: [{'green' if options['resume'] else 'red'}]{options['resume']}[/]")
         self.console.print(f"• Page Limit: [yellow]{options['page_limit']} {'(All Pages)' if options['page_limit'] == 0 else 'pages'}[/]")
         self.console.print(f"• Price Range: [green]${options['min_price']} - ${options['max_price']}[/]")
         
         return options
 
-    def display_results(self, items: List[Dict[str, Any]]):
+    def display_results(self, items: List[Listing]):
         """Display analysis results."""
         if not items:
             self.console.print(Panel(
@@ -582,7 +588,7 @@ class ConsoleUI:
         self.items_analyzed += len(items)
         
         # Calculate statistics
-        prices = [float(item["price"].replace("$", "").replace(",", "")) for item in items]
+        prices = [item.price for item in items]
         avg_price = sum(prices) / len(prices)
         min_price = min(prices)
         max_price = max(prices)
@@ -599,7 +605,8 @@ class ConsoleUI:
                 f"[bright_white]Price Range:[/bright_white] [green]${min_price:.2f}[/green] - [green]${max_price:.2f}[/green]",
                 "",
                 "[dim]• Prices are in USD[/dim]",
-                "[dim]• Data is real-time from Steam Market[/dim]"
+                "[dim]• Data is real-time from Steam Market[/dim]",
+                "[dim]• Trend compares against the previous day's close (n/a until a day of history is recorded)[/dim]"
             ]),
             title="[bold cyan]📈 Market Analysis[/bold cyan]",
             border_style="cyan",
@@ -619,23 +626,25 @@ class ConsoleUI:
         table.add_column("Name", style="bright_white")
         table.add_column("Price", style="green", justify="right")
         table.add_column("Wear", style="bright_blue")
+        table.add_column("Rarity", style="bright_red")
         table.add_column("StatTrak", justify="center", style="bright_magenta")
         table.add_column("Souvenir", justify="center", style="bright_yellow")
         table.add_column("Trend", justify="center", style="bright_cyan")
         
         # Sort items by price
-        sorted_items = sorted(items, key=lambda x: float(x["price"].replace("$", "").replace(",", "")))
+        sorted_items = sorted(items, key=attrgetter("price_cents"))
         
         for item in sorted_items:
-            price_float = float(item["price"].replace("$", "").replace(",", ""))
-            trend = "↗️" if price_float > avg_price else "↘️" if price_float < avg_price else "➡️"
+            trend = self._get_price_trend(item)
+            skin = self.calculator.catalog.get(item.name)
             
             table.add_row(
-                item["name"],
-                f"[bold green]${price_float:.2f}[/bold green]",
-                item.get("wear", "N/A"),
-                "✨" if item["stat"] else "❌",
-                "🏆" if item["souv"] else "❌",
+                item.name,
+                f"[bold green]${item.price:.2f}[/bold green]",
+                item.wear_label or "N/A",
+                skin.rarity if skin else "[dim]?[/dim]",
+                "✨" if item.stat else "❌",
+                "🏆" if item.souv else "❌",
                 trend
             )
         
@@ -661,6 +670,18 @@ class ConsoleUI:
         self.console.print(tips_panel)
         self.console.print()
 
+    def _get_price_trend(self, item: Listing) -> str:
+        """Trend arrow against the previous daily close from price history, or n/a without one."""
+        previous_close = self.scraper.price_history.previous_close(
+            item.name, item.wear_label, item.stat, item.souv
+        )
+        if previous_close is None:
+            return "[dim]n/a[/dim]"
+        
+        change = (item.price_cents - previous_close) / previous_close * 100 if previous_close else 0.0
+        arrow = "↗️" if change > 0 else "↘️" if change < 0 else "➡️"
+        return f"{arrow} {change:+.1f}%"
+
     def display_trade_up_opportunities(self, opportunities: List[TradeUpContract]):
         """Display trade-up contract opportunities."""
         if not opportunities:
@@ -681,8 +702,11 @@ class ConsoleUI:
                 f"[bright_white]Found Opportunities:[/bright_white] [cyan]{len(opportunities)}[/cyan]",
                 f"[bright_white]Best Profit Margin:[/bright_white] [green]{max(o.profit_margin for o in opportunities):+.1f}%[/green]",
                 f"[bright_white]Average ROI:[/bright_white] [green]{sum(o.profit_margin for o in opportunities)/len(opportunities):+.1f}%[/green]",
+                f"[bright_white]Candidates Evaluated:[/bright_white] [cyan]{self.calculator.last_search.candidates}[/cyan] "
+                f"[dim]in {self.calculator.last_search.seconds * 1000:.1f} ms[/dim]",
                 "",
                 "[dim]• All calculations include Steam Market fees[/dim]",
+                "[dim]• Priced: share of outcomes with a market price (unpriced ones add nothing to EV)[/dim]",
                 "[dim]• Risk levels are based on historical data[/dim]"
             ]),
             title="[bold cyan]💹 Trade-Up Summary[/bold cyan]",
@@ -704,6 +728,7 @@ class ConsoleUI:
         table.add_column("Potential Outputs", style="bright_green")
         table.add_column("Cost", justify="right", style="bright_blue")
         table.add_column("Expected Value", justify="right", style="bright_cyan")
+        table.add_column("Priced", justify="right", style="bright_cyan")
         table.add_column("Profit", justify="right", style="bright_magenta")
         table.add_column("Risk", justify="center", style="bright_yellow")
         table.add_column("ROI", justify="center", style="bright_green")
@@ -713,13 +738,13 @@ class ConsoleUI:
         
         for contract in sorted_opps:
             # Format input items
-            input_names = ", ".join(item["name"].split("|")[1].strip() 
+            input_names = ", ".join(item.name.split("|")[1].strip() 
                                   for item in contract.input_items[:3])
             if len(contract.input_items) > 3:
                 input_names += f" [dim]+{len(contract.input_items)-3} more[/dim]"
 
             # Format output items
-            output_names = ", ".join(item["name"].split("|")[1].strip() 
+            output_names = ", ".join(item.name.split("|")[1].strip() 
                                    for item in contract.potential_outputs[:2])
             if len(contract.potential_outputs) > 2:
                 output_names += f" [dim]+{len(contract.potential_outputs)-2} more[/dim]"
@@ -736,6 +761,7 @@ class ConsoleUI:
                 output_names,
                 f"[bold blue]${contract.cost:.2f}[/bold blue]",
                 f"[bold cyan]${contract.expected_value:.2f}[/bold cyan]",
+                f"{contract.priced_coverage * 100:.0f}%",
                 f"[bold magenta]{contract.profit_margin:+.1f}%[/bold magenta]",
                 f"{risk_emoji} {contract.risk_level}",
                 f"[{'green' if contract.profit_margin > 0 else 'red'}]" +
@@ -782,6 +808,8 @@ class ConsoleUI:
                         
                     if choice == 'analyze':
                         self.run_analysis()
+                    elif choice == 'scan':
+                        self.run_batch_scan()
                     elif choice == 'settings':
                         self.show_settings()
                     elif choice == 'help':
@@ -814,6 +842,7 @@ class ConsoleUI:
         # Create menu with options
         menu_items = [
             ("🔍 Analyze", "Start market analysis or find trade-up opportunities"),
+            ("📦 Scan All", "Refresh market data for every weapon in parallel"),
             ("⚙️  Settings", "Configure application settings"),
             ("❓ Help", "View help documentation and guides"),
             ("ℹ️  About", "View application information"),
@@ -847,6 +876,7 @@ class ConsoleUI:
             yield Text("")
             yield Text("[bold yellow]Quick Commands:[/bold yellow]")
             yield Text("🔹 [cyan]'a'[/cyan] or [cyan]'analyze'[/cyan] - Start analysis")
+            yield Text("🔹 [cyan]'c'[/cyan] or [cyan]'scan'[/cyan] - Scan all weapons")
             yield Text("🔹 [cyan]'s'[/cyan] or [cyan]'settings'[/cyan] - Open settings")
             yield Text("🔹 [cyan]'h'[/cyan] or [cyan]'help'[/cyan] - View help")
             yield Text("🔹 [cyan]'i'[/cyan] or [cyan]'about'[/cyan] - View info")
@@ -871,6 +901,7 @@ class ConsoleUI:
             # Map single letters to full commands
             choice_map = {
                 'a': 'analyze',
+                'c': 'scan',
                 's': 'settings',
                 'h': 'help',
                 'i': 'about',
@@ -881,7 +912,7 @@ class ConsoleUI:
             if choice in choice_map:
                 choice = choice_map[choice]
             
-            if choice in ['analyze', 'settings', 'help', 'about', 'exit']:
+            if choice in ['analyze', 'scan', 'settings', 'help', 'about', 'exit']:
                 return choice
             else:
                 self.console.print("[red]❌ Invalid choice. Please try again.[/red]")
@@ -913,6 +944,7 @@ class ConsoleUI:
                 self.config['analysis']['price_limits']['min_price_usd'] = options['min_price']
                 self.config['analysis']['price_limits']['max_price_usd'] = options['max_price']
                 self.config['performance']['limits']['max_pages_per_request'] = options['page_limit']
+                self.scraper.set_price_window(options['min_price'], options['max_price'])
                 
                 # Clear the console before starting analysis
                 self.console.clear()
@@ -922,16 +954,27 @@ class ConsoleUI:
                 
                 try:
                     with self.console.status(f"[cyan]Analyzing {self.scraper.items_dict[weapon]}...[/cyan]") as status:
-                        items = list(self.scraper.get_items(weapon))
+                        scraped = {'count': 0, 'total': 0.0}
+                        min_cents = round(options['min_price'] * 100)
+                        max_cents = round(options['max_price'] * 100)
                         
-                        # Filter items by price
-                        items = [item for item in items 
-                                if options['min_price'] <= float(item['price'].replace('$', '').replace(',', '')) <= options['max_price']]
+                        def stream_items():
+                            """Filter listings by price as they are scraped and keep the status line live."""
+                            for item in self.scraper.get_recorded_items(weapon, options['resume']):
+                                if not min_cents <= item.price_cents <= max_cents:
+                                    continue
+                                scraped['count'] += 1
+                                scraped['total'] += item.price
+                                status.update(
+                                    f"[cyan]Analyzing {weapon.upper()}... {scraped['count']} items, "
+                                    f"avg ${scraped['total'] / scraped['count']:.2f}[/cyan]"
+                                )
+                                yield item
                         
                         if analysis_type == 'market':
-                            self.display_results(items)
+                            self.display_results(list(stream_items()))
                         else:  # trade-up
-                            opportunities = self.calculator.find_trade_up_opportunities(items)
+                            opportunities = self.calculator.find_trade_up_opportunities(stream_items())
                             self.display_trade_up_opportunities(opportunities)
                 except Exception as e:
                     self.logger.error(f"Analysis failed: {str(e)}")
@@ -950,6 +993,53 @@ class ConsoleUI:
                 if not Prompt.ask("\nContinue?", choices=['y', 'n']) == 'y':
                     break
 
+    def run_batch_scan(self):
+        """Scrape every weapon in parallel and show a per-weapon status summary."""
+        from batch_scan import scan_all
+        
+        weapons = list(self.scraper.items_dict.keys())
+        if not Confirm.ask(f"\n[cyan]Scan all {len(weapons)} weapons now?[/cyan]", default=True):
+            return
+        resume = Confirm.ask("[cyan]Skip weapons already completed by an earlier scan?[/cyan]", default=True)
+        
+        self.console.clear()
+        completed = []
+        with self.console.status(f"[cyan]Scanning {len(weapons)} weapons...[/cyan]") as status:
+            def on_result(result):
+                completed.append(result)
+                status.update(f"[cyan]Scanning weapons... ({len(completed)}/{len(weapons)}, last: {result.weapon})[/cyan]")
+            
+            results = scan_all(self.config, weapons, on_result=on_result, resume=resume)
+        
+        table = Table(
+            title="[bold cyan]📦 Batch Scan Summary[/bold cyan]",
+            box=DOUBLE,
+            border_style="cyan",
+            header_style="bold cyan",
+            padding=(0, 1)
+        )
+        table.add_column("Weapon", style="bright_white")
+        table.add_column("Status", justify="center")
+        table.add_column("Items", justify="right", style="green")
+        table.add_column("Time", justify="right", style="bright_blue")
+        table.add_column("Error", style="red")
+        
+        status_styles = {"ok": "[green]✓ ok[/green]", "empty": "[yellow]∅ empty[/yellow]", "failed": "[red]✗ failed[/red]",
+                         "skipped": "[blue]↷ skipped[/blue]"}
+        for result in results:
+            table.add_row(
+                result.weapon,
+                status_styles.get(result.status, result.status),
+                str(result.items),
+                f"{result.seconds:.1f}s",
+                result.error or ""
+            )
+        
+        self.items_analyzed += sum(result.items for result in results)
+        self.console.print()
+        self.console.print(table)
+        self.console.print()
+
     def show_settings(self):
         """Show settings menu."""
         settings_panel = Panel(
@@ -0,0 +1,188 @@
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPoolException(Exception):
+    """Raised when no healthy browser can be leased from the pool."""
+    pass
+
+
+class _PooledDriver:
+    __slots__ = ("driver", "uses")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """Pool of pre-launched browsers that are leased to scraper calls.
+
+    Drivers are health-checked before every lease and recycled (quit and
+    relaunched) after `max_uses` leases or when a failed lease leaves them unhealthy.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 1, max_uses: int = 50,
+                 lease_timeout: float = 120.0):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+
+        self.recycled = 0
+        self._idle: "queue.Queue[_PooledDriver]" = queue.Queue()
+        # Running lease wait totals (a list would grow for the whole of a long batch scan)
+        self._leases = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._alive = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], factory: Callable[[], Any]) -> "DriverPool":
+        """Create a pool from the scraping.browser.pool settings."""
+        settings = config['scraping']['browser']['pool']
+        return cls(
+            factory=factory,
+            size=settings['size'],
+            max_uses=settings['max_uses'],
+            lease_timeout=settings['lease_timeout_seconds']
+        )
+
+    def start(self):
+        """Launch every browser in the background so the first leases find them warm."""
+        for _ in range(self.size):
+            self._launch_async()
+
+    def _launch_async(self):
+        """Launch one more browser in the background unless the pool is full."""
+        with self._lock:
+            if self._closed or self._alive >= self.size:
+                return
+            self._alive += 1
+        threading.Thread(target=self._launch, name="driver-pool-launch", daemon=True).start()
+
+    def _launch(self):
+        try:
+            started = time.monotonic()
+            driver = self.factory()
+            logger.info(f"Launched pooled browser in {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            logger.error(f"Failed to launch pooled browser: {str(e)}")
+            with self._lock:
+                self._alive -= 1
+            return
+
+        # The pool may have been closed while the browser was starting
+        with self._lock:
+            closed = self._closed
+            if closed:
+                self._alive -= 1
+            else:
+                self._idle.put(_PooledDriver(driver))
+        if closed:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Driver quit error (safe to ignore): {str(e)}")
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _recycle(self, pooled: _PooledDriver, reason: str):
+        logger.info(f"Recycling pooled browser ({reason})")
+        self.recycled += 1
+        self._quit(pooled.driver)
+        with self._lock:
+            self._alive -= 1
+        self._launch_async()
+
+    def _take(self) -> _PooledDriver:
+        """Wait for a healthy idle driver, recycling any that fail the health check."""
+        deadline = time.monotonic() + self.lease_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DriverPoolException(f"No browser available after {self.lease_timeout}s")
+            # Replaces browsers whose launch failed (no-op while the pool is full)
+            self._launch_async()
+            try:
+                pooled = self._idle.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                continue
+            if self._is_healthy(pooled.driver):
+                return pooled
+            self._recycle(pooled, "failed health check")
+
+    @contextmanager
+    def lease(self):
+        """Lease a browser for the duration of a `with` block."""
+        if self._closed:
+            raise DriverPoolException("Driver pool is closed")
+
+        started = time.monotonic()
+        pooled = self._take()
+        wait = time.monotonic() - started
+        with self._lock:
+            self._leases += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        logger.debug(f"Leased pooled browser after waiting {wait:.2f}s")
+
+        failed = False
+        try:
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            pooled.uses += 1
+            if self._closed:
+                self._quit(pooled.driver)
+                with self._lock:
+                    self._alive -= 1
+            elif failed and not self._is_healthy(pooled.driver):
+                self._recycle(pooled, "lease failed")
+            elif pooled.uses >= self.max_uses:
+                self._recycle(pooled, f"reached {self.max_uses} uses")
+            else:
+                self._idle.put(pooled)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get lease wait times and recycle counts."""
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "leases": self._leases,
+            "mean_wait_seconds": self._wait_total / self._leases if self._leases else 0.0,
+            "max_wait_seconds": self._wait_max,
+            "recycled": self.recycled
+        }
+
+    def close(self):
+        """Quit every idle browser; leased ones are quit when returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(pooled.driver)
+            with self._lock:
+                self._alive -= 1
@@ -0,0 +1,43 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Generator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class ConcurrentFetcher:
+    """Run fetch jobs on a thread pool while yielding results in input order."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, int(max_workers))
+
+    def map_ordered(self, fn: Callable[[T], R], items: Iterable[T]) -> Generator[R, None, None]:
+        """Apply `fn` to every item with up to `max_workers` calls in flight.
+
+        Results are yielded in the order of `items`. Closing the generator early
+        cancels every job that has not started yet.
+        """
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch")
+        pending = deque()
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= self.max_workers:
+                    break
+
+            while pending:
+                future = pending.popleft()
+                result = future.result()
+                for item in iterator:
+                    pending.append(pool.submit(fn, item))
+                    break
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True, cancel_futures=True)
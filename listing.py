@@ -0,0 +1,115 @@
+import re
+import sys
+from enum import IntEnum
+from typing import Dict, Any, Optional
+
+# Stored for prices that could not be parsed
+NO_PRICE = -1
+
+# Bits of packed StatTrak/Souvenir flags (columnar storage and ListingTable)
+FLAG_STAT = 1
+FLAG_SOUV = 2
+
+PRICE_PATTERN = re.compile(r'[\d,]+(?:\.\d+)?')
+
+
+def price_to_cents(price: str) -> int:
+    """Convert price text such as '$1,234.56' to integer cents."""
+    match = PRICE_PATTERN.search(price or "")
+    if not match:
+        return NO_PRICE
+    whole, _, fraction = match.group(0).replace(',', '').partition('.')
+    return int(whole or 0) * 100 + int((fraction + "00")[:2])
+
+
+def cents_to_price(cents: int) -> str:
+    """Format integer cents the way listing prices are scraped ('$1,234.56')."""
+    if cents == NO_PRICE:
+        return ""
+    return f"${cents // 100:,}.{cents % 100:02d}"
+
+
+WEAR_LABELS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+
+
+class Wear(IntEnum):
+    """Exterior condition, ordered from best to worst float."""
+    FACTORY_NEW = 0
+    MINIMAL_WEAR = 1
+    FIELD_TESTED = 2
+    WELL_WORN = 3
+    BATTLE_SCARRED = 4
+
+    @property
+    def label(self) -> str:
+        """Market name of the wear, e.g. 'Field-Tested'."""
+        return WEAR_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: Optional[str]) -> Optional["Wear"]:
+        """Parse a market wear name; None for missing or unknown wears (e.g. vanilla knives)."""
+        return _WEAR_BY_LABEL.get(label)
+
+
+_WEAR_BY_LABEL = {label: Wear(code) for code, label in enumerate(WEAR_LABELS)}
+
+
+class Listing:
+    """One normalized market listing, built once at ingest.
+
+    Prices are integer cents, the wear is a `Wear` code and names are interned
+    so the many listings of one skin share a single string.
+    """
+
+    __slots__ = ("name", "price_cents", "wear", "stat", "souv", "timestamp")
+
+    def __init__(self, name: str, price_cents: int, wear: Optional[Wear], stat: bool, souv: bool, timestamp: str):
+        self.name = sys.intern(name)
+        self.price_cents = price_cents
+        self.wear = wear
+        self.stat = stat
+        self.souv = souv
+        self.timestamp = timestamp
+
+    @property
+    def price(self) -> float:
+        """Price in dollars."""
+        return self.price_cents / 100
+
+    @property
+    def price_text(self) -> str:
+        return cents_to_price(self.price_cents)
+
+    @property
+    def wear_label(self) -> Optional[str]:
+        return self.wear.label if self.wear is not None else None
+
+    @property
+    def flags(self) -> int:
+        return (FLAG_STAT if self.stat else 0) | (FLAG_SOUV if self.souv else 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the saved-data form (price text, wear name)."""
+        return {
+            "name": self.name,
+            "price": self.price_text,
+            "stat": self.stat,
+            "souv": self.souv,
+            "wear": self.wear_label,
+            "timestamp": self.timestamp
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Listing":
+        """Load a listing saved with `to_dict`."""
+        return cls(
+            data['name'],
+            price_to_cents(data['price']),
+            Wear.from_label(data['wear']),
+            data['stat'],
+            data['souv'],
+            data['timestamp']
+        )
+
+    def __repr__(self) -> str:
+        return f"Listing({self.name!r}, {self.price_text!r}, {self.wear_label!r}, stat={self.stat}, souv={self.souv})"
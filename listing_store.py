@@ -0,0 +1,188 @@
+import os
+import gzip
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from listing import Listing, Wear, FLAG_STAT, FLAG_SOUV
+
+logger = logging.getLogger(__name__)
+
+FILE_FORMATS = ("json", "npz")
+
+
+def listing_dtype():
+    """Row layout of the columnar format: dictionary codes, packed flags, cents."""
+    return np.dtype([
+        ("name", np.uint32),
+        ("wear", np.uint8),
+        ("flags", np.uint8),
+        ("price_cents", np.int64),
+        ("timestamp", "datetime64[us]")
+    ])
+
+
+def encode_listings(listings: Iterable[Listing]) -> Dict[str, Any]:
+    """Encode listings into a structured array plus name and wear dictionaries."""
+    names: Dict[str, int] = {}
+    wears: Dict[str, int] = {"": 0}  # code 0 is "no wear" (e.g. vanilla knives)
+    rows = []
+    for item in listings:
+        name_code = names.setdefault(item.name, len(names))
+        wear_code = wears.setdefault(item.wear_label or "", len(wears))
+        rows.append((name_code, wear_code, item.flags, item.price_cents, item.timestamp))
+
+    return {
+        "listings": np.array(rows, dtype=listing_dtype()),
+        "names": np.array(list(names), dtype=str),
+        "wears": np.array(list(wears), dtype=str)
+    }
+
+
+def decode_listings(listings, names, wears) -> List[Listing]:
+    """Turn the columnar arrays back into listings."""
+    name_list = names.tolist()
+    wear_list = [Wear.from_label(wear) for wear in wears.tolist()]
+    timestamps = np.datetime_as_string(listings["timestamp"], unit="us").tolist()
+    return [
+        Listing(name_list[name], cents, wear_list[wear], bool(flags & FLAG_STAT), bool(flags & FLAG_SOUV), timestamp)
+        for name, wear, flags, cents, timestamp in zip(
+            listings["name"].tolist(), listings["wear"].tolist(), listings["flags"].tolist(),
+            listings["price_cents"].tolist(), timestamps
+        )
+    ]
+
+
+class ListingStore:
+    """Saves and loads scraped listings per weapon in the configured file format.
+
+    `json` keeps the original pretty-printed list of dicts (gzip-compressed when
+    `compression` is on). `npz` stores a NumPy structured array with prices as
+    integer cents, StatTrak/Souvenir packed into one flags byte and names and
+    wears dictionary-encoded (zip-deflated when `compression` is on).
+    """
+
+    def __init__(self, data_dir: Path, file_format: str = "json", compression: bool = False):
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Unknown data file format {file_format!r} (expected one of {FILE_FORMATS})")
+        if file_format == "npz" and np is None:
+            raise ImportError("numpy is required for the npz data file format")
+        self.data_dir = Path(data_dir)
+        self.file_format = file_format
+        self.compression = compression
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], data_dir: Optional[Path] = None) -> "ListingStore":
+        """Create a store from the scraping.data_management settings."""
+        settings = config['scraping']['data_management']
+        return cls(
+            data_dir=data_dir or Path(settings['data_directory']),
+            file_format=settings.get('file_format', 'json'),
+            compression=settings.get('compression', False)
+        )
+
+    def path_for(self, weapon: str) -> Path:
+        suffix = ".npz" if self.file_format == "npz" else (".json.gz" if self.compression else ".json")
+        return self.data_dir / f"{weapon}{suffix}"
+
+    def save(self, weapon: str, listings: Iterable[Listing]) -> int:
+        """Save a weapon's listings, replacing the previous file only once writing succeeds.
+
+        `listings` may be a generator; JSON output is streamed as items arrive.
+        """
+        file_path = self.path_for(weapon)
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            if self.file_format == "npz":
+                count = self._save_npz(tmp_path, listings)
+            else:
+                count = self._save_json(tmp_path, listings)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"Saved {count} items for {weapon} to {file_path}")
+        return count
+
+    def _save_json(self, path: Path, listings: Iterable[Listing]) -> int:
+        count = 0
+        opener = gzip.open if self.compression else open
+        with opener(path, 'wt') as f:
+            f.write("[")
+            for item in listings:
+                f.write(",\n    " if count else "\n    ")
+                f.write(json.dumps(item.to_dict(), indent=4).replace("\n", "\n    "))
+                count += 1
+            f.write("\n]" if count else "]")
+        return count
+
+    def _save_npz(self, path: Path, listings: Iterable[Listing]) -> int:
+        arrays = encode_listings(listings)
+        save = np.savez_compressed if self.compression else np.savez
+        with open(path, 'wb') as f:
+            save(f, **arrays)
+        return len(arrays["listings"])
+
+    def load(self, weapon: str) -> List[Listing]:
+        """Load a weapon's listings (empty list if nothing was saved)."""
+        file_path = self.path_for(weapon)
+        if not file_path.exists():
+            return []
+        if self.file_format == "npz":
+            with np.load(file_path) as data:
+                return decode_listings(data["listings"], data["names"], data["wears"])
+        opener = gzip.open if self.compression else open
+        with opener(file_path, 'rt') as f:
+            return [Listing.from_dict(item) for item in json.load(f)]
+
+
+def benchmark(listings: List[Listing], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Time save and load of the same listings in every format, and compare file sizes."""
+    formats = [("json", False), ("json", True)]
+    if np is not None:
+        formats += [("npz", False), ("npz", True)]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_format, compression in formats:
+            store = ListingStore(Path(tmp_dir), file_format, compression)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                store.save("bench", listings)
+            save_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                store.load("bench")
+            load_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            label = f"{file_format}{' (compressed)' if compression else ''}"
+            results[label] = {
+                "save_ms": save_ms,
+                "load_ms": load_ms,
+                "size_kb": store.path_for("bench").stat().st_size / 1024
+            }
+    return results
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark listing storage formats on a saved weapon file.")
+    arg_parser.add_argument("data_file", type=Path, help="Saved weapon listings (.json)")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Save and load each format this many times")
+    args = arg_parser.parse_args()
+
+    with open(args.data_file, 'r') as f:
+        sample = [Listing.from_dict(item) for item in json.load(f)]
+    print(f"{len(sample)} listings")
+    for name, timings in benchmark(sample, args.repeat).items():
+        print(f"{name:<20} save {timings['save_ms']:8.2f} ms  load {timings['load_ms']:8.2f} ms  "
+              f"{timings['size_kb']:10.1f} KB")
@@ -0,0 +1,205 @@
+import random
+import datetime
+import argparse
+import tracemalloc
+from array import array
+from typing import List, Dict, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from listing import Listing, Wear, FLAG_STAT, FLAG_SOUV
+
+# Timestamps are stored as microseconds since this (naive, wall-clock) epoch
+EPOCH = datetime.datetime(1970, 1, 1)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+# Column name -> array typecode
+COLUMNS = {
+    "name_id": "I",
+    "price_cents": "q",
+    "wear": "b",  # Wear code, -1 for no wear
+    "flags": "B",  # FLAG_STAT | FLAG_SOUV
+    "timestamp_us": "q"
+}
+
+
+class _ColumnStore:
+    """Parallel typed arrays shared by a table and all of its views."""
+
+    __slots__ = ("columns", "names", "name_ids")
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        self.names: List[str] = []
+        self.name_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["price_cents"])
+
+    def append(self, listing: Listing):
+        name_id = self.name_ids.get(listing.name)
+        if name_id is None:
+            name_id = self.name_ids[listing.name] = len(self.names)
+            self.names.append(listing.name)
+        timestamp = datetime.datetime.fromisoformat(listing.timestamp)
+        self.columns["name_id"].append(name_id)
+        self.columns["price_cents"].append(listing.price_cents)
+        self.columns["wear"].append(-1 if listing.wear is None else listing.wear)
+        self.columns["flags"].append(listing.flags)
+        self.columns["timestamp_us"].append((timestamp - EPOCH) // MICROSECOND)
+
+    def row(self, index: int) -> Listing:
+        columns = self.columns
+        wear = columns["wear"][index]
+        flags = columns["flags"][index]
+        return Listing(
+            self.names[columns["name_id"][index]],
+            columns["price_cents"][index],
+            Wear(wear) if wear >= 0 else None,
+            bool(flags & FLAG_STAT),
+            bool(flags & FLAG_SOUV),
+            (EPOCH + columns["timestamp_us"][index] * MICROSECOND).isoformat()
+        )
+
+
+class ListingTable:
+    """Listings stored column-wise: price cents, wear code, flags and name id.
+
+    Single rows come back as slotted `Listing` records; bulk work reads whole
+    columns as NumPy arrays that share memory with the table. Slicing and
+    filtering return views over the same columns (a slice or an index array
+    of row numbers) without copying listing data. Appending is only allowed on
+    the full table, and not while a column array from it is still alive.
+    """
+
+    __slots__ = ("_store", "_rows")
+
+    def __init__(self, listings: Iterable[Listing] = (), _store: Optional[_ColumnStore] = None,
+                 _rows: Union[None, slice, np.ndarray] = None):
+        self._store = _store if _store is not None else _ColumnStore()
+        self._rows = _rows
+        for listing in listings:
+            self.append(listing)
+
+    def append(self, listing: Listing):
+        if self._rows is not None:
+            raise TypeError("Cannot append to a slice or filtered view of a ListingTable")
+        self._store.append(listing)
+
+    def extend(self, listings: Iterable[Listing]):
+        for listing in listings:
+            self.append(listing)
+
+    def __len__(self) -> int:
+        if self._rows is None:
+            return len(self._store)
+        if isinstance(self._rows, slice):
+            return len(range(*self._rows.indices(len(self._store))))
+        return len(self._rows)
+
+    def _row_range(self) -> range:
+        return range(len(self._store))[self._rows or slice(None)]
+
+    def row_ids(self) -> np.ndarray:
+        """Row numbers of this view in the underlying columns."""
+        if isinstance(self._rows, np.ndarray):
+            return self._rows
+        rows = self._row_range()
+        return np.arange(rows.start, rows.stop, rows.step, dtype=np.int64)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if isinstance(self._rows, np.ndarray):
+                return ListingTable(_store=self._store, _rows=self._rows[key])
+            rows = self._row_range()[key]
+            if not rows:
+                # An empty reversed range can end at -1, which as a slice bound means "the last row"
+                return ListingTable(_store=self._store, _rows=slice(0, 0))
+            stop = rows.stop if rows.stop >= 0 else None
+            return ListingTable(_store=self._store, _rows=slice(rows.start, stop, rows.step))
+        if isinstance(self._rows, np.ndarray):
+            return self._store.row(int(self._rows[key]))
+        return self._store.row(self._row_range()[key])
+
+    def __iter__(self) -> Iterator[Listing]:
+        rows = self._rows if isinstance(self._rows, np.ndarray) else self._row_range()
+        for index in rows:
+            yield self._store.row(int(index))
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one column for this view (a view of the table's memory unless filtered)."""
+        values = np.frombuffer(self._store.columns[name], dtype=COLUMNS[name])
+        if self._rows is None:
+            return values
+        return values[self._rows]
+
+    @property
+    def price_cents(self) -> np.ndarray:
+        return self.column("price_cents")
+
+    @property
+    def wear_codes(self) -> np.ndarray:
+        return self.column("wear")
+
+    @property
+    def flags(self) -> np.ndarray:
+        return self.column("flags")
+
+    @property
+    def name_ids(self) -> np.ndarray:
+        return self.column("name_id")
+
+    @property
+    def names(self) -> List[str]:
+        """Name dictionary indexed by `name_ids`."""
+        return self._store.names
+
+    def name_id(self, name: str) -> Optional[int]:
+        return self._store.name_ids.get(name)
+
+    def filter(self, mask) -> "ListingTable":
+        """Rows where a boolean mask (aligned with this view) is true, as a view."""
+        return ListingTable(_store=self._store, _rows=self.row_ids()[np.asarray(mask, dtype=bool)])
+
+    def take(self, indexes) -> "ListingTable":
+        """Rows at the given positions of this view, as a view."""
+        return ListingTable(_store=self._store, _rows=self.row_ids()[np.asarray(indexes, dtype=np.int64)])
+
+
+def _iter_sample_listings(count: int) -> Iterator[Listing]:
+    """Synthetic listings with a realistic number of distinct skins."""
+    rng = random.Random(0)
+    now = datetime.datetime.now()
+    skins = [f"AK-47 | Skin {index}" for index in range(400)]
+    wears = list(Wear)
+    for index in range(count):
+        yield Listing(rng.choice(skins), rng.randint(3, 50000), rng.choice(wears), rng.random() < 0.1,
+                      rng.random() < 0.05, (now + datetime.timedelta(seconds=index)).isoformat())
+
+
+def _retained_bytes(build) -> int:
+    """Memory still allocated by what `build` returns."""
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def memory_comparison(count: int = 100_000) -> Dict[str, float]:
+    """Memory (MB) of `count` listings as dicts, as Listing records and as a ListingTable."""
+    return {
+        "list of dicts": _retained_bytes(lambda: [item.to_dict() for item in _iter_sample_listings(count)]) / 2 ** 20,
+        "list of Listing": _retained_bytes(lambda: list(_iter_sample_listings(count))) / 2 ** 20,
+        "ListingTable": _retained_bytes(lambda: ListingTable(_iter_sample_listings(count))) / 2 ** 20
+    }
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare listing memory usage across representations.")
+    arg_parser.add_argument("--count", type=int, default=100_000, help="Number of listings")
+    args = arg_parser.parse_args()
+
+    for representation, megabytes in memory_comparison(args.count).items():
+        print(f"{representation:<18} {megabytes:8.2f} MB")
@@ -1,6 +1,7 @@
 import json
 import logging
 import logging.config
+import argparse
 import sys
 from pathlib import Path
 from console_ui import ConsoleUI
@@ -45,8 +46,34 @@ def load_config():
         print(f"Error: Invalid JSON in config.json: {str(e)}")
         sys.exit(1)
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Find profitable CS2 trade-up contracts.")
+    parser.add_argument('--benchmark-blocking', metavar='WEAPON',
+                        help="compare page-load latency and Chrome memory with resource blocking off and on")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="page loads per benchmark configuration (default: 3)")
+    return parser.parse_args()
+
+def run_blocking_benchmark(config, weapon: str, runs: int):
+    """Run the resource blocking benchmark and print the results."""
+    from scraper import Scraper
+    from temp import items_dict
+    
+    scraper = Scraper(config['scraping']['steam_market']['base_url'], items_dict)
+    try:
+        results = scraper.benchmark_resource_blocking(weapon, runs)
+    finally:
+        scraper.cleanup()
+    
+    for label, result in results.items():
+        print(f"{label:<14} load {result['mean_load_seconds']:.2f}s "
+              f"(min {result['min_load_seconds']:.2f}s), Chrome RSS {result['rss_mb']:.0f} MB")
+
 def main():
     try:
+        args = parse_args()
+        
         # Load configuration
         config = load_config()
         
@@ -54,6 +81,10 @@ def main():
         setup_logging(config)
         logger = logging.getLogger(__name__)
         
+        if args.benchmark_blocking:
+            run_blocking_benchmark(config, args.benchmark_blocking, args.runs)
+            return
+        
         try:
             # Initialize and run console UI
             ui = ConsoleUI(config)
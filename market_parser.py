@@ -0,0 +1,189 @@
+import time
+import logging
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import mean
+from typing import List, Tuple, Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+# Selectors shared with the Selenium extraction path in scraper.py
+ROW_CLASS = "market_listing_row_link"
+NAME_CLASS = "market_listing_item_name"
+PRICE_CLASS = "market_listing_price_with_fee"
+PAGE_LINK_CLASS = "market_paging_pagelink"
+
+ROWS_MARKER = 'id="searchResultsRows"'
+PAGING_MARKER = 'id="searchResults_links"'
+
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+
+@dataclass
+class ParsedPage:
+    """Listing rows and pagination extracted from a market results page."""
+    rows: List[Tuple[str, str]]
+    last_page: int
+
+
+def _backend_available(backend: str) -> bool:
+    """Check whether the library behind a parser backend can be imported."""
+    try:
+        if backend == "selectolax":
+            import selectolax.parser  # noqa: F401
+        elif backend == "lxml":
+            import lxml.html  # noqa: F401
+        else:
+            import bs4  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> List[str]:
+    """Get the parser backends that can be used in this environment."""
+    return [backend for backend in BACKENDS if _backend_available(backend)]
+
+
+def _slice_region(html: str, marker: str) -> Optional[str]:
+    """Cut the element carrying `marker` (and what follows it) out of the page.
+
+    The slice starts at the opening tag containing the marker and runs up to the
+    next top-level pagination block, so only the region we need gets parsed.
+    """
+    index = html.find(marker)
+    if index == -1:
+        return None
+    start = html.rfind("<", 0, index)
+    end = html.find(PAGING_MARKER, index) if marker != PAGING_MARKER else -1
+    if end == -1:
+        end = len(html)
+    else:
+        end = html.rfind("<", index, end)
+    return html[start:end]
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class MarketPageParser:
+    """Parse market results pages with the fastest available HTML backend."""
+
+    def __init__(self, backend: str = "auto"):
+        if backend == "auto":
+            backend = next(iter(available_backends()), "html.parser")
+        elif backend not in BACKENDS or not _backend_available(backend):
+            logger.warning(f"HTML parser backend '{backend}' unavailable, falling back to html.parser")
+            backend = "html.parser"
+        self.backend = backend
+        self._parse_rows = getattr(self, f"_rows_{backend.replace('.', '_')}")
+        self._parse_page_links = getattr(self, f"_page_links_{backend.replace('.', '_')}")
+
+    def parse(self, html: str) -> ParsedPage:
+        """Parse listing rows and the last page number from a results page."""
+        return ParsedPage(rows=self.parse_rows(html), last_page=self.parse_last_page(html))
+
+    def parse_rows(self, html: str) -> List[Tuple[str, str]]:
+        """Get (name, price-with-fee) text for every listing row."""
+        region = _slice_region(html, ROWS_MARKER)
+        return self._parse_rows(region if region is not None else html)
+
+    def parse_last_page(self, html: str) -> int:
+        """Get the last page number from the pagination links (1 if there are none)."""
+        region = _slice_region(html, PAGING_MARKER)
+        links = self._parse_page_links(region if region is not None else html)
+        numbers = [int(text) for text in links if text.isdigit()]
+        return numbers[-1] if numbers else 1
+
+    # selectolax backend
+    def _rows_selectolax(self, html: str) -> List[Tuple[str, str]]:
+        from selectolax.parser import HTMLParser
+        rows = []
+        for row in HTMLParser(html).css(f"div.{ROW_CLASS}"):
+            name = row.css_first(f"span.{NAME_CLASS}")
+            price = row.css_first(f"span.{PRICE_CLASS}")
+            rows.append((
+                name.text(strip=True) if name else "",
+                price.text(strip=True) if price else ""
+            ))
+        return rows
+
+    def _page_links_selectolax(self, html: str) -> List[str]:
+        from selectolax.parser import HTMLParser
+        return [node.text(strip=True) for node in HTMLParser(html).css(f"span.{PAGE_LINK_CLASS}")]
+
+    # lxml backend
+    def _rows_lxml(self, html: str) -> List[Tuple[str, str]]:
+        import lxml.html
+        rows = []
+        for row in lxml.html.fromstring(html).xpath(_class_xpath("div", ROW_CLASS)):
+            name = row.xpath(_class_xpath("span", NAME_CLASS))
+            price = row.xpath(_class_xpath("span", PRICE_CLASS))
+            rows.append((
+                name[0].text_content().strip() if name else "",
+                price[0].text_content().strip() if price else ""
+            ))
+        return rows
+
+    def _page_links_lxml(self, html: str) -> List[str]:
+        import lxml.html
+        root = lxml.html.fromstring(html)
+        return [node.text_content().strip() for node in root.xpath(_class_xpath("span", PAGE_LINK_CLASS))]
+
+    # BeautifulSoup html.parser backend (always available with the base requirements)
+    def _rows_html_parser(self, html: str) -> List[Tuple[str, str]]:
+        import bs4
+        rows = []
+        for row in bs4.BeautifulSoup(html, "html.parser").find_all("div", class_=ROW_CLASS):
+            name = row.find("span", class_=NAME_CLASS)
+            price = row.find("span", class_=PRICE_CLASS)
+            rows.append((
+                name.get_text().strip() if name else "",
+                price.get_text().strip() if price else ""
+            ))
+        return rows
+
+    def _page_links_html_parser(self, html: str) -> List[str]:
+        import bs4
+        soup = bs4.BeautifulSoup(html, "html.parser")
+        return [node.get_text().strip() for node in soup.find_all("span", class_=PAGE_LINK_CLASS)]
+
+
+def benchmark(pages: List[Path], repeat: int = 5) -> Dict[str, float]:
+    """Measure mean per-page parse time (ms) for each available backend.
+
+    The baseline entry parses the whole document with BeautifulSoup, as the
+    scraper did before the row-scoped parsers existed.
+    """
+    documents = [page.read_text(encoding="utf-8") for page in pages]
+    results = {}
+
+    def run(parse) -> float:
+        timings = []
+        for _ in range(repeat):
+            for html in documents:
+                start = time.perf_counter()
+                parse(html)
+                timings.append(time.perf_counter() - start)
+        return mean(timings) * 1000
+
+    if _backend_available("html.parser"):
+        import bs4
+        results["html.parser (full document)"] = run(lambda html: bs4.BeautifulSoup(html, "html.parser"))
+
+    for backend in available_backends():
+        results[backend] = run(MarketPageParser(backend).parse)
+
+    return results
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on saved market pages.")
+    arg_parser.add_argument("pages", nargs="+", type=Path, help="Saved market results pages (.html)")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Parse each page this many times")
+    args = arg_parser.parse_args()
+
+    for name, ms in benchmark(args.pages, args.repeat).items():
+        print(f"{name:<30} {ms:8.2f} ms/page")
@@ -0,0 +1,268 @@
+import sqlite3
+import statistics
+import logging
+import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from listing import Listing, Wear
+
+logger = logging.getLogger(__name__)
+
+Timestamp = Union[datetime.datetime, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrapes (
+    id INTEGER PRIMARY KEY,
+    weapon TEXT NOT NULL,
+    started_ms INTEGER NOT NULL,
+    listing_count INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS listings (
+    scrape_id INTEGER NOT NULL REFERENCES scrapes(id),
+    item TEXT NOT NULL,
+    wear TEXT NOT NULL,
+    stat INTEGER NOT NULL,
+    souv INTEGER NOT NULL,
+    timestamp_ms INTEGER NOT NULL,
+    price_cents INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_series ON listings (item, wear, stat, souv, timestamp_ms);
+CREATE INDEX IF NOT EXISTS idx_listings_scrape ON listings (scrape_id);
+CREATE INDEX IF NOT EXISTS idx_scrapes_weapon ON scrapes (weapon, completed, started_ms);
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,
+    item TEXT NOT NULL,
+    wear TEXT NOT NULL,
+    stat INTEGER NOT NULL,
+    souv INTEGER NOT NULL,
+    bucket_ms INTEGER NOT NULL,
+    open INTEGER NOT NULL,
+    high INTEGER NOT NULL,
+    low INTEGER NOT NULL,
+    close INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    median REAL NOT NULL,
+    PRIMARY KEY (period, item, wear, stat, souv, bucket_ms)
+) WITHOUT ROWID;
+"""
+
+# Rollup bucket widths (UTC-aligned)
+ROLLUP_PERIODS = {
+    "hour": 3600 * 1000,
+    "day": 24 * 3600 * 1000
+}
+
+
+def to_ms(timestamp: Timestamp) -> int:
+    """Convert a datetime or ISO timestamp to epoch milliseconds."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.datetime.fromisoformat(timestamp)
+    return int(timestamp.timestamp() * 1000)
+
+
+def from_ms(timestamp_ms: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp_ms / 1000)
+
+
+class PriceHistory:
+    """Append-only SQLite history of every scraped listing.
+
+    Each save of a weapon is one scrape; its listings are inserted in batches
+    (one short transaction per batch, so parallel batch-scan workers don't hold
+    the write lock for a whole scrape) and the scrape is marked completed at the
+    end. Snapshots only consider completed scrapes; price series include every
+    recorded observation. Hourly and daily OHLC rollups per item variant are
+    updated as each scrape completes, so trend lookups are one index probe.
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = 500, enabled: bool = True):
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], data_dir: Path) -> "PriceHistory":
+        """Create a history store from the data_management.history settings."""
+        settings = config['scraping']['data_management']['history']
+        return cls(
+            db_path=Path(data_dir) / settings['database'],
+            batch_size=settings['batch_size'],
+            enabled=settings['enabled']
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode; transactions are opened explicitly per batch
+            self._conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _insert_batch(self, scrape_id: int, rows: List[Tuple]):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(
+                "INSERT INTO listings (scrape_id, item, wear, stat, souv, timestamp_ms, price_cents) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.execute("UPDATE scrapes SET listing_count = listing_count + ? WHERE id = ?",
+                              (len(rows), scrape_id))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def record(self, weapon: str, listings: Iterable[Listing]) -> Iterator[Listing]:
+        """Pass listings through unchanged while appending them to the history.
+
+        The scrape is only marked completed if the stream is consumed to the end.
+        """
+        if not self.enabled:
+            yield from listings
+            return
+
+        started_ms = to_ms(datetime.datetime.now())
+        scrape_id = self.conn.execute(
+            "INSERT INTO scrapes (weapon, started_ms) VALUES (?, ?)", (weapon, started_ms)
+        ).lastrowid
+
+        rows = []
+        for item in listings:
+            if item.price_cents >= 0:
+                rows.append((scrape_id, item.name, item.wear_label or "", int(item.stat), int(item.souv),
+                             to_ms(item.timestamp), item.price_cents))
+            if len(rows) >= self.batch_size:
+                self._insert_batch(scrape_id, rows)
+                rows = []
+            yield item
+        if rows:
+            self._insert_batch(scrape_id, rows)
+        self.conn.execute("UPDATE scrapes SET completed = 1 WHERE id = ?", (scrape_id,))
+        self.update_rollups(scrape_id)
+        logger.debug(f"Recorded scrape {scrape_id} of {weapon} in price history")
+
+    def update_rollups(self, scrape_id: int):
+        """Recompute the hourly and daily OHLC buckets touched by one scrape.
+
+        Only buckets containing the scrape's listings are rebuilt, each from an
+        index range scan over that bucket's raw listings.
+        """
+        variants = self.conn.execute(
+            "SELECT DISTINCT item, wear, stat, souv, timestamp_ms / ? FROM listings WHERE scrape_id = ?",
+            (ROLLUP_PERIODS["hour"], scrape_id)
+        ).fetchall()
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for period, width in ROLLUP_PERIODS.items():
+                buckets = {(item, wear, stat, souv, hour * ROLLUP_PERIODS["hour"] // width * width)
+                           for item, wear, stat, souv, hour in variants}
+                for bucket in buckets:
+                    self._rollup_bucket(period, width, *bucket)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def _rollup_bucket(self, period: str, width: int, item: str, wear: str, stat: int, souv: int, bucket_ms: int):
+        prices = [price_cents for _, price_cents in self.conn.execute(
+            "SELECT DISTINCT timestamp_ms, price_cents FROM listings "
+            "WHERE item = ? AND wear = ? AND stat = ? AND souv = ? AND timestamp_ms >= ? AND timestamp_ms < ? "
+            "ORDER BY timestamp_ms",
+            (item, wear, stat, souv, bucket_ms, bucket_ms + width)
+        )]
+        if not prices:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (period, item, wear, stat, souv, bucket_ms,
+             prices[0], max(prices), min(prices), prices[-1], len(prices), statistics.median(prices))
+        )
+
+    def rebuild_rollups(self):
+        """Rebuild every rollup from the stored scrapes (e.g. for a history recorded before rollups)."""
+        self.conn.execute("DELETE FROM rollups")
+        scrape_ids = [scrape_id for scrape_id, in self.conn.execute("SELECT id FROM scrapes ORDER BY id")]
+        for scrape_id in scrape_ids:
+            self.update_rollups(scrape_id)
+        logger.info(f"Rebuilt price rollups from {len(scrape_ids)} scrapes")
+
+    def rollups(self, item: str, wear: Optional[str] = None, stat: bool = False, souv: bool = False,
+                period: str = "day", limit: int = 30) -> List[Dict[str, Any]]:
+        """Get the latest OHLC buckets (prices in cents) of one item variant, newest first."""
+        rows = self.conn.execute(
+            "SELECT bucket_ms, open, high, low, close, count, median FROM rollups "
+            "WHERE period = ? AND item = ? AND wear = ? AND stat = ? AND souv = ? "
+            "ORDER BY bucket_ms DESC LIMIT ?",
+            (period, item, wear or "", int(stat), int(souv), limit)
+        ).fetchall()
+        return [
+            {
+                "bucket": from_ms(bucket_ms),
+                "open": open_cents,
+                "high": high,
+                "low": low,
+                "close": close,
+                "count": count,
+                "median": median
+            }
+            for bucket_ms, open_cents, high, low, close, count, median in rows
+        ]
+
+    def previous_close(self, item: str, wear: Optional[str] = None, stat: bool = False, souv: bool = False,
+                       period: str = "day", before: Optional[Timestamp] = None) -> Optional[int]:
+        """Get the closing price (cents) of the last bucket that ended before the current one."""
+        width = ROLLUP_PERIODS[period]
+        current_bucket = to_ms(before or datetime.datetime.now()) // width * width
+        row = self.conn.execute(
+            "SELECT close FROM rollups WHERE period = ? AND item = ? AND wear = ? AND stat = ? AND souv = ? "
+            "AND bucket_ms < ? ORDER BY bucket_ms DESC LIMIT 1",
+            (period, item, wear or "", int(stat), int(souv), current_bucket)
+        ).fetchone()
+        return row[0] if row else None
+
+    def price_series(self, item: str, wear: Optional[str] = None, stat: bool = False, souv: bool = False,
+                     start: Optional[Timestamp] = None, end: Optional[Timestamp] = None
+                     ) -> List[Tuple[datetime.datetime, int]]:
+        """Get (timestamp, price in cents) observations of one item variant, oldest first."""
+        # DISTINCT drops listings recorded again when a checkpointed scrape is resumed
+        rows = self.conn.execute(
+            "SELECT DISTINCT timestamp_ms, price_cents FROM listings "
+            "WHERE item = ? AND wear = ? AND stat = ? AND souv = ? AND timestamp_ms BETWEEN ? AND ? "
+            "ORDER BY timestamp_ms",
+            (item, wear or "", int(stat), int(souv),
+             to_ms(start) if start else 0, to_ms(end) if end else 2 ** 63 - 1)
+        ).fetchall()
+        return [(from_ms(timestamp_ms), price_cents) for timestamp_ms, price_cents in rows]
+
+    def snapshot(self, weapon: str, at: Optional[Timestamp] = None) -> List[Listing]:
+        """Get the listings of a weapon's latest completed scrape at or before `at` (default: now)."""
+        at_ms = to_ms(at) if at else 2 ** 63 - 1
+        scrape = self.conn.execute(
+            "SELECT id FROM scrapes WHERE weapon = ? AND completed = 1 AND started_ms <= ? "
+            "ORDER BY started_ms DESC LIMIT 1",
+            (weapon, at_ms)
+        ).fetchone()
+        if scrape is None:
+            return []
+
+        rows = self.conn.execute(
+            "SELECT item, wear, stat, souv, timestamp_ms, price_cents FROM listings WHERE scrape_id = ?",
+            scrape
+        ).fetchall()
+        return [
+            Listing(item, price_cents, Wear.from_label(wear), bool(stat), bool(souv), from_ms(timestamp_ms).isoformat())
+            for item, wear, stat, souv, timestamp_ms, price_cents in rows
+        ]
@@ -0,0 +1,238 @@
+import time
+import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from rate_limiter import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures after which a proxy is taken out of rotation until the next test
+MAX_CONSECUTIVE_FAILURES = 3
+# Weight of the newest sample in the latency moving average
+LATENCY_SMOOTHING = 0.3
+
+
+class ProxyPoolException(Exception):
+    """Raised when no proxy has worked for too long (requests must not go out unproxied)."""
+    pass
+
+
+class ProxyState:
+    """Health, latency and rate budget of one proxy."""
+
+    __slots__ = ("url", "limiter", "latency", "successes", "failures",
+                 "consecutive_failures", "healthy")
+
+    def __init__(self, url: str, limiter: AdaptiveRateLimiter):
+        self.url = url
+        self.limiter = limiter
+        self.latency: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.healthy = False
+
+    @property
+    def requests_proxies(self) -> Dict[str, str]:
+        return {"http": self.url, "https": self.url}
+
+    @property
+    def error_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.failures / total if total else 0.0
+
+    def score(self) -> float:
+        """Lower is better: smoothed latency penalized by the error rate."""
+        return (self.latency or 1.0) * (1 + 5 * self.error_rate)
+
+
+class ProxyPool:
+    """Health-checked proxies, each with its own adaptive rate budget.
+
+    Requests are routed to the best-scoring healthy proxy that has a token
+    available, so total throughput grows with the number of working proxies.
+    Results are reported from many fetch threads, so proxy statistics are
+    updated under the pool lock.
+    """
+
+    def __init__(self, proxy_urls: List[str], rate_settings: Dict[str, Any], test_url: str,
+                 test_timeout: float = 5.0, min_working: int = 1, retest_interval: float = 300.0):
+        self.rate_settings = rate_settings
+        self.test_url = test_url
+        self.test_timeout = test_timeout
+        self.min_working = min_working
+        self.retest_interval = retest_interval
+
+        self.proxies: List[ProxyState] = []
+        self._last_test = 0.0
+        self._testing = False
+        self._lock = threading.Lock()
+        self.add_proxies(proxy_urls)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], session: Optional[requests.Session] = None) -> "ProxyPool":
+        """Create a pool from the scraping.proxy settings, including provider proxies."""
+        proxy_config = config['scraping']['proxy']
+        proxy_urls = list(proxy_config.get('proxies', []))
+        for name, provider in proxy_config.get('providers', {}).items():
+            if not provider.get('url'):
+                continue
+            proxy_urls.extend(cls.load_provider_proxies(name, provider, session or requests.Session()))
+
+        return cls(
+            proxy_urls=proxy_urls,
+            rate_settings=config['scraping']['request']['rate_limit'],
+            test_url=proxy_config.get('test_url', config['scraping']['steam_market']['base_url']),
+            test_timeout=proxy_config['test_timeout_seconds'],
+            min_working=proxy_config['min_working_proxies'],
+            retest_interval=proxy_config['rotation_interval']
+        )
+
+    @staticmethod
+    def load_provider_proxies(name: str, provider: Dict[str, Any], session: requests.Session) -> List[str]:
+        """Fetch a provider's proxy list (JSON list or one host:port per line)."""
+        try:
+            response = session.get(provider['url'], params={"api_key": provider.get('api_key', '')}, timeout=10)
+            response.raise_for_status()
+            try:
+                entries = response.json()
+            except ValueError:
+                entries = response.text.split()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to load proxies from {name}: {str(e)}")
+            return []
+
+        protocol = provider.get('protocol', 'http')
+        return [entry if "://" in entry else f"{protocol}://{entry}" for entry in map(str, entries) if entry]
+
+    def add_proxies(self, proxy_urls: List[str]):
+        """Add proxies (untested until the next test_all)."""
+        known = {proxy.url for proxy in self.proxies}
+        for url in proxy_urls:
+            if url in known:
+                continue
+            limiter = AdaptiveRateLimiter(
+                rate=self.rate_settings['initial_rate'],
+                burst=self.rate_settings['burst'],
+                min_rate=self.rate_settings['min_rate'],
+                max_rate=self.rate_settings['max_rate'],
+                additive_increase=self.rate_settings['additive_increase'],
+                multiplicative_decrease=self.rate_settings['multiplicative_decrease'],
+                name=url,
+                log_interval=self.rate_settings.get('log_interval_seconds', 30)
+            )
+            self.proxies.append(ProxyState(url, limiter))
+            known.add(url)
+
+    def _test_proxy(self, proxy: ProxyState):
+        started = time.perf_counter()
+        try:
+            response = requests.get(self.test_url, proxies=proxy.requests_proxies, timeout=self.test_timeout)
+            response.raise_for_status()
+            self.report_success(proxy, time.perf_counter() - started)
+            with self._lock:
+                proxy.healthy = True
+        except requests.exceptions.RequestException as e:
+            with self._lock:
+                proxy.healthy = False
+                proxy.failures += 1
+            logger.debug(f"Proxy {proxy.url} failed test: {str(e)}")
+
+    def test_all(self):
+        """Test every proxy concurrently and update health and latency."""
+        if not self.proxies:
+            return
+        with ThreadPoolExecutor(max_workers=min(16, len(self.proxies)), thread_name_prefix="proxy-test") as pool:
+            list(pool.map(self._test_proxy, self.proxies))
+        self._last_test = time.monotonic()
+
+        working = self.working_count()
+        logger.info(f"Proxy test: {working}/{len(self.proxies)} working")
+        if working < self.min_working:
+            logger.warning(f"Only {working} working proxies (minimum {self.min_working})")
+
+    def _maybe_retest(self):
+        """Retest in the background when the pool is stale or short of working proxies."""
+        since_last = time.monotonic() - self._last_test
+        short = self.working_count() < self.min_working and since_last >= 2 * self.test_timeout
+        if not (short or since_last >= self.retest_interval):
+            return
+        with self._lock:
+            if self._testing:
+                return
+            self._testing = True
+
+        def run():
+            try:
+                self.test_all()
+            finally:
+                self._testing = False
+
+        threading.Thread(target=run, name="proxy-retest", daemon=True).start()
+
+    def working_count(self) -> int:
+        return sum(1 for proxy in self.proxies if proxy.healthy)
+
+    def acquire(self, timeout: float = 60.0) -> ProxyState:
+        """Wait for the best healthy proxy with budget left.
+
+        Waits as long as any proxy is healthy (their rate budgets refill).
+        Raises ProxyPoolException once none has been healthy for `timeout`
+        seconds, giving background retests that long to revive some.
+        """
+        unavailable_since = None
+        while True:
+            self._maybe_retest()
+            with self._lock:
+                candidates = sorted((proxy for proxy in self.proxies if proxy.healthy), key=ProxyState.score)
+            for proxy in candidates:
+                if proxy.limiter.try_acquire():
+                    return proxy
+            if candidates:
+                unavailable_since = None
+            else:
+                now = time.monotonic()
+                unavailable_since = unavailable_since or now
+                if now - unavailable_since >= timeout:
+                    raise ProxyPoolException(f"No working proxies for {timeout}s")
+            time.sleep(0.05)
+
+    def report_success(self, proxy: ProxyState, latency: float):
+        with self._lock:
+            proxy.successes += 1
+            proxy.consecutive_failures = 0
+            if proxy.latency is None:
+                proxy.latency = latency
+            else:
+                proxy.latency += LATENCY_SMOOTHING * (latency - proxy.latency)
+        proxy.limiter.on_success()
+
+    def report_throttle(self, proxy: ProxyState, retry_after: Optional[float] = None):
+        proxy.limiter.on_throttle(retry_after)
+
+    def report_failure(self, proxy: ProxyState, error: str):
+        with self._lock:
+            proxy.failures += 1
+            proxy.consecutive_failures += 1
+            taken_out = proxy.healthy and proxy.consecutive_failures >= MAX_CONSECUTIVE_FAILURES
+            if taken_out:
+                proxy.healthy = False
+        logger.debug(f"Proxy {proxy.url} failed: {error}")
+        if taken_out:
+            logger.warning(f"Proxy {proxy.url} taken out of rotation after {proxy.consecutive_failures} failures")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get per-proxy health, latency, error rate and current rate."""
+        return [
+            {
+                "url": proxy.url,
+                "healthy": proxy.healthy,
+                "latency": proxy.latency,
+                "error_rate": proxy.error_rate,
+                "rate": proxy.limiter.rate
+            }
+            for proxy in sorted(self.proxies, key=ProxyState.score)
+        ]
@@ -0,0 +1,152 @@
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Slots of the limiter state (a list, or a multiprocessing.Array shared by worker processes)
+RATE, TOKENS, UPDATED, PAUSED_UNTIL, SUCCESSES, THROTTLES = range(6)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts with AIMD.
+
+    Every success adds `additive_increase` requests/second to the rate (up to
+    `max_rate`); every throttle response multiplies it by
+    `multiplicative_decrease` (down to `min_rate`) and empties the bucket.
+    Safe to share between threads and asyncio tasks. With `shared_state` (from
+    `create_shared_state`) the bucket lives in shared memory, so limiters in
+    several worker processes draw from one budget and back off together.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: float = 0.05, max_rate: float = 5.0,
+                 additive_increase: float = 0.05, multiplicative_decrease: float = 0.5,
+                 name: str = "scraper", log_interval: float = 30.0, shared_state=None):
+        self.burst = max(1.0, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.name = name
+        self.log_interval = log_interval
+
+        self._last_log = 0.0
+        if shared_state is None:
+            self._state = [rate, self.burst, time.monotonic(), 0.0, 0, 0]
+            self._lock = threading.Lock()
+        else:
+            self._state = shared_state
+            self._lock = shared_state.get_lock()
+
+    @staticmethod
+    def create_shared_state(rate: float, burst: float = 1.0):
+        """Limiter state in shared memory, to pass to worker processes (e.g. as pool initargs)."""
+        return multiprocessing.Array('d', [rate, max(1.0, burst), time.monotonic(), 0.0, 0, 0])
+
+    @classmethod
+    def shared_state_from_config(cls, config: Dict[str, Any]):
+        """Shared limiter state starting from the scraping.request.rate_limit settings."""
+        settings = config['scraping']['request']['rate_limit']
+        return cls.create_shared_state(settings['initial_rate'], settings['burst'])
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], name: str = "scraper", shared_state=None) -> "AdaptiveRateLimiter":
+        """Create a limiter from the scraping.request.rate_limit settings."""
+        settings = config['scraping']['request']['rate_limit']
+        return cls(
+            rate=settings['initial_rate'],
+            burst=settings['burst'],
+            min_rate=settings['min_rate'],
+            max_rate=settings['max_rate'],
+            additive_increase=settings['additive_increase'],
+            multiplicative_decrease=settings['multiplicative_decrease'],
+            name=name,
+            log_interval=settings.get('log_interval_seconds', 30),
+            shared_state=shared_state
+        )
+
+    @property
+    def rate(self) -> float:
+        return self._state[RATE]
+
+    @property
+    def successes(self) -> int:
+        return int(self._state[SUCCESSES])
+
+    @property
+    def throttles(self) -> int:
+        return int(self._state[THROTTLES])
+
+    def _refill(self, now: float):
+        state = self._state
+        state[TOKENS] = min(self.burst, state[TOKENS] + max(0.0, now - state[UPDATED]) * state[RATE])
+        state[UPDATED] = now
+
+    def _reserve(self) -> float:
+        """Take a token if one is available, otherwise return seconds to wait."""
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+            if now < state[PAUSED_UNTIL]:
+                return state[PAUSED_UNTIL] - now
+            self._refill(now)
+            if state[TOKENS] >= 1:
+                state[TOKENS] -= 1
+                return 0.0
+            return (1 - state[TOKENS]) / state[RATE]
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting; returns False if none is available."""
+        return self._reserve() == 0.0
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent."""
+        while True:
+            wait = self._reserve()
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a request may be sent."""
+        while True:
+            wait = self._reserve()
+            if wait == 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """Additively increase the rate after a successful request."""
+        with self._lock:
+            state = self._state
+            state[SUCCESSES] += 1
+            state[RATE] = min(self.max_rate, state[RATE] + self.additive_increase)
+            now = time.monotonic()
+            if now - self._last_log >= self.log_interval:
+                self._last_log = now
+                logger.info(f"[{self.name}] rate limiter at {self.rate:.2f} req/s "
+                            f"({self.successes} ok, {self.throttles} throttled)")
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Multiplicatively decrease the rate after a throttle (HTTP 429) response."""
+        with self._lock:
+            state = self._state
+            state[THROTTLES] += 1
+            now = time.monotonic()
+            self._refill(now)
+            state[RATE] = max(self.min_rate, state[RATE] * self.multiplicative_decrease)
+            state[TOKENS] = 0.0
+            if retry_after:
+                state[PAUSED_UNTIL] = max(state[PAUSED_UNTIL], now + retry_after)
+            logger.warning(f"[{self.name}] throttled, rate limiter reduced to {self.rate:.2f} req/s")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current rate and success/throttle counters."""
+        return {
+            "rate": self.rate,
+            "successes": self.successes,
+            "throttles": self.throttles
+        }
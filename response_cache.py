@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlencode
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Disk-backed HTTP response cache with TTL expiry and LRU size eviction."""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float, max_size_bytes: int, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> {"url", "size", "created", "accessed"}, least recently used first
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._size_bytes = 0
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_index()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], data_dir: Path) -> "ResponseCache":
+        """Create a cache from the data_management.cache and performance.limits settings."""
+        cache_config = config['scraping']['data_management']['cache']
+        limits = config['performance']['limits']
+        ttl_seconds = min(cache_config['max_age_hours'] * 3600, limits['cache_duration_seconds'])
+        return cls(
+            cache_dir=Path(data_dir) / "cache",
+            ttl_seconds=ttl_seconds,
+            max_size_bytes=int(cache_config['max_size_mb'] * 1024 * 1024),
+            enabled=cache_config['enabled'] and limits['cache_enabled']
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from the URL plus its (sorted) query parameters."""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+
+    def _load_index(self):
+        """Load the entry index from disk, dropping expired or missing entries."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        try:
+            with open(index_path, 'r') as f:
+                entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        now = time.time()
+        for key, entry in sorted(entries.items(), key=lambda kv: kv[1]['accessed']):
+            if now - entry['created'] > self.ttl_seconds or not self._entry_path(key).exists():
+                self._remove_file(key)
+                continue
+            self._entries[key] = entry
+            self._size_bytes += entry['size']
+
+    def _save_index(self):
+        """Persist the entry index atomically."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, index_path)
+
+    def _remove_file(self, key: str):
+        try:
+            self._entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._size_bytes -= entry['size']
+        self._remove_file(key)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Return the cached response body, or None on a miss or expired entry."""
+        cached = self.get_entry(url, params)
+        return cached[0] if cached is not None else None
+
+    def get_entry(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, float]]:
+        """Return the cached response body and when it was fetched (epoch seconds), or None on a miss."""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.time() - entry['created'] > self.ttl_seconds:
+                self._drop(key)
+                self.misses += 1
+                return None
+            try:
+                text = self._entry_path(key).read_text(encoding="utf-8")
+            except OSError:
+                self._drop(key)
+                self.misses += 1
+                return None
+
+            entry['accessed'] = time.time()
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text, entry['created']
+
+    def put(self, url: str, text: str, params: Optional[Dict[str, Any]] = None):
+        """Store a response body and evict least recently used entries over budget."""
+        if not self.enabled:
+            return
+
+        key = self.make_key(url, params)
+        data = text.encode("utf-8")
+        with self._lock:
+            self._drop(key)
+            tmp_path = self._entry_path(key).with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+
+            now = time.time()
+            self._entries[key] = {"url": url, "size": len(data), "created": now, "accessed": now}
+            self._size_bytes += len(data)
+
+            while self._size_bytes > self.max_size_bytes and len(self._entries) > 1:
+                oldest_key = next(iter(self._entries))
+                self._drop(oldest_key)
+                self.evictions += 1
+
+            self._save_index()
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+            if self.enabled:
+                self._save_index()
+
+    def flush(self):
+        """Persist access times so LRU order survives restarts."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current cache usage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes
+        }
@@ -2,7 +2,6 @@ import re
 import time
 import random
 import requests
-import bs4
 import json
 import logging
 import pprint
@@ -14,7 +13,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple, Iterable, Iterator
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from collections import deque
@@ -24,22 +23,87 @@ from rich.panel import Panel
 from rich.text import Text
 import subprocess
 import datetime
+from contextlib import contextmanager, nullcontext
+from fetch_engine import ConcurrentFetcher
+from rate_limiter import AdaptiveRateLimiter
+from driver_pool import DriverPool
+from proxy_pool import ProxyPool
+from vpn_controller import VPNRotationController
+from response_cache import ResponseCache
+from market_parser import MarketPageParser, ParsedPage
+from checkpoint import ScrapeCheckpoint
+from listing import Listing, Wear, price_to_cents, NO_PRICE
+from listing_store import ListingStore
+from price_history import PriceHistory
 
 # Set up logging
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Collects [name, price-with-fee] text for every listing row in one execute_script call
+ROW_EXTRACTION_SCRIPT = """
+    return Array.from(document.querySelectorAll('div.market_listing_row_link')).map(function (row) {
+        var name = row.querySelector('span.market_listing_item_name');
+        var price = row.querySelector('span.market_listing_price_with_fee');
+        return [name ? name.innerText.trim() : '', price ? price.innerText.trim() : ''];
+    });
+"""
+
+# CDP Network.setBlockedURLs patterns for each blockable resource type
+RESOURCE_TYPE_URL_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*/economy/image/*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+    "stylesheet": ["*.css*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*"]
+}
+
+# Resolves once listing rows exist and the results container has had no DOM mutations
+# for arguments[0] ms, or when the arguments[1] ms deadline passes
+LISTINGS_QUIESCENCE_SCRIPT = """
+    var quietMs = arguments[0], deadlineMs = arguments[1], done = arguments[arguments.length - 1];
+    var container = document.getElementById('searchResultsRows');
+    var finished = false, quietTimer = null, observer = null, hardTimer = null;
+    function rowCount() {
+        return document.querySelectorAll('div.market_listing_row_link').length;
+    }
+    function finish(reason) {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(hardTimer);
+        done({rows: rowCount(), reason: reason});
+    }
+    function arm() {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(function () {
+            if (rowCount() > 0) { finish('quiet'); } else { arm(); }
+        }, quietMs);
+    }
+    if (!container) { finish('no-container'); return; }
+    hardTimer = setTimeout(function () { finish('deadline'); }, deadlineMs);
+    observer = new MutationObserver(arm);
+    observer.observe(container, {childList: true, subtree: true, characterData: true});
+    arm();
+"""
+
+# Responses that mean the proxy in use is blocked, needs auth or is broken
+PROXY_FAILURE_STATUSES = {403, 407}
+
 class ScraperException(Exception):
     """Custom exception for scraper-related errors."""
     pass
 
 class Scraper:
-    def __init__(self, url: str, items_dict: Dict[str, str], driver=None):
+    def __init__(self, url: str, items_dict: Dict[str, str], driver=None, driver_pool: Optional[DriverPool] = None,
+                 show_progress: bool = True, vpn_state: Optional[Dict[str, Any]] = None):
         self.base_url = url
         self.items_dict = items_dict
         self.session = requests.Session()
         self.driver = driver  # Use existing driver if provided
-        self.console = Console()
+        self.driver_pool = driver_pool  # Use shared browser pool if provided
+        self.show_progress = show_progress  # Off in batch scan workers, whose parent owns the terminal
+        self.console = Console(quiet=not show_progress)
         
         # Set up logging directory
         self.logs_dir = Path("logs")
@@ -72,16 +136,36 @@ class Scraper:
         # Initialize from config
         self.user_agents = self.config['scraping']['browser']['user_agents']
         self.max_retries = self.config['scraping']['request']['max_retries']
-        self.min_delay = self.config['scraping']['request']['min_delay_seconds']
-        self.max_delay = self.config['scraping']['request']['max_delay_seconds']
+        self.request_timeout = self.config['scraping']['request']['timeout_seconds']
+        
+        # Market extraction settings
+        market_config = self.config['scraping']['steam_market']
+        self.max_items_per_page = market_config['max_items_per_page']
+        self.extraction_mode = market_config.get('extraction_mode', 'selenium')
+        self.search_render_url = market_config.get('search_render_url', self.base_url + "search/render/")
         
         # Set up data management
         self.data_dir = Path(self.config['scraping']['data_management']['data_directory'])
         self.data_dir.mkdir(exist_ok=True)
+        self.response_cache = ResponseCache.from_config(self.config, self.data_dir)
+        self.checkpoint_dir = self.data_dir / "checkpoints"
+        # Finished scrapes are served from their checkpoint no longer than cached pages
+        self.checkpoint_max_age = self.config['scraping']['data_management']['cache']['max_age_hours'] * 3600
+        self.listing_store = ListingStore.from_config(self.config, self.data_dir)
+        self.price_history = PriceHistory.from_config(self.config, self.data_dir)
+        
+        # HTML parsing backend for result pages (selectolax/lxml when installed)
+        parser_backend = self.config['performance']['optimization'].get('html_parser', 'auto')
+        self.page_parser = MarketPageParser(parser_backend)
         
         # VPN configuration
         self.use_vpn = self.config['scraping']['vpn']['enabled']
-        if self.use_vpn:
+        self.vpn_controller = None
+        # With shared VPN state another process (the batch scan parent) owns the tunnel and its rotations
+        self._owns_vpn = vpn_state is None
+        if self.use_vpn and not self._owns_vpn:
+            self.vpn_controller = VPNRotationController.for_platform(self.config['scraping']['vpn'], vpn_state)
+        elif self.use_vpn:
             self.vpn_config = self.config['scraping']['vpn']
             self.MULLVAD_PATH = self.vpn_config['paths'].get(os.name, '')
             self.MULLVAD_LOCATIONS = []
@@ -92,15 +176,38 @@ class Scraper:
         
         # Proxy configuration
         self.use_proxy = self.config['scraping']['proxy']['enabled']
+        self.proxy_pool = None
         if self.use_proxy:
             self.proxy_config = self.config['scraping']['proxy']
+            self.proxy_pool = ProxyPool.from_config(self.config, self.session)
+            self.proxy_pool.test_all()
         
         # Performance settings
         self.performance_config = self.config['performance']['limits']
         
+        # Warm browser pool (only when no driver or pool was injected)
+        self._owns_driver_pool = False
+        if not self.driver and not self.driver_pool and self.config['scraping']['browser']['pool']['enabled']:
+            self.driver_pool = DriverPool.from_config(self.config, self._create_chrome_driver)
+            self._owns_driver_pool = True
+            # In JSON mode the browser is only a fallback, so launch it on first lease instead
+            if self.extraction_mode != 'json':
+                self.driver_pool.start()
+        self.max_concurrent_requests = self.performance_config['max_concurrent_requests']
+        self.rate_limiter = AdaptiveRateLimiter.from_config(self.config)
+        self.request_semaphore = None  # Cross-process in-flight cap, set by batch scans
+        
         # Error handling settings
         self.error_config = self.config['scraping']['error_handling']
         self.consecutive_errors = 0
+        
+        # Price window used to stop paging price-ascending results early
+        self.price_limits = self.config['analysis']['price_limits']
+        self.cutoff_stats: Dict[str, Any] = {}
+        
+        # Row extraction statistics (batched vs per-element WebDriver roundtrips)
+        self.extraction_stats: Dict[str, Any] = {}
+        self._roundtrip_latency: Optional[float] = None
 
     def _init_vpn(self):
         """Initialize VPN connection."""
@@ -127,6 +234,13 @@ class Scraper:
                         self.logger.warning(f"VPN connection attempt {attempt + 1} timed out")
                     except subprocess.CalledProcessError as e:
                         self.logger.error(f"VPN connection attempt {attempt + 1} failed: {str(e)}")
+            
+            # Rotation runs in the background so fetching never stops for it
+            if not self.vpn_controller:
+                self.vpn_controller = VPNRotationController.from_config(
+                    self.vpn_config, self.MULLVAD_PATH, self.MULLVAD_LOCATIONS, self.USED_LOCATIONS
+                )
+            self.vpn_controller.start()
                         
             self.logger.info("VPN initialized successfully")
             
@@ -135,33 +249,14 @@ class Scraper:
             self.use_vpn = False
 
     def _rotate_vpn(self):
-        """Rotate VPN connection to a new location."""
-        if not self.use_vpn:
+        """Ask the background controller to rotate the VPN to a new location (non-blocking)."""
+        if not self.use_vpn or not self.vpn_controller:
             return
+        self.vpn_controller.request_rotation("manual")
 
-        try:
-            # Get a new location that hasn't been used recently
-            available_locations = [loc for loc in self.MULLVAD_LOCATIONS if loc not in self.USED_LOCATIONS]
-            if not available_locations:
-                available_locations = self.MULLVAD_LOCATIONS
-            
-            new_location = random.choice(available_locations)
-            self.USED_LOCATIONS.append(new_location)
-            
-            # Disconnect current connection
-            subprocess.run([self.MULLVAD_PATH, "disconnect"])
-            time.sleep(2)
-            
-            # Connect to new location
-            subprocess.run([self.MULLVAD_PATH, "relay", "set", "location", new_location])
-            time.sleep(1)
-            subprocess.run([self.MULLVAD_PATH, "connect"])
-            time.sleep(5)  # Wait for connection
-            
-            self.logger.info(f"Rotated VPN to location: {new_location}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to rotate VPN: {str(e)}")
+    def _vpn_gate(self):
+        """Context that holds requests while the VPN rotates (no-op without VPN)."""
+        return self.vpn_controller.request() if self.vpn_controller else nullcontext()
 
     def __del__(self):
         """Clean up resources when the object is destroyed."""
@@ -172,6 +267,18 @@ class Scraper:
         """Clean up resources safely."""
         self._cleanup_in_progress = True
         try:
+            if hasattr(self, 'response_cache'):
+                self.response_cache.flush()
+                self.logger.debug(f"Response cache stats: {self.response_cache.stats()}")
+                
+            if hasattr(self, 'price_history'):
+                self.price_history.close()
+                
+            if getattr(self, 'driver_pool', None):
+                self.logger.debug(f"Driver pool stats: {self.driver_pool.stats()}")
+                if self._owns_driver_pool:
+                    self.driver_pool.close()
+                
             if hasattr(self, 'driver') and self.driver:
                 try:
                     self.driver.close()
@@ -182,9 +289,11 @@ class Scraper:
                 finally:
                     self.driver = None
                     
-            # Disconnect VPN if it was enabled
-            if self.use_vpn:
+            # Disconnect VPN if it was enabled (and is this scraper's to disconnect)
+            if self.use_vpn and self._owns_vpn:
                 try:
+                    if self.vpn_controller:
+                        self.vpn_controller.stop()
                     subprocess.run([self.MULLVAD_PATH, "disconnect"])
                 except Exception as e:
                     self.logger.debug(f"VPN cleanup error: {str(e)}")
@@ -194,23 +303,46 @@ class Scraper:
         finally:
             self._cleanup_in_progress = False
 
-    def _get_random_delay(self) -> float:
-        """Get a random delay between requests."""
-        return random.uniform(self.min_delay, self.max_delay)
-
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with random user agent."""
         return {"User-Agent": random.choice(self.user_agents)}
 
+    @contextmanager
+    def _lease_driver(self):
+        """Lease a Chrome driver: the injected one, a pooled one, or a fresh one quit afterwards."""
+        if self.driver:
+            yield self.driver
+        elif self.driver_pool:
+            with self.driver_pool.lease() as driver:
+                yield driver
+        else:
+            driver = self._get_chrome_driver()
+            try:
+                yield driver
+            finally:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
     def _get_chrome_driver(self):
         """Get configured Chrome driver."""
+        if self.driver:
+            return self.driver
+        return self._create_chrome_driver()
+
+    def _create_chrome_driver(self, block_resources: Optional[bool] = None):
+        """Launch a new Chrome driver configured from config.
+        
+        `block_resources` overrides the resource_blocking.enabled setting.
+        """
         try:
-            if self.driver:
-                return self.driver
-            
             # Configure Chrome options from config
             chrome_options = uc.ChromeOptions()
             browser_options = self.config['scraping']['browser']['options']
+            blocking = browser_options['resource_blocking']
+            if block_resources is None:
+                block_resources = blocking['enabled']
             
             # Add arguments from config
             if browser_options['headless']:
@@ -236,6 +368,13 @@ class Scraper:
             chrome_options.add_argument(f'--window-size={window_size["width"]},{window_size["height"]}')
             chrome_options.add_argument(f'--log-level={browser_options["log_level"]}')
             
+            # Skip image decoding entirely; other resource types are blocked through CDP below
+            if block_resources and blocking['disable_images']:
+                chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2
+                })
+            
             # Get Chrome path for current OS
             chrome_paths = self.config['scraping']['browser']['chrome_paths'].get(os.name, [])
             for path in chrome_paths:
@@ -269,31 +408,114 @@ class Scraper:
                 """
             })
             
+            if block_resources:
+                blocked_urls = self._get_blocked_url_patterns()
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": blocked_urls})
+                self.logger.debug(f"Blocking {len(blocked_urls)} URL patterns in Chrome")
+            
             return driver
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Chrome driver: {str(e)}")
             raise ScraperException(f"Failed to initialize Chrome driver: {str(e)}")
 
-    def _wait_for_market_listings(self, driver, timeout=30):
-        """Wait for market listings with better error handling and retry logic."""
-        self.analysis_logger.info(f"Waiting up to {timeout} seconds for market listings...")
+    def _get_blocked_url_patterns(self) -> List[str]:
+        """Build CDP URL patterns for the configured blocked resource types and hosts."""
+        blocking = self.config['scraping']['browser']['options']['resource_blocking']
+        patterns = []
+        for resource_type in blocking['blocked_resource_types']:
+            patterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resource_type, []))
+        patterns.extend(blocking['blocked_url_patterns'])
+        return patterns
+
+    def _get_browser_rss(self, driver) -> int:
+        """Get the resident memory (bytes) of the browser and all its child processes."""
+        import psutil
+        
+        pid = getattr(driver, 'browser_pid', None) or driver.service.process.pid
+        root = psutil.Process(pid)
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+
+    def benchmark_resource_blocking(self, weapon: str, runs: int = 3) -> Dict[str, Dict[str, float]]:
+        """Compare page-load latency and Chrome memory with resource blocking off and on."""
+        url = self._build_search_url(weapon)
+        results = {}
+        
+        for block_resources in (False, True):
+            label = "blocking on" if block_resources else "blocking off"
+            driver = self._create_chrome_driver(block_resources=block_resources)
+            try:
+                load_times = []
+                for _ in range(runs):
+                    # Start every run cold so the two modes are comparable
+                    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                    driver.delete_all_cookies()
+                    # Only navigation and rendering are timed, not the rate limiter wait
+                    self.rate_limiter.acquire()
+                    start = time.perf_counter()
+                    self._get_page(driver, url)
+                    self._wait_for_market_listings(driver)
+                    load_times.append(time.perf_counter() - start)
+                    self.rate_limiter.on_success()
+                results[label] = {
+                    "mean_load_seconds": sum(load_times) / len(load_times),
+                    "min_load_seconds": min(load_times),
+                    "rss_mb": self._get_browser_rss(driver) / (1024 * 1024)
+                }
+            finally:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            self.logger.info(f"Resource blocking benchmark ({label}): {results[label]}")
+        
+        return results
+
+    def _wait_for_market_listings(self, driver, timeout: Optional[float] = None) -> bool:
+        """Wait until the market listings are rendered and have stopped changing.
+        
+        Phase 1 waits for the results container, phase 2 for the listing rows to
+        go quiet (MutationObserver, falling back to polling the row count). Both
+        phases share one hard deadline.
+        """
+        settings = self.performance_config['readiness']
+        timeout = timeout or settings['deadline_seconds']
+        quiet_seconds = settings['quiet_period_ms'] / 1000
+        poll_seconds = settings['poll_interval_ms'] / 1000
+        started = time.perf_counter()
+        deadline = started + timeout
         
         try:
-            # First wait for the main container
-            WebDriverWait(driver, timeout).until(
+            # Phase 1: results container
+            WebDriverWait(driver, timeout, poll_frequency=poll_seconds).until(
                 EC.presence_of_element_located((By.ID, "searchResultsRows"))
             )
+            container_seconds = time.perf_counter() - started
             
-            # Then wait for actual listings
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.market_listing_row_link"))
-            )
+            # Phase 2: rows present and no DOM mutations for the quiet period
+            remaining = deadline - time.perf_counter()
+            try:
+                result = driver.execute_async_script(
+                    LISTINGS_QUIESCENCE_SCRIPT, int(quiet_seconds * 1000), int(remaining * 1000)
+                )
+                rows, reason = result["rows"], result["reason"]
+            except WebDriverException as e:
+                self.analysis_logger.debug(f"MutationObserver readiness failed, polling row count: {str(e)}")
+                rows, reason = self._poll_row_count_stable(driver, deadline, quiet_seconds, poll_seconds)
             
-            # Additional check for empty results
-            time.sleep(2)  # Brief pause to ensure content is loaded
-            listings = driver.find_elements(By.CSS_SELECTOR, "div.market_listing_row_link")
-            if not listings:
+            stable_seconds = time.perf_counter() - started - container_seconds
+            self.analysis_logger.info(
+                f"Listings readiness: container {container_seconds:.2f}s, "
+                f"stable {stable_seconds:.2f}s ({rows} rows, {reason})"
+            )
+            if not rows:
                 raise TimeoutException("No market listings found")
                 
             return True
@@ -309,111 +531,410 @@ class Scraper:
             except:
                 pass
                 
-            self.analysis_logger.error(f"Timeout waiting for market listings: {str(e)}")
+            self.analysis_logger.error(f"Timeout waiting for market listings after {time.perf_counter() - started:.2f}s: {str(e)}")
             return False
 
-    def scrape_one_page(self, weapon: str, add_ons: List[str], retries: int = 0) -> Optional[bs4.BeautifulSoup]:
-        """Scrape a single page with retry logic."""
-        page = self.base_url + self.items_dict[weapon] + ''.join([str(add_on) for add_on in add_ons])
-        self.logger.debug(f"Scraping page: {page}")
-        
+    def _poll_row_count_stable(self, driver, deadline: float, quiet_seconds: float, poll_seconds: float) -> Tuple[int, str]:
+        """Poll the listing row count until it is non-zero and unchanged for the quiet period."""
+        last_count = -1
+        last_change = time.perf_counter()
+        while time.perf_counter() < deadline:
+            count = len(driver.find_elements(By.CSS_SELECTOR, "div.market_listing_row_link"))
+            now = time.perf_counter()
+            if count != last_count:
+                last_count, last_change = count, now
+            elif count > 0 and now - last_change >= quiet_seconds:
+                return count, "stable"
+            time.sleep(poll_seconds)
+        return max(last_count, 0), "deadline"
+
+    def _extract_listing_rows(self, driver) -> List[Tuple[str, str]]:
+        """Read every listing row's name and price text in a single WebDriver roundtrip."""
+        start = time.perf_counter()
         try:
-            headers = self._get_headers()
-            response = self.session.get(page, headers=headers)
+            rows = driver.execute_script(ROW_EXTRACTION_SCRIPT) or []
+        except WebDriverException as e:
+            self.analysis_logger.warning(f"Batched row extraction failed, using per-element path: {str(e)}")
+            return self._extract_listing_rows_per_element(driver)
+        batched_seconds = time.perf_counter() - start
+        
+        # Estimate what the per-element path (1 find_elements + 2 find_element and
+        # 2 .text reads per row) would have cost using a measured roundtrip latency
+        if rows and self._roundtrip_latency is None:
+            sample_start = time.perf_counter()
+            self._extract_listing_rows_per_element(driver, limit=1)
+            self._roundtrip_latency = (time.perf_counter() - sample_start) / 5
+        
+        per_element_roundtrips = 1 + 4 * len(rows)
+        estimated_seconds = per_element_roundtrips * (self._roundtrip_latency or 0.0)
+        self.extraction_stats = {
+            "rows": len(rows),
+            "roundtrips": 1,
+            "roundtrips_saved": per_element_roundtrips - 1,
+            "batched_seconds": batched_seconds,
+            "estimated_per_element_seconds": estimated_seconds,
+            "seconds_saved": max(0.0, estimated_seconds - batched_seconds)
+        }
+        self.analysis_logger.info(
+            f"Extracted {len(rows)} rows in 1 roundtrip ({batched_seconds:.3f}s); "
+            f"saved {per_element_roundtrips - 1} roundtrips, "
+            f"~{self.extraction_stats['seconds_saved']:.2f}s vs per-element path"
+        )
+        return [(name, price) for name, price in rows]
+
+    def _extract_listing_rows_per_element(self, driver, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """Read listing rows through individual element lookups (one roundtrip per call)."""
+        rows = []
+        items = driver.find_elements(By.CSS_SELECTOR, "div.market_listing_row_link")
+        for item in items[:limit]:
+            try:
+                name_elem = item.find_element(By.CSS_SELECTOR, "span.market_listing_item_name")
+                price_elem = item.find_element(By.CSS_SELECTOR, "span.market_listing_price_with_fee")
+                rows.append((name_elem.text.strip(), price_elem.text.strip()))
+            except WebDriverException as e:
+                self.analysis_logger.error(f"Failed to read listing row: {str(e)}")
+        return rows
+
+    def _http_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Send a GET request through the best proxy (or the shared rate limiter), retrying on HTTP 429."""
+        for retries in range(self.max_retries + 1):
+            # Raises ProxyPoolException rather than sending the request unproxied
+            proxy = self.proxy_pool.acquire() if self.proxy_pool else None
+            if not proxy:
+                self.rate_limiter.acquire()
             
-            if response.status_code == 429:
-                if retries >= self.max_retries:
-                    raise ScraperException("Maximum retries reached. Aborting.")
-                
-                wait = random.uniform(10, 20) * (2 ** retries)
-                self.logger.warning(f"Rate limited! Sleeping {wait} seconds before retry... (Retry {retries + 1})")
-                time.sleep(wait)
-                return self.scrape_one_page(weapon, add_ons, retries + 1)
+            started = time.perf_counter()
+            try:
+                with self._vpn_gate(), self.request_semaphore or nullcontext():
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        headers=self._get_headers(),
+                        timeout=self.request_timeout,
+                        proxies=proxy.requests_proxies if proxy else None
+                    )
+            except requests.exceptions.RequestException as e:
+                if not proxy:
+                    raise
+                self.proxy_pool.report_failure(proxy, f"{type(e).__name__}: {str(e)}")
+                continue
             
-            response.raise_for_status()
-            return bs4.BeautifulSoup(response.text, "html.parser")
+            # Retry a bad status through another proxy, penalizing this one
+            if proxy and (response.status_code in PROXY_FAILURE_STATUSES or response.status_code >= 500):
+                self.proxy_pool.report_failure(proxy, f"HTTP {response.status_code}")
+                continue
+            
+            retry_after = response.headers.get("Retry-After", "")
+            retry_after = float(retry_after) if retry_after.isdigit() else None
+            if response.status_code != 429:
+                if self.vpn_controller:
+                    self.vpn_controller.report_success()
+                if proxy:
+                    self.proxy_pool.report_success(proxy, time.perf_counter() - started)
+                else:
+                    self.rate_limiter.on_success()
+                return response
             
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
-            raise ScraperException(f"Failed to scrape page: {str(e)}")
+            self.logger.warning(f"Rate limited! Backing off before retry... (Retry {retries + 1})")
+            if self.vpn_controller:
+                self.vpn_controller.report_throttle()
+            if proxy:
+                self.proxy_pool.report_throttle(proxy, retry_after)
+            else:
+                self.rate_limiter.on_throttle(retry_after)
+        
+        raise ScraperException("Maximum retries reached. Aborting.")
+
+    def _load_page(self, driver, url: str):
+        """Navigate the browser to a URL through the shared rate limiter."""
+        self.rate_limiter.acquire()
+        self._get_page(driver, url)
+        self.rate_limiter.on_success()
+
+    def _get_page(self, driver, url: str):
+        """Navigate the browser to a URL (in-flight cap and VPN gate only, no rate limiting)."""
+        with self._vpn_gate(), self.request_semaphore or nullcontext():
+            driver.get(url)
+
+    def scrape_one_page(self, weapon: str, start: int) -> Optional[ParsedPage]:
+        """Scrape the results page starting at listing `start` from the rendered search endpoint."""
+        data, _ = self._fetch_search_page(weapon, start, render=True)
+        return ParsedPage(
+            rows=self.page_parser.parse_rows(data.get("results_html") or ""),
+            last_page=self._page_count(data)
+        )
+
+    def _page_count(self, data: Dict[str, Any]) -> int:
+        """Number of results pages from a search response's total count (at least 1)."""
+        return max(1, -(-data.get("total_count", 0) // self.max_items_per_page))
 
     def get_last_page(self, weapon: str) -> int:
         """Get the last page number for a weapon category."""
-        page = self.base_url + self.items_dict[weapon] + "#p1_price_asc"
-        self.logger.debug(f"Loading first page with Selenium: {page}")
+        return self.scrape_one_page(weapon, 0).last_page
+
+    def scrape_all_pages(self, weapon: str) -> Generator[ParsedPage, None, None]:
+        """Generator to scrape all pages for a weapon, yielding them in page order.
         
-        driver = None
+        The first page gives the page count; the rest are fetched concurrently
+        by their `start` offset.
+        """
         try:
-            driver = self._get_chrome_driver()
+            first = self.scrape_one_page(weapon, 0)
+            last_page = first.last_page
+            self.logger.info(f"Found {last_page} pages for {weapon}")
             
-            # Add retry logic for page load
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    driver.get(page)
-                    break
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    self.logger.warning(f"Page load failed, attempt {attempt + 1} of {max_retries}")
-                    time.sleep(2 ** attempt)  # Exponential backoff
+            self.cutoff_stats = {}
+            requested_pages = {1}
             
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, 'market_paging_pagelink'))
-                )
-                html = driver.page_source
-                soup = bs4.BeautifulSoup(html, "html.parser")
-                pagination = soup.find_all('span', class_='market_paging_pagelink')
-                
-                if pagination:
-                    return int(pagination[-1].text)
-                return 1
-                
-            except TimeoutException:
-                self.logger.warning("Timeout waiting for pagination elements")
-                return 1
-                
-        except Exception as e:
-            self.logger.error(f"Selenium error: {str(e)}")
-            raise ScraperException(f"Failed to get last page: {str(e)}")
-            
-        finally:
-            if driver and driver != self.driver:  # Only quit if it's not the shared driver
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
-
-    def scrape_all_pages(self, weapon: str) -> Generator[bs4.BeautifulSoup, None, None]:
-        """Generator to scrape all pages for a weapon."""
-        try:
-            last_page = self.get_last_page(weapon)
-            self.logger.info(f"Found {last_page} pages for {weapon}")
+            def fetch_page(index: int) -> Optional[ParsedPage]:
+                if index == 1:
+                    return first
+                requested_pages.add(index)
+                return self.scrape_one_page(weapon, (index - 1) * self.max_items_per_page)
             
-            for index in range(1, last_page + 1):
-                soup = self.scrape_one_page(weapon, [f"#p{index}_price_asc"])
-                if soup:
-                    yield soup
-                time.sleep(self._get_random_delay())
+            # Pages are fetched concurrently; pacing happens in the shared rate limiter
+            fetcher = ConcurrentFetcher(self.max_concurrent_requests)
+            pages = fetcher.map_ordered(fetch_page, range(1, last_page + 1))
+            pages_used = 0
+            try:
+                for parsed in pages:
+                    pages_used += 1
+                    if not parsed:
+                        continue
+                    
+                    # Results are price-ascending: once a page starts above the window, the rest do too
+                    cheapest = self._page_min_price(parsed)
+                    if cheapest is not None and cheapest > self.price_limits['max_price_usd']:
+                        self._record_price_cutoff(last_page, pages_used, cheapest)
+                        break
+                    yield parsed
+            finally:
+                pages.close()
+                if self.cutoff_stats:
+                    # Some pages past the cutoff may already have been prefetched
+                    self.cutoff_stats['requests_saved'] = last_page - len(requested_pages)
                 
         except Exception as e:
             self.logger.error(f"Error scraping pages: {str(e)}")
             raise ScraperException(f"Failed to scrape all pages: {str(e)}")
 
-    def save_weapon_data(self, weapon: str, data: list):
-        """Save weapon data to a JSON file in the data directory."""
-        file_path = self.data_dir / f"{weapon}.json"
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
-        logger.info(f"Saved data for {weapon} to {file_path}")
+    def set_price_window(self, min_price: float, max_price: float):
+        """Set the active price window used to stop paging price-ascending results."""
+        self.price_limits['min_price_usd'] = min_price
+        self.price_limits['max_price_usd'] = max_price
 
-    def get_items(self, weapon: str) -> Generator[Dict[str, Any], None, None]:
-        """Get all items for a weapon category."""
+    def _page_min_price(self, page: ParsedPage) -> Optional[float]:
+        """Get the cheapest listing price on a results page."""
+        prices = [self._parse_price_value(price) for _, price in page.rows]
+        prices = [price for price in prices if price is not None]
+        return min(prices) if prices else None
+
+    def _parse_price_value(self, price: str) -> Optional[float]:
+        """Convert price text such as '$1,234.56 USD' to a float."""
+        cents = price_to_cents(self._parse_price(price.strip()))
+        return cents / 100 if cents != NO_PRICE else None
+
+    def _record_price_cutoff(self, pages_total: int, pages_used: int, cheapest: float):
+        """Record and log how much paging the price cutoff saved."""
+        self.cutoff_stats = {
+            "pages_total": pages_total,
+            "pages_fetched": pages_used,
+            "pages_skipped": pages_total - pages_used,
+            "requests_saved": pages_total - pages_used,
+            "cutoff_price": cheapest
+        }
+        self.analysis_logger.info(
+            f"Price cutoff: page {pages_used}/{pages_total} starts at ${cheapest:.2f} "
+            f"(max ${self.price_limits['max_price_usd']:.2f}), skipping {pages_total - pages_used} pages"
+        )
+
+    def save_weapon_data(self, weapon: str, data: Iterable[Listing]) -> int:
+        """Save weapon data to the data directory in the configured file format.
+        
+        `data` may be a generator (e.g. get_items); the file is only replaced
+        once the stream completes. Listings are also appended to the price history.
+        """
+        return self.listing_store.save(weapon, self.price_history.record(weapon, data))
+
+    def get_recorded_items(self, weapon: str, resume: bool = False) -> Iterator[Listing]:
+        """Get all items for a weapon like get_items, appending them to the price history as they stream."""
+        return self.price_history.record(weapon, self.get_items(weapon, resume))
+
+    def get_items(self, weapon: str, resume: bool = False) -> Generator[Listing, None, None]:
+        """Get all items for a weapon category, yielding each listing as soon as it is extracted."""
+        for batch in self.iter_item_pages(weapon, resume):
+            yield from batch
+
+    def iter_item_pages(self, weapon: str, resume: bool = False) -> Generator[List[Listing], None, None]:
+        """Get all items for a weapon category, yielding one batch of listings per results page.
+        
+        Progress is checkpointed after every page. With `resume`, an interrupted
+        scrape continues from its last page and a finished one is served from
+        the checkpoint without any requests, unless it is older than the cache
+        max age or was scraped under another price window or extraction mode.
+        Only JSON extraction resumes mid-scrape: the Selenium path renders a
+        single page, so an interrupted one starts over.
+        """
         self.analysis_logger.info(f"=== Starting analysis for {weapon.upper()} ===")
         self.analysis_logger.info(f"Timestamp: {datetime.datetime.now().isoformat()}")
         self.logger.info(f"Scraping items for {weapon}")
         
+        checkpoint = ScrapeCheckpoint.load(self.checkpoint_dir, weapon) if resume else None
+        max_price = self.price_limits['max_price_usd']
+        if checkpoint and checkpoint.is_stale(self.checkpoint_max_age, max_price, self.extraction_mode):
+            self.analysis_logger.info(
+                f"Checkpoint for {weapon} ({checkpoint.age_seconds / 3600:.1f}h old, max ${checkpoint.max_price_usd}, "
+                f"{checkpoint.extraction_mode}) doesn't match this scrape, scraping again"
+            )
+            checkpoint = None
+        if checkpoint and checkpoint.completed:
+            self.analysis_logger.info(
+                f"Checkpoint for {weapon} is complete ({checkpoint.age_seconds / 60:.0f} min old), "
+                f"loading {checkpoint.listing_count} listings"
+            )
+            yield checkpoint.load_listings()
+            return
+        
+        pages_yielded = 0
+        if checkpoint and checkpoint.cursor is not None and self.extraction_mode == 'json':
+            self.analysis_logger.info(
+                f"Resuming {weapon} after page {checkpoint.page_index} "
+                f"(start={checkpoint.cursor}, {checkpoint.listing_count} listings so far, "
+                f"checkpoint {checkpoint.age_seconds / 60:.0f} min old)"
+            )
+            listings = checkpoint.load_listings()
+            if listings:
+                pages_yielded += 1
+                yield listings
+        else:
+            checkpoint = ScrapeCheckpoint.start(self.checkpoint_dir, weapon, max_price, self.extraction_mode)
+        
+        if self.extraction_mode == 'json':
+            try:
+                for batch in self._iter_json_pages(weapon, checkpoint):
+                    if batch:
+                        pages_yielded += 1
+                        yield batch
+                # A cutoff on the first page means nothing is in the window, not that the endpoint failed
+                if pages_yielded or self.cutoff_stats:
+                    checkpoint.mark_complete()
+                    return
+                self.analysis_logger.warning("JSON search endpoint returned no listings, falling back to Selenium")
+            except ScraperException as e:
+                # Falling back after listings were handed out would yield duplicates
+                if pages_yielded:
+                    raise
+                self.analysis_logger.warning(f"JSON extraction failed ({str(e)}), falling back to Selenium")
+        
+        items = self._get_items_selenium(weapon)
+        checkpoint.record_page(1, None, items)
+        checkpoint.mark_complete()
+        yield items
+
+    def _build_search_url(self, weapon: str) -> str:
+        """Build the price-ascending market search page URL for a weapon."""
+        weapon_info = self.items_dict[weapon]
+        weapon_name = weapon_info["name"]
+        weapon_tag = weapon_info["tag"]
+        return (
+            f"{self.base_url}search?"
+            f"q={weapon_name}&"
+            f"category_730_ItemSet%5B%5D=any&"
+            f"category_730_Weapon%5B%5D=tag_weapon_{weapon_tag}&"
+            f"category_730_Quality%5B%5D=any&"
+            f"appid=730&"
+            f"sort_column=price&"
+            f"sort_dir=asc"
+        )
+
+    def _build_search_params(self, weapon: str, start: int, render: bool = False) -> Dict[str, Any]:
+        """Build query parameters for the market's search endpoint.
+        
+        With `render`, results come back as listing-row HTML (`results_html`)
+        instead of JSON records.
+        """
+        weapon_info = self.items_dict[weapon]
+        return {
+            "query": weapon_info["name"],
+            "start": start,
+            "count": self.max_items_per_page,
+            "search_descriptions": 0,
+            "sort_column": "price",
+            "sort_dir": "asc",
+            "appid": 730,
+            "norender": 0 if render else 1,
+            "category_730_ItemSet[]": "any",
+            "category_730_Weapon[]": f"tag_weapon_{weapon_info['tag']}",
+            "category_730_Quality[]": "any"
+        }
+
+    def _fetch_search_page(self, weapon: str, start: int,
+                           render: bool = False) -> Tuple[Dict[str, Any], datetime.datetime]:
+        """Fetch one page of results from the JSON search endpoint with retry logic.
+        
+        Returns the response and when it was fetched, which is earlier than now
+        for a cache hit.
+        """
+        params = self._build_search_params(weapon, start, render)
+        self.logger.debug(f"Fetching search results: {self.search_render_url} (start={start})")
+        
+        cached = self.response_cache.get_entry(self.search_render_url, params)
+        if cached is not None:
+            text, created = cached
+            return json.loads(text), datetime.datetime.fromtimestamp(created)
+        
+        try:
+            response = self._http_get(self.search_render_url, params)
+            response.raise_for_status()
+            data = response.json()
+            if not data.get("success"):
+                raise ScraperException("Search endpoint reported failure")
+            self.response_cache.put(self.search_render_url, response.text, params)
+            return data, datetime.datetime.now()
+            
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.error(f"Search request failed: {str(e)}")
+            raise ScraperException(f"Failed to fetch search results: {str(e)}")
+
+    def _iter_json_pages(self, weapon: str, checkpoint: ScrapeCheckpoint) -> Generator[List[Listing], None, None]:
+        """Yield listings page by page from the JSON search endpoint (no browser), checkpointing each page."""
+        self.analysis_logger.info("Using JSON search endpoint extraction")
+        start = checkpoint.cursor or 0
+        total_count = None
+        
+        pages_used = checkpoint.page_index
+        self.cutoff_stats = {}
+        
+        while total_count is None or start < total_count:
+            data, fetched_at = self._fetch_search_page(weapon, start)
+            results = data.get("results") or []
+            total_count = data.get("total_count", 0)
+            pages_used += 1
+            
+            # Results are price-ascending: once a page starts above the window, the rest do too
+            prices = [result["sell_price"] / 100 for result in results if "sell_price" in result]
+            if prices and min(prices) > self.price_limits['max_price_usd']:
+                pages_total = -(-total_count // self.max_items_per_page)
+                self._record_price_cutoff(pages_total, pages_used, min(prices))
+                break
+            
+            batch = []
+            for result in results:
+                name = result.get("name") or result.get("hash_name")
+                price = result.get("sell_price_text")
+                if name and price:
+                    # Cached pages keep their fetch time, so history doesn't record old prices as new
+                    batch.append(self._build_listing(name, price, fetched_at))
+            
+            self.analysis_logger.info(f"Fetched {len(results)} results (start={start}, total={total_count})")
+            checkpoint.record_page(pages_used, start + len(results), batch)
+            yield batch
+            if not results:
+                break
+            start += len(results)
+
+    def _get_items_selenium(self, weapon: str) -> List[Listing]:
+        """Get all items for a weapon category by rendering the search page in Chrome."""
         try:
             all_objs = []
             last_update_time = time.time()
@@ -430,7 +951,8 @@ class Scraper:
                 TimeRemainingColumn(),
                 console=self.console,
                 refresh_per_second=2,
-                expand=True
+                expand=True,
+                disable=not self.show_progress
             )
             
             # Create panels
@@ -462,7 +984,7 @@ class Scraper:
                     if len(all_objs) > 0:
                         stats_text.append("\n[bold]Latest Items:[/bold]\n")
                         for i, item in enumerate(all_objs[-3:], 1):
-                            stats_text.append(f"{i}. {item['name']} - {item['price']}\n", style="dim")
+                            stats_text.append(f"{i}. {item.name} - {item.price_text}\n", style="dim")
                     stats_panel.renderable = stats_text
 
                 self.console.print()
@@ -478,79 +1000,45 @@ class Scraper:
                 
                 retry_count = 0
                 max_retries = self.error_config['max_consecutive_errors']
-                driver = None
-                
-                try:
-                    # Configure scraper and initialize driver (only once)
+                with self._lease_driver() as driver:
+                    # Configure scraper (the browser is leased warm from the pool when enabled)
                     self.analysis_logger.info("Configuring scraper and constructing URL")
                     progress.update(setup_task, advance=30)
                     
                     # Construct proper Steam Market URL
-                    weapon_info = self.items_dict[weapon]
-                    weapon_name = weapon_info["name"]
-                    weapon_tag = weapon_info["tag"]
-                    full_url = (
-                        f"{self.base_url}search?"
-                        f"q={weapon_name}&"
-                        f"category_730_ItemSet%5B%5D=any&"
-                        f"category_730_Weapon%5B%5D=tag_weapon_{weapon_tag}&"
-                        f"category_730_Quality%5B%5D=any&"
-                        f"appid=730&"
-                        f"sort_column=price&"
-                        f"sort_dir=asc"
-                    )
+                    full_url = self._build_search_url(weapon)
                     
                     self.analysis_logger.info(f"Constructed URL: {full_url}")
                     progress.update(setup_task, advance=20)
                     update_panels()
                     
-                    self.analysis_logger.info("Initializing Chrome driver")
-                    driver = self._get_chrome_driver()
                     progress.update(setup_task, completed=100)
                     
                     while retry_count < max_retries:
                         try:
                             # Connect to Steam Market
                             progress.update(connect_task, visible=True)
-                            driver.get(full_url)
-                            time.sleep(5)  # Increased initial wait
+                            self._load_page(driver, full_url)
                             
-                            # Wait for market listings with better handling
+                            # Wait until listings are rendered and stable (no fixed sleeps)
                             if not self._wait_for_market_listings(driver):
                                 raise ScraperException("Market listings not found")
                             
                             progress.update(connect_task, completed=100)
                             progress.update(items_task, visible=True)
                             
-                            # Process items
-                            items = driver.find_elements(By.CSS_SELECTOR, "div.market_listing_row_link")
-                            if not items:
+                            # Process items (all rows are read in a single script roundtrip)
+                            rows = self._extract_listing_rows(driver)
+                            if not rows:
                                 raise ScraperException("No items found")
                             
-                            total_items = len(items)
+                            total_items = len(rows)
                             progress.update(items_task, total=total_items)
                             
-                            for idx, item in enumerate(items, 1):
+                            for idx, (name, price) in enumerate(rows, 1):
                                 try:
-                                    name_elem = item.find_element(By.CSS_SELECTOR, "span.market_listing_item_name")
-                                    price_elem = item.find_element(By.CSS_SELECTOR, "span.market_listing_price_with_fee")
-                                    
-                                    name = name_elem.text.strip()
-                                    price = price_elem.text.strip()
-                                    
                                     if name and price:
-                                        name_text, stat, souv, wear = self._parse_name(name)
-                                        price_text = self._parse_price(price)
-                                        
-                                        obj = {
-                                            "name": name_text,
-                                            "price": price_text,
-                                            "stat": stat,
-                                            "souv": souv,
-                                            "wear": wear,
-                                            "timestamp": datetime.datetime.now().isoformat()
-                                        }
-                                        all_objs.append(obj)
+                                        all_objs.append(self._build_listing(name, price))
                                         
                                         # Update progress
                                         progress.update(
@@ -577,11 +1065,7 @@ class Scraper:
                             retry_count += 1
                             if retry_count >= max_retries:
                                 raise ScraperException(f"Failed to scrape after {max_retries} attempts")
-                            time.sleep(5)
-                
-                finally:
-                    if driver and driver != self.driver:
-                        driver.quit()
+                            # The next attempt is paced by the shared rate limiter
                 
             return all_objs
             
@@ -591,6 +1075,21 @@ class Scraper:
             self.logger.error(error_msg)
             raise ScraperException(error_msg)
 
+    def _build_listing(self, name: str, price: str, observed: Optional[datetime.datetime] = None) -> Listing:
+        """Normalize raw name and price text into a typed listing (the only place prices are parsed).
+        
+        `observed` is when the price was fetched (default: now).
+        """
+        name_text, stat, souv, wear = self._parse_name(name)
+        return Listing(
+            name_text,
+            price_to_cents(self._parse_price(price)),
+            Wear.from_label(wear),
+            stat,
+            souv,
+            (observed or datetime.datetime.now()).isoformat()
+        )
+
     def _parse_name(self, name: str) -> tuple:
         """Parse item name into components."""
         stat = "StatTrak™" in name
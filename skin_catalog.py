@@ -0,0 +1,157 @@
+import gzip
+import json
+import time
+import logging
+import argparse
+import requests
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Community-maintained CS2 item dump used to build the catalog
+DEFAULT_SOURCE_URL = "https://raw.githubusercontent.com/ByMykel/CSGO-API/main/public/api/en/skins.json"
+
+# Rarity names in the dump that differ from analysis.trade_up_rules.rarity_levels
+RARITY_ALIASES = {"Mil-Spec Grade": "Mil-Spec"}
+
+# Bits of the packed flags field
+FLAG_STATTRAK = 1
+FLAG_SOUVENIR = 2
+
+
+class SkinInfo:
+    """Catalog entry for one skin (all wears share it)."""
+
+    __slots__ = ("name", "collection", "rarity", "min_float", "max_float", "stattrak", "souvenir")
+
+    def __init__(self, name: str, collection: Optional[str], rarity: str, min_float: float, max_float: float,
+                 stattrak: bool, souvenir: bool):
+        self.name = name
+        self.collection = collection
+        self.rarity = rarity
+        self.min_float = min_float
+        self.max_float = max_float
+        self.stattrak = stattrak
+        self.souvenir = souvenir
+
+    def __repr__(self) -> str:
+        return f"SkinInfo({self.name!r}, {self.collection!r}, {self.rarity!r}, {self.min_float}-{self.max_float})"
+
+
+class SkinCatalog:
+    """Skin name -> collection, rarity, float caps and StatTrak/Souvenir availability.
+
+    The catalog file is gzipped JSON with collection and rarity names stored
+    once and each skin as a short row of indexes, so it loads in milliseconds.
+    """
+
+    def __init__(self, skins: Optional[Dict[str, SkinInfo]] = None):
+        self.skins = skins or {}
+        self._by_collection: Dict[Tuple[Optional[str], str], List[SkinInfo]] = {}
+        for skin in self.skins.values():
+            self._by_collection.setdefault((skin.collection, skin.rarity), []).append(skin)
+
+    def __len__(self) -> int:
+        return len(self.skins)
+
+    def get(self, name: str) -> Optional[SkinInfo]:
+        """Look up a skin by its market name without StatTrak/Souvenir prefix or wear."""
+        return self.skins.get(name)
+
+    def collection_skins(self, collection: str, rarity: str) -> List[SkinInfo]:
+        """Get the skins of one rarity in a collection (the possible trade-up outputs)."""
+        return self._by_collection.get((collection, rarity), [])
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SkinCatalog":
+        """Load the catalog named in analysis.catalog, or an empty one if it hasn't been built."""
+        data_dir = Path(config['scraping']['data_management']['data_directory'])
+        path = data_dir / config['analysis']['catalog']['file']
+        try:
+            return cls.load(path)
+        except FileNotFoundError:
+            logger.warning(f"Skin catalog {path} not found, falling back to name heuristics "
+                           f"(build it with: python skin_catalog.py {path})")
+            return cls()
+
+    @classmethod
+    def load(cls, path: Path) -> "SkinCatalog":
+        """Load a catalog file written by `save`."""
+        started = time.perf_counter()
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+
+        collections = data['collections']
+        rarities = data['rarities']
+        skins = {}
+        for name, collection, rarity, min_float, max_float, flags in data['skins']:
+            skins[name] = SkinInfo(
+                name,
+                collections[collection] if collection >= 0 else None,
+                rarities[rarity],
+                min_float,
+                max_float,
+                bool(flags & FLAG_STATTRAK),
+                bool(flags & FLAG_SOUVENIR)
+            )
+        logger.debug(f"Loaded {len(skins)} skins from {path} in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return cls(skins)
+
+    def save(self, path: Path):
+        """Write the catalog in its compact dictionary-encoded form."""
+        collections: Dict[str, int] = {}
+        rarities: Dict[str, int] = {}
+        rows = []
+        for skin in self.skins.values():
+            collection = collections.setdefault(skin.collection, len(collections)) if skin.collection else -1
+            flags = (FLAG_STATTRAK if skin.stattrak else 0) | (FLAG_SOUVENIR if skin.souvenir else 0)
+            rows.append([skin.name, collection, rarities.setdefault(skin.rarity, len(rarities)),
+                         skin.min_float, skin.max_float, flags])
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump({"collections": list(collections), "rarities": list(rarities), "skins": rows},
+                      f, separators=(',', ':'))
+
+    @classmethod
+    def build(cls, source_url: str = DEFAULT_SOURCE_URL) -> "SkinCatalog":
+        """Build the catalog from a skins dump (list of skins with rarity, collections and float caps)."""
+        response = requests.get(source_url, timeout=60)
+        response.raise_for_status()
+
+        skins = {}
+        for entry in response.json():
+            name = entry.get('name')
+            rarity = (entry.get('rarity') or {}).get('name')
+            if not name or not rarity:
+                continue
+            collections = entry.get('collections') or []
+            skins[name] = SkinInfo(
+                name,
+                collections[0]['name'] if collections else None,
+                RARITY_ALIASES.get(rarity, rarity),
+                float(entry.get('min_float') or 0.0),
+                float(entry.get('max_float') or 1.0),
+                bool(entry.get('stattrak')),
+                bool(entry.get('souvenir'))
+            )
+        logger.info(f"Built skin catalog with {len(skins)} skins from {source_url}")
+        return cls(skins)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Build the local skin catalog index.")
+    arg_parser.add_argument("output", type=Path, nargs="?", default=Path("data/skin_catalog.json.gz"),
+                            help="Catalog file to write")
+    arg_parser.add_argument("--source", default=DEFAULT_SOURCE_URL, help="URL of the skins dump to build from")
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    built = SkinCatalog.build(args.source)
+    built.save(args.output)
+    started = time.perf_counter()
+    loaded = SkinCatalog.load(args.output)
+    print(f"Wrote {len(loaded)} skins to {args.output} ({args.output.stat().st_size / 1024:.1f} KB, "
+          f"loads in {(time.perf_counter() - started) * 1000:.1f} ms)")
@@ -0,0 +1,71 @@
+import sys
+import json
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """The repo config with data in a temp dir, run from that dir (Scraper reads ./config.json)."""
+    with open(REPO_ROOT / "config.json", 'r') as f:
+        config = json.load(f)
+    config['scraping']['data_management']['data_directory'] = str(tmp_path / "data")
+    config['scraping']['data_management']['cache']['enabled'] = False
+    config['scraping']['data_management']['history']['enabled'] = False
+    config['scraping']['browser']['pool']['enabled'] = False
+    config['scraping']['request']['rate_limit']['initial_rate'] = 100.0
+    config['scraping']['request']['rate_limit']['max_rate'] = 100.0
+
+    monkeypatch.chdir(tmp_path)
+    with open(tmp_path / "config.json", 'w') as f:
+        json.dump(config, f)
+    return config
+
+
+def write_config(config):
+    """Save changes made to the `config` fixture before creating a Scraper."""
+    with open("config.json", 'w') as f:
+        json.dump(config, f)
+
+
+class LocalServer:
+    """Threaded HTTP server on 127.0.0.1 that answers with `handle(handler)`."""
+
+    def __init__(self, handle):
+        outer = self
+        self.requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                outer.requests.append(self.path)
+                handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def send_json(handler, payload, status=200):
+    body = json.dumps(payload).encode()
+    handler.send_response(status)
+    handler.send_header("Content-Type", "application/json")
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
@@ -0,0 +1,77 @@
+import json
+import random
+from itertools import product
+
+import numpy as np
+import pytest
+
+from conftest import REPO_ROOT
+from listing import Listing, Wear
+from listing_table import ListingTable
+from skin_catalog import SkinCatalog, SkinInfo
+from trade_up_engine import TradeUpEngine, CONTRACT_SIZE
+from trade_up_search import CompositionSearch
+
+NOW = "2026-01-01T00:00:00"
+
+
+@pytest.fixture
+def wear_ranges():
+    with open(REPO_ROOT / "config.json", 'r') as f:
+        return json.load(f)['analysis']['trade_up_rules']['wear_ranges']
+
+
+def random_instance(seed):
+    """A few collections with random float caps, input listings and output market prices."""
+    rng = random.Random(seed)
+    skins, inputs, market = [], [], []
+    for collection in range(rng.randint(2, 5)):
+        name = f"Collection {collection}"
+        input_skin = SkinInfo(f"Input {collection}", name, "Mil-Spec", 0.0, 1.0, False, False)
+        skins.append(input_skin)
+        # Collections with fewer than 10 listings can only fill part of a contract
+        for _ in range(rng.randint(2, 12)):
+            inputs.append(Listing(input_skin.name, rng.randint(50, 400), rng.choice(list(Wear)), False, False, NOW))
+        for output in range(rng.randint(0, 3)):
+            low = rng.choice([0.0, 0.0, 0.06, 0.1])
+            skin = SkinInfo(f"Output {collection}.{output}", name, "Restricted", low, rng.uniform(low + 0.1, 1.0),
+                            False, False)
+            skins.append(skin)
+            for wear in Wear:
+                if rng.random() < 0.8:
+                    market.append(Listing(skin.name, rng.randint(100, 4000), wear, False, False, NOW))
+    return SkinCatalog({skin.name: skin for skin in skins}), ListingTable(inputs), ListingTable(market)
+
+
+def brute_force(engine, inputs, table, market):
+    """Profit of every way to split 10 slots over the collections' cheapest listings, best first."""
+    names = [name for name in inputs if engine.catalog.collection_skins(name, "Restricted")]
+    compositions, candidates = [], []
+    for amounts in product(*(range(len(inputs[name][0]) + 1) for name in names)):
+        if sum(amounts) != CONTRACT_SIZE:
+            continue
+        compositions.append({name: amount for name, amount in zip(names, amounts) if amount})
+        candidates.append([row for name, amount in zip(names, amounts) for row in inputs[name][0][:amount].tolist()])
+    if not candidates:
+        return []
+    scores = engine.evaluate(table, np.array(candidates), "Restricted", market)
+    profits = (scores.expected_value_cents - scores.cost_cents).tolist()
+    return sorted(zip(profits, compositions), key=lambda entry: entry[0], reverse=True)
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("top_k", [1, 5, 10_000])
+def test_matches_brute_force_top_k(wear_ranges, seed, top_k):
+    catalog, table, market = random_instance(seed)
+    engine = TradeUpEngine(catalog, wear_ranges)
+    search = CompositionSearch(engine, top_k=top_k)
+    inputs = search._collection_inputs(table)
+
+    found = search._search(inputs, "Restricted", market, stattrak=False)
+    expected = brute_force(engine, inputs, table, market)[:top_k]
+
+    assert [profit for profit, _ in found] == pytest.approx([profit for profit, _ in expected])
+    # Ties may come back in any order, but every composition found must have the profit it claims
+    exact = {tuple(sorted(composition.items())): profit for profit, composition in brute_force(engine, inputs, table, market)}
+    for profit, composition in found:
+        assert exact[tuple(sorted(composition.items()))] == pytest.approx(profit)
@@ -0,0 +1,64 @@
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from conftest import LocalServer, send_json, write_config
+
+ITEMS = {"ak": {"name": "AK-47", "tag": "ak47"}}
+TOTAL = 7
+
+
+def row(index):
+    return (f'<div class="market_listing_row market_listing_row_link">'
+            f'<span class="market_listing_item_name">AK-47 | Skin {index} (Field-Tested)</span>'
+            f'<span class="market_listing_price market_listing_price_with_fee">${1 + index:.2f} USD</span></div>')
+
+
+def serve_rendered_search(handler):
+    query = parse_qs(urlsplit(handler.path).query)
+    start, count = int(query["start"][0]), int(query["count"][0])
+    send_json(handler, {
+        "success": True,
+        "start": start,
+        "pagesize": count,
+        "total_count": TOTAL,
+        "results_html": "".join(row(index) for index in range(start, min(start + count, TOTAL)))
+    })
+
+
+@pytest.fixture
+def scraper(config):
+    from scraper import Scraper
+
+    with LocalServer(serve_rendered_search) as server:
+        market = config['scraping']['steam_market']
+        market['max_items_per_page'] = 2
+        market['search_render_url'] = server.url + "/market/search/render/"
+        config['performance']['limits']['max_concurrent_requests'] = 3
+        write_config(config)
+        scraper = Scraper(server.url + "/market/", ITEMS)
+        scraper.server = server
+        yield scraper
+        scraper.cleanup()
+
+
+def starts(scraper):
+    return sorted(int(parse_qs(urlsplit(path).query)["start"][0]) for path in scraper.server.requests)
+
+
+def test_fetches_each_page_once_by_offset(scraper):
+    pages = list(scraper.scrape_all_pages("ak"))
+
+    assert [len(page.rows) for page in pages] == [2, 2, 2, 1]
+    assert [page.rows[0][0] for page in pages] == [f"AK-47 | Skin {index} (Field-Tested)" for index in (0, 2, 4, 6)]
+    assert starts(scraper) == [0, 2, 4, 6]
+    assert all(parse_qs(urlsplit(path).query)["norender"] == ["0"] for path in scraper.server.requests)
+
+
+def test_stops_at_price_cutoff(scraper):
+    scraper.price_limits['max_price_usd'] = 4.50
+
+    pages = list(scraper.scrape_all_pages("ak"))
+
+    assert len(pages) == 2
+    assert scraper.cutoff_stats["pages_fetched"] == 3
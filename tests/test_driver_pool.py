@@ -0,0 +1,63 @@
+import threading
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_driver_launched_after_close_is_quit():
+    launching = threading.Event()
+    release = threading.Event()
+    drivers = []
+
+    def factory():
+        launching.set()
+        release.wait(5)
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = DriverPool(factory, size=1)
+    pool.start()
+    assert launching.wait(5)
+    pool.close()
+    release.set()
+
+    for thread in threading.enumerate():
+        if thread.name == "driver-pool-launch":
+            thread.join(5)
+    assert drivers[0].quit_called
+    assert pool._alive == 0
+    assert pool.stats()["idle"] == 0
+
+
+def test_close_quits_idle_drivers():
+    pool = DriverPool(FakeDriver, size=2)
+    with pool.lease() as driver:
+        pass
+    pool.close()
+
+    assert driver.quit_called
+    assert pool._alive == 0
+
+
+def test_lease_stats_are_running_totals():
+    pool = DriverPool(FakeDriver, size=1, max_uses=1000)
+    pool.start()
+    for _ in range(200):
+        with pool.lease():
+            pass
+
+    stats = pool.stats()
+    assert stats["leases"] == 200
+    assert 0.0 <= stats["mean_wait_seconds"] <= stats["max_wait_seconds"]
+    assert not hasattr(pool, "_lease_waits")
+    pool.close()
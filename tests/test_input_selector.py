@@ -0,0 +1,72 @@
+import json
+import heapq
+import random
+
+import pytest
+
+from conftest import REPO_ROOT
+from listing import Listing, Wear
+from listing_table import ListingTable
+from skin_catalog import SkinCatalog, SkinInfo
+from trade_up_engine import TradeUpEngine, CONTRACT_SIZE
+from trade_up_search import InputSelector, ANY_COLLECTION, _heap_smallest
+
+NOW = "2026-01-01T00:00:00"
+
+
+@pytest.fixture
+def engine():
+    with open(REPO_ROOT / "config.json", 'r') as f:
+        wear_ranges = json.load(f)['analysis']['trade_up_rules']['wear_ranges']
+    skins = [SkinInfo(f"Input {index}", f"Collection {index % 3}", "Mil-Spec", 0.0, 1.0, False, False)
+             for index in range(6)]
+    skins.append(SkinInfo("No Collection", None, "Mil-Spec", 0.0, 1.0, False, False))
+    return TradeUpEngine(SkinCatalog({skin.name: skin for skin in skins}), wear_ranges)
+
+
+def random_table(seed):
+    rng = random.Random(seed)
+    names = [f"Input {index}" for index in range(6)] + ["No Collection", "Not In Catalog"]
+    return ListingTable(
+        Listing(rng.choice(names), rng.randint(10, 60), rng.choice([*Wear, None]), False, False, NOW)
+        for _ in range(rng.randint(5, 80))
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_heap_smallest_matches_sorting(seed):
+    rng = random.Random(seed)
+    heap = [(rng.randint(0, 20), rng.random(), index) for index in range(rng.randint(0, 40))]
+    expected = sorted(heap)
+    heapq.heapify(heap)
+
+    for count in (0, 1, CONTRACT_SIZE, len(heap) + 5):
+        assert list(_heap_smallest(heap, count)) == expected[:count]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cheapest_inputs_match_sorting(engine, seed):
+    table = random_table(seed)
+    selector = InputSelector(engine)
+    collection, _ = engine.input_collections(table)
+    floats = engine.input_floats(table)
+    entries = [
+        (price, value, row, code, wear)
+        for row, (code, wear, price, value) in enumerate(zip(
+            collection.tolist(), table.wear_codes.tolist(), table.price_cents.tolist(), floats.tolist()))
+        if code >= 0 and wear >= 0
+    ]
+
+    heaps = selector.build_heaps(table)
+    expected_candidates = set()
+    for key in set(collection.tolist()) - {-1} | {ANY_COLLECTION}:
+        for wear_cap in range(len(Wear)):
+            expected = sorted(entry[:3] for entry in entries
+                              if (key == ANY_COLLECTION or entry[3] == key) and entry[4] <= wear_cap)
+            assert selector.cheapest(heaps.get(key, {}), wear_cap) == expected[:CONTRACT_SIZE]
+            if len(expected) >= CONTRACT_SIZE:
+                expected_candidates.add(tuple(sorted(row for _, _, row in expected[:CONTRACT_SIZE])))
+
+    candidates = [tuple(rows) for rows in selector.select(table).tolist()]
+    assert len(set(candidates)) == len(candidates)
+    assert set(candidates) == expected_candidates
@@ -0,0 +1,169 @@
+import json
+import datetime
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from conftest import LocalServer, send_json, write_config
+from listing import Wear
+from checkpoint import ScrapeCheckpoint
+from response_cache import ResponseCache
+
+# Recorded shape of /market/search/render/?norender=1 results (price ascending)
+RESULTS = [
+    {"name": f"AK-47 | Skin {index} (Field-Tested)", "hash_name": f"AK-47 | Skin {index} (Field-Tested)",
+     "sell_price": 100 + index, "sell_price_text": f"${(100 + index) / 100:.2f}"}
+    for index in range(5)
+]
+RESULTS[1]["name"] = "StatTrak™ AK-47 | Redline (Minimal Wear)"
+RESULTS[2]["name"] = "Souvenir AK-47 | Safety Net (Battle-Scarred)"
+
+ITEMS = {"ak": {"name": "AK-47", "tag": "ak47"}}
+
+
+def serve_search(handler):
+    url = urlsplit(handler.path)
+    if url.path != "/market/search/render/":
+        handler.send_error(404)
+        return
+    query = parse_qs(url.query)
+    start, count = int(query["start"][0]), int(query["count"][0])
+    send_json(handler, {
+        "success": True,
+        "start": start,
+        "pagesize": count,
+        "total_count": len(RESULTS),
+        "results": RESULTS[start:start + count]
+    })
+
+
+@pytest.fixture
+def scraper(config):
+    from scraper import Scraper
+
+    with LocalServer(serve_search) as server:
+        market = config['scraping']['steam_market']
+        market['max_items_per_page'] = 2
+        market['search_render_url'] = server.url + "/market/search/render/"
+        write_config(config)
+        scraper = Scraper(server.url + "/market/", ITEMS)
+        scraper.server = server
+        yield scraper
+        scraper.cleanup()
+
+
+def test_pages_through_search_endpoint(scraper):
+    pages = list(scraper.iter_item_pages("ak"))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    starts = [parse_qs(urlsplit(path).query)["start"][0] for path in scraper.server.requests]
+    assert starts == ["0", "2", "4"]
+    assert all(parse_qs(urlsplit(path).query)["norender"] == ["1"] for path in scraper.server.requests)
+
+
+def test_parses_listing_fields(scraper):
+    listings = list(scraper.get_items("ak"))
+
+    assert [listing.price_cents for listing in listings] == [100, 101, 102, 103, 104]
+    plain, stattrak, souvenir = listings[:3]
+    assert (plain.name, plain.wear, plain.stat, plain.souv) == ("AK-47 | Skin 0", Wear.FIELD_TESTED, False, False)
+    assert (stattrak.name, stattrak.wear, stattrak.stat) == ("AK-47 | Redline", Wear.MINIMAL_WEAR, True)
+    assert (souvenir.name, souvenir.wear, souvenir.souv) == ("AK-47 | Safety Net", Wear.BATTLE_SCARRED, True)
+
+
+def test_items_stream_page_by_page(scraper):
+    items = scraper.get_items("ak")
+
+    assert next(items).price_cents == 100
+    assert len(scraper.server.requests) == 1
+    assert [next(items).price_cents for _ in range(2)] == [101, 102]
+    assert len(scraper.server.requests) == 2
+
+    items.close()
+    assert len(scraper.server.requests) == 2
+    assert not ScrapeCheckpoint.load(scraper.checkpoint_dir, "ak").completed
+
+
+def test_stops_paging_above_max_price(scraper):
+    scraper.price_limits['max_price_usd'] = 1.015
+
+    listings = list(scraper.get_items("ak"))
+
+    assert [listing.price_cents for listing in listings] == [100, 101]
+    assert len(scraper.server.requests) == 2
+    assert scraper.cutoff_stats["pages_skipped"] == 1
+
+
+def test_cutoff_on_first_page_does_not_fall_back_to_selenium(scraper, monkeypatch):
+    launched = []
+    monkeypatch.setattr(scraper, "_create_chrome_driver", lambda *args, **kwargs: launched.append(args))
+    scraper.price_limits['max_price_usd'] = 0.50
+
+    assert list(scraper.get_items("ak")) == []
+    assert launched == []
+    assert len(scraper.server.requests) == 1
+    assert scraper.cutoff_stats["pages_fetched"] == 1
+    assert ScrapeCheckpoint.load(scraper.checkpoint_dir, "ak").completed
+
+
+def test_resume_serves_fresh_checkpoint_and_rescrapes_stale_one(scraper):
+    assert len(list(scraper.get_items("ak"))) == 5
+    requests_made = len(scraper.server.requests)
+
+    assert len(list(scraper.get_items("ak", resume=True))) == 5
+    assert len(scraper.server.requests) == requests_made
+
+    # Age the finished checkpoint past the cache max age
+    checkpoint = ScrapeCheckpoint.load(scraper.checkpoint_dir, "ak")
+    with open(checkpoint.state_path, 'r') as f:
+        state = json.load(f)
+    age = datetime.timedelta(seconds=scraper.checkpoint_max_age + 60)
+    state['updated'] = (datetime.datetime.now() - age).isoformat()
+    with open(checkpoint.state_path, 'w') as f:
+        json.dump(state, f)
+
+    assert len(list(scraper.get_items("ak", resume=True))) == 5
+    assert len(scraper.server.requests) == requests_made * 2
+    assert ScrapeCheckpoint.load(scraper.checkpoint_dir, "ak").age_seconds < 60
+
+
+def test_resume_rescrapes_checkpoint_from_another_price_window(scraper):
+    scraper.price_limits['max_price_usd'] = 1.015
+    assert len(list(scraper.get_items("ak"))) == 2
+    requests_made = len(scraper.server.requests)
+
+    # Served as is under the same window, scraped again under a wider one
+    assert len(list(scraper.get_items("ak", resume=True))) == 2
+    assert len(scraper.server.requests) == requests_made
+    scraper.price_limits['max_price_usd'] = 500.0
+    assert len(list(scraper.get_items("ak", resume=True))) == 5
+    assert ScrapeCheckpoint.load(scraper.checkpoint_dir, "ak").max_price_usd == 500.0
+
+
+def test_recorded_items_feed_price_history(scraper):
+    scraper.price_history.enabled = True
+
+    items = list(scraper.get_recorded_items("ak"))
+
+    assert len(scraper.price_history.snapshot("ak")) == len(items) == 5
+    first = items[0]
+    # No close from an earlier day yet; tomorrow, today's scrape is the previous close
+    assert scraper.price_history.previous_close(first.name, first.wear_label, first.stat, first.souv) is None
+    tomorrow = datetime.datetime.now() + datetime.timedelta(days=1)
+    assert scraper.price_history.previous_close(
+        first.name, first.wear_label, first.stat, first.souv, before=tomorrow
+    ) == first.price_cents
+
+
+def test_cached_pages_keep_their_fetch_time(scraper, tmp_path):
+    scraper.response_cache = ResponseCache(tmp_path / "cache", ttl_seconds=3600, max_size_bytes=1 << 20)
+    list(scraper.get_items("ak"))
+    requests_made = len(scraper.server.requests)
+    fetched = datetime.datetime.now() - datetime.timedelta(minutes=30)
+    for entry in scraper.response_cache._entries.values():
+        entry['created'] = fetched.timestamp()
+
+    listings = list(scraper.get_items("ak"))
+
+    assert len(scraper.server.requests) == requests_made
+    assert {listing.timestamp for listing in listings} == {fetched.isoformat()}
@@ -0,0 +1,56 @@
+import pytest
+
+from listing import Listing, Wear, NO_PRICE, price_to_cents, cents_to_price
+
+NOW = "2026-01-01T00:00:00"
+
+
+@pytest.mark.parametrize("text, cents", [
+    ("$1,234.56", 123456),
+    ("$0.03", 3),
+    ("$12", 1200),
+    ("$12.5", 1250),
+    ("", NO_PRICE),
+    ("Sold!", NO_PRICE),
+    (None, NO_PRICE)
+])
+def test_price_to_cents(text, cents):
+    assert price_to_cents(text) == cents
+
+
+@pytest.mark.parametrize("cents", [0, 3, 1250, 123456, 100000000])
+def test_cents_round_trip(cents):
+    assert price_to_cents(cents_to_price(cents)) == cents
+
+
+def test_no_price_formats_empty():
+    assert cents_to_price(NO_PRICE) == ""
+
+
+def test_wear_labels():
+    assert Wear.from_label("Field-Tested") is Wear.FIELD_TESTED
+    assert Wear.FIELD_TESTED.label == "Field-Tested"
+    assert Wear.from_label(None) is None
+    assert Wear.from_label("Vanilla") is None
+    assert sorted([Wear.BATTLE_SCARRED, Wear.FACTORY_NEW]) == [Wear.FACTORY_NEW, Wear.BATTLE_SCARRED]
+
+
+def test_dict_round_trip():
+    listing = Listing("AK-47 | Redline", 123456, Wear.MINIMAL_WEAR, True, False, NOW)
+    data = listing.to_dict()
+
+    assert data == {"name": "AK-47 | Redline", "price": "$1,234.56", "stat": True, "souv": False,
+                    "wear": "Minimal Wear", "timestamp": NOW}
+    loaded = Listing.from_dict(data)
+    assert (loaded.name, loaded.price_cents, loaded.wear, loaded.stat, loaded.souv, loaded.timestamp) == (
+        "AK-47 | Redline", 123456, Wear.MINIMAL_WEAR, True, False, NOW
+    )
+    assert loaded.price == 1234.56
+    assert loaded.flags == 1
+
+
+def test_names_are_interned():
+    first = Listing("".join(["AK-47 | ", "Redline"]), 100, None, False, False, NOW)
+    second = Listing("".join(["AK-47 | ", "Redline"]), 200, None, False, False, NOW)
+
+    assert first.name is second.name
@@ -0,0 +1,59 @@
+import pytest
+
+from listing import Listing, Wear, NO_PRICE
+from listing_store import ListingStore
+
+
+def listing_fields(listing):
+    return (listing.name, listing.price_cents, listing.wear, listing.stat, listing.souv, listing.timestamp)
+
+
+@pytest.fixture
+def listings():
+    return [
+        Listing("AK-47 | Redline", 1234, Wear.FIELD_TESTED, False, False, "2024-05-01T12:00:00.123456"),
+        Listing("AK-47 | Redline", 123456, Wear.MINIMAL_WEAR, True, False, "2024-05-01T12:00:01.000000"),
+        Listing("AK-47 | Safari Mesh", 3, Wear.BATTLE_SCARRED, False, True, "2024-05-01T12:00:02.000000"),
+        Listing("★ Karambit", 99999, None, True, False, "2024-05-01T12:00:03.000000"),
+        Listing("AK-47 | Slate", NO_PRICE, Wear.FACTORY_NEW, False, False, "2024-05-01T12:00:04.000000")
+    ]
+
+
+@pytest.mark.parametrize("file_format, compression", [
+    ("json", False), ("json", True), ("npz", False), ("npz", True)
+])
+def test_round_trip(tmp_path, listings, file_format, compression):
+    store = ListingStore(tmp_path, file_format, compression)
+
+    assert store.save("AK-47", iter(listings)) == len(listings)
+    assert [listing_fields(item) for item in store.load("AK-47")] == [listing_fields(item) for item in listings]
+    assert list(tmp_path.iterdir()) == [store.path_for("AK-47")]
+
+
+@pytest.mark.parametrize("file_format, compression", [
+    ("json", False), ("json", True), ("npz", False), ("npz", True)
+])
+def test_empty_round_trip(tmp_path, file_format, compression):
+    store = ListingStore(tmp_path, file_format, compression)
+
+    assert store.save("AK-47", iter([])) == 0
+    assert store.path_for("AK-47").exists()
+    assert store.load("AK-47") == []
+
+
+def test_missing_file_loads_empty(tmp_path):
+    assert ListingStore(tmp_path, "npz").load("AK-47") == []
+
+
+def test_failed_save_keeps_previous_file(tmp_path, listings):
+    store = ListingStore(tmp_path, "json")
+    store.save("AK-47", listings)
+
+    def broken():
+        yield listings[0]
+        raise RuntimeError("scrape failed")
+
+    with pytest.raises(RuntimeError):
+        store.save("AK-47", broken())
+    assert len(store.load("AK-47")) == len(listings)
+    assert list(tmp_path.iterdir()) == [store.path_for("AK-47")]
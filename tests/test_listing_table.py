@@ -0,0 +1,78 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from listing import Listing, Wear
+from listing_table import ListingTable
+
+SLICES = [slice(None), slice(2, 7), slice(None, None, 2), slice(-3, None), slice(None, None, -1),
+          slice(8, 2, -2), slice(5, 5), slice(20, 30), slice(2, None, -1)]
+
+
+def listing_fields(listing):
+    return (listing.name, listing.price_cents, listing.wear, listing.stat, listing.souv, listing.timestamp)
+
+
+@pytest.fixture
+def listings():
+    start = datetime.datetime(2024, 5, 1, 12, 0, 0, 123456)
+    return [
+        Listing(f"AK-47 | Skin {index % 3}", 100 + index, Wear(index % 5) if index % 4 else None,
+                index % 2 == 0, index % 5 == 0, (start + datetime.timedelta(seconds=index)).isoformat())
+        for index in range(10)
+    ]
+
+
+def fields(rows):
+    return [listing_fields(row) for row in rows]
+
+
+def test_rows_round_trip(listings):
+    table = ListingTable(listings)
+
+    assert len(table) == len(listings)
+    assert fields(table) == fields(listings)
+    assert listing_fields(table[-1]) == listing_fields(listings[-1])
+    assert [table.names[name_id] for name_id in table.name_ids] == [item.name for item in listings]
+    assert table.name_id("AK-47 | Skin 2") == 2
+    assert table.name_id("missing") is None
+
+
+@pytest.mark.parametrize("outer", SLICES)
+@pytest.mark.parametrize("inner", SLICES)
+def test_slices_match_list_slicing(listings, outer, inner):
+    table = ListingTable(listings)
+
+    view = table[outer]
+    assert len(view) == len(listings[outer])
+    assert fields(view) == fields(listings[outer])
+    assert view.price_cents.tolist() == [item.price_cents for item in listings[outer]]
+
+    nested = view[inner]
+    assert fields(nested) == fields(listings[outer][inner])
+    assert nested.row_ids().tolist() == list(range(len(listings)))[outer][inner]
+
+
+def test_filter_and_take_views(listings):
+    table = ListingTable(listings)[1:]
+    expected = [item for item in listings[1:] if item.stat]
+
+    stat = table.filter(table.flags & 1)
+    assert fields(stat) == fields(expected)
+    assert listing_fields(stat[-1]) == listing_fields(expected[-1])
+    assert fields(stat[::-1]) == fields(expected[::-1])
+    assert fields(stat.take([2, 0])) == fields([expected[2], expected[0]])
+    assert fields(stat.filter(stat.price_cents > 104)) == fields([item for item in expected if item.price_cents > 104])
+
+
+def test_views_share_the_table_columns(listings):
+    table = ListingTable(listings)
+    view = table[2:6]
+
+    view.price_cents[0] = 1
+    assert table[2].price_cents == 1
+    with pytest.raises(TypeError):
+        view.append(listings[0])
+    with pytest.raises(TypeError):
+        table.filter(np.ones(len(table))).append(listings[0])
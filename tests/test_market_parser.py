@@ -0,0 +1,53 @@
+import pytest
+
+from market_parser import MarketPageParser, available_backends
+
+PAGE = """
+<html><body>
+<div class="market_listing_row_link"><span class="market_listing_item_name">Outside the results</span></div>
+<div id="searchResultsRows">
+  <a href="#"><div class="market_listing_row market_listing_row_link" id="result_0">
+    <span class="market_listing_item_name">AK-47 | Redline (Field-Tested)</span>
+    <span class="normal_price"><span class="market_listing_price market_listing_price_with_fee">
+      $12.34 USD
+    </span></span>
+  </div></a>
+  <a href="#"><div class="market_listing_row market_listing_row_link" id="result_1">
+    <span class="market_listing_item_name">StatTrak™ AK-47 | Slate (Minimal Wear)</span>
+    <span class="market_listing_price market_listing_price_with_fee">$3.21 USD</span>
+  </div></a>
+  <a href="#"><div class="market_listing_row market_listing_row_link" id="result_2">
+    <span class="market_listing_item_name">AK-47 | No Price</span>
+  </div></a>
+</div>
+<div id="searchResults_links">
+  <span class="market_paging_pagelink active">1</span>
+  <span class="market_paging_pagelink">2</span>
+  <span class="market_paging_pagelink">...</span>
+  <span class="market_paging_pagelink">37</span>
+</div>
+</body></html>
+"""
+
+EXPECTED_ROWS = [
+    ("AK-47 | Redline (Field-Tested)", "$12.34 USD"),
+    ("StatTrak™ AK-47 | Slate (Minimal Wear)", "$3.21 USD"),
+    ("AK-47 | No Price", ""),
+]
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_parse_identical_rows(backend):
+    parsed = MarketPageParser(backend).parse(PAGE)
+
+    assert parsed.rows == EXPECTED_ROWS
+    assert parsed.last_page == 37
+
+
+def test_page_without_pagination_is_one_page():
+    for backend in available_backends():
+        assert MarketPageParser(backend).parse_last_page("<div id='searchResultsRows'></div>") == 1
+
+
+def test_unavailable_backend_falls_back_to_html_parser():
+    assert MarketPageParser("no-such-backend").backend == "html.parser"
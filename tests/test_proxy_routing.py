@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import LocalServer, send_json
+from proxy_pool import ProxyPool, ProxyPoolException
+
+TARGET = "http://market.test/market/search/render/"
+
+
+def good_proxy(handler):
+    # A forward proxy receives the absolute target URL as the request path
+    send_json(handler, {"success": True, "proxied": handler.path})
+
+
+def make_bad_proxy(status):
+    state = {"tested": False}
+
+    def handle(handler):
+        if not state["tested"]:
+            state["tested"] = True  # pass the pool's health check, then break
+            send_json(handler, {"success": True})
+        else:
+            send_json(handler, {"error": "bad proxy"}, status=status)
+    return handle
+
+
+@pytest.fixture
+def scraper(config):
+    from scraper import Scraper
+
+    scraper = Scraper("http://market.test/market/", {})
+    yield scraper
+    scraper.cleanup()
+
+
+@pytest.mark.parametrize("status", [403, 407, 502])
+def test_bad_proxy_is_penalized_and_skipped(scraper, config, status):
+    with LocalServer(good_proxy) as good, LocalServer(make_bad_proxy(status)) as bad:
+        scraper.proxy_pool = ProxyPool([bad.url, good.url], config['scraping']['request']['rate_limit'],
+                                       test_url=TARGET, test_timeout=2)
+        scraper.proxy_pool.test_all()
+        bad_state, good_state = scraper.proxy_pool.proxies
+        bad_state.latency = 1e-6  # make the bad proxy the preferred one
+
+        for _ in range(5):
+            response = scraper._http_get(TARGET, {"start": 0})
+            assert response.status_code == 200
+            assert response.json()["proxied"].startswith(TARGET)
+
+    assert bad_state.failures >= 3
+    assert not bad_state.healthy
+    assert good_state.healthy and good_state.failures == 0
+
+
+def test_dropped_connection_is_reported(scraper, config):
+    def drop(handler):
+        handler.close_connection = True
+        handler.wfile.write(b"garbage\r\n\r\n")
+
+    with LocalServer(good_proxy) as good, LocalServer(drop) as bad:
+        scraper.proxy_pool = ProxyPool([good.url], config['scraping']['request']['rate_limit'],
+                                       test_url=TARGET, test_timeout=2)
+        scraper.proxy_pool.test_all()
+        scraper.proxy_pool.add_proxies([bad.url])
+        bad_state = scraper.proxy_pool.proxies[1]
+        bad_state.healthy, bad_state.latency = True, 1e-6
+
+        assert scraper._http_get(TARGET).status_code == 200
+
+    assert bad_state.failures >= 1
+
+
+def test_concurrent_reports_are_not_lost(config):
+    pool = ProxyPool(["http://127.0.0.1:9"], config['scraping']['request']['rate_limit'], test_url=TARGET)
+    proxy = pool.proxies[0]
+    proxy.healthy = True
+
+    def report(index):
+        for _ in range(500):
+            pool.report_failure(proxy, "test") if index % 2 else pool.report_success(proxy, 0.01)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(report, range(8)))
+
+    assert proxy.failures == proxy.successes == 4 * 500
+
+
+def test_no_working_proxy_raises_instead_of_going_direct(scraper, config, monkeypatch):
+    direct = []
+    monkeypatch.setattr(scraper.session, "get", lambda *args, **kwargs: direct.append(kwargs))
+    scraper.proxy_pool = ProxyPool(["http://127.0.0.1:9"], config['scraping']['request']['rate_limit'],
+                                   test_url=TARGET, test_timeout=0.2)
+    monkeypatch.setattr(scraper.proxy_pool, "acquire",
+                        lambda timeout=0.2, acquire=scraper.proxy_pool.acquire: acquire(timeout))
+
+    with pytest.raises(ProxyPoolException):
+        scraper._http_get(TARGET)
+    assert direct == []
@@ -0,0 +1,44 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rate_limiter import AdaptiveRateLimiter
+
+_limiter = None
+
+
+def _init(state):
+    global _limiter
+    _limiter = AdaptiveRateLimiter(rate=20.0, burst=1.0, min_rate=1.0, max_rate=20.0, additive_increase=0.0,
+                                   shared_state=state)
+
+
+def _acquire(count):
+    for _ in range(count):
+        _limiter.acquire()
+    return count
+
+
+def _throttle():
+    _limiter.on_throttle()
+
+
+def test_shared_state_limits_combined_rate_across_processes():
+    state = AdaptiveRateLimiter.create_shared_state(rate=20.0, burst=1.0)
+    with ProcessPoolExecutor(max_workers=2, initializer=_init, initargs=(state,)) as pool:
+        list(pool.map(_acquire, [1, 1]))  # warm up the workers
+        started = time.monotonic()
+        assert sum(pool.map(_acquire, [10, 10])) == 20
+        elapsed = time.monotonic() - started
+
+    # 20 tokens at 20/s from one bucket take ~1 s; two private buckets would take ~0.5 s
+    assert elapsed >= 0.85
+
+
+def test_throttle_in_one_process_slows_all():
+    state = AdaptiveRateLimiter.create_shared_state(rate=20.0, burst=1.0)
+    parent = AdaptiveRateLimiter(rate=20.0, min_rate=1.0, shared_state=state)
+    with ProcessPoolExecutor(max_workers=1, initializer=_init, initargs=(state,)) as pool:
+        pool.submit(_throttle).result()
+
+    assert parent.rate == 10.0
+    assert parent.throttles == 1
@@ -0,0 +1,81 @@
+import time
+
+import response_cache
+from response_cache import ResponseCache
+
+URL = "https://market.test/market/search/render/"
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(tmp_path, ttl_seconds=60, max_size_bytes=1000, enabled=True):
+    return ResponseCache(tmp_path / "cache", ttl_seconds, max_size_bytes, enabled)
+
+
+def test_hit_keyed_by_params(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put(URL, "page 0", {"start": 0, "count": 10})
+
+    assert cache.get(URL, {"count": 10, "start": 0}) == "page 0"
+    assert cache.get(URL, {"start": 10, "count": 10}) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, "time", clock)
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.put(URL, "page 0")
+    created = clock.now
+
+    clock.now += 30
+    assert cache.get_entry(URL) == ("page 0", created)
+    clock.now += 31
+    assert cache.get(URL) is None
+    assert list((tmp_path / "cache").glob("*.cache")) == []
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    cache = make_cache(tmp_path, max_size_bytes=20)
+    cache.put(URL, "a" * 8, {"start": 0})
+    cache.put(URL, "b" * 8, {"start": 10})
+    assert cache.get(URL, {"start": 0}) is not None
+
+    cache.put(URL, "c" * 8, {"start": 20})
+
+    assert cache.get(URL, {"start": 10}) is None
+    assert cache.get(URL, {"start": 0}) == "a" * 8
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] == 16
+
+
+def test_entries_survive_restart(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, "time", clock)
+    cache = make_cache(tmp_path)
+    cache.put(URL, "fresh", {"start": 0})
+    clock.now += 40
+    cache.put(URL, "newer", {"start": 10})
+    cache.flush()
+
+    clock.now += 30
+    reopened = make_cache(tmp_path)
+
+    assert reopened.get(URL, {"start": 0}) is None
+    assert reopened.get(URL, {"start": 10}) == "newer"
+    assert len(list((tmp_path / "cache").glob("*.cache"))) == 1
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = make_cache(tmp_path, enabled=False)
+    cache.put(URL, "page 0")
+
+    assert cache.get(URL) is None
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+ROWS = [("AK-47 | Redline (Field-Tested)", "$12.34 USD"), ("AK-47 | Slate (Minimal Wear)", "$3.21 USD")]
+
+
+class FakeElement:
+    def __init__(self, text="", children=None):
+        self.text = text
+        self.children = children or {}
+
+    def find_element(self, by, selector):
+        return self.children[selector]
+
+
+class FakeDriver:
+    """Answers the batched script with ROWS and the per-element lookups with matching elements."""
+
+    def __init__(self, script_error=False):
+        self.script_error = script_error
+        self.scripts = 0
+        self.lookups = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if self.script_error:
+            raise WebDriverException("script failed")
+        return [list(row) for row in ROWS]
+
+    def find_elements(self, by, selector):
+        self.lookups += 1
+        return [
+            FakeElement(children={
+                "span.market_listing_item_name": FakeElement(name),
+                "span.market_listing_price_with_fee": FakeElement(price)
+            })
+            for name, price in ROWS
+        ]
+
+
+@pytest.fixture
+def scraper(config):
+    from scraper import Scraper
+
+    scraper = Scraper("http://127.0.0.1/market/", {}, show_progress=False)
+    yield scraper
+    scraper.cleanup()
+
+
+def test_rows_are_read_in_one_script_roundtrip(scraper):
+    driver = FakeDriver()
+
+    assert scraper._extract_listing_rows(driver) == ROWS
+    assert driver.scripts == 1
+    # One per-element sample measures the roundtrip latency, only the first time
+    assert driver.lookups == 1
+    assert scraper._extract_listing_rows(driver) == ROWS
+    assert (driver.scripts, driver.lookups) == (2, 1)
+
+    stats = scraper.extraction_stats
+    assert stats["rows"] == 2
+    assert stats["roundtrips"] == 1
+    assert stats["roundtrips_saved"] == 4 * len(ROWS)
+
+
+def test_script_failure_falls_back_to_per_element_reads(scraper):
+    driver = FakeDriver(script_error=True)
+
+    assert scraper._extract_listing_rows(driver) == ROWS
+    assert driver.lookups == 1
@@ -0,0 +1,50 @@
+from conftest import LocalServer, send_json
+from skin_catalog import SkinCatalog, SkinInfo
+
+
+def skin_fields(skin):
+    return (skin.name, skin.collection, skin.rarity, skin.min_float, skin.max_float, skin.stattrak, skin.souvenir)
+
+
+def test_save_load_round_trip(tmp_path):
+    catalog = SkinCatalog({skin.name: skin for skin in [
+        SkinInfo("AK-47 | Redline", "The Phoenix Collection", "Classified", 0.1, 0.7, True, False),
+        SkinInfo("AWP | Safari Mesh", "The Safari Collection", "Industrial Grade", 0.06, 0.8, False, True),
+        SkinInfo("M4A4 | Desert Storm", "The Safari Collection", "Industrial Grade", 0.0, 1.0, True, True),
+        SkinInfo("★ Karambit", None, "Covert", 0.0, 0.08, True, False)
+    ]})
+    path = tmp_path / "nested" / "catalog.json.gz"
+
+    catalog.save(path)
+    loaded = SkinCatalog.load(path)
+
+    assert len(loaded) == len(catalog)
+    for name, skin in catalog.skins.items():
+        assert skin_fields(loaded.get(name)) == skin_fields(skin)
+    assert [skin.name for skin in loaded.collection_skins("The Safari Collection", "Industrial Grade")] == [
+        "AWP | Safari Mesh", "M4A4 | Desert Storm"
+    ]
+    assert loaded.collection_skins("The Phoenix Collection", "Covert") == []
+
+
+def test_missing_catalog_is_empty(config):
+    assert len(SkinCatalog.from_config(config)) == 0
+
+
+def test_build_from_dump():
+    dump = [
+        {"name": "P250 | Sand Dune", "rarity": {"name": "Consumer Grade"},
+         "collections": [{"name": "The Dust 2 Collection"}], "min_float": 0.0, "max_float": 0.8},
+        {"name": "Glock-18 | Fade", "rarity": {"name": "Mil-Spec Grade"},
+         "collections": [{"name": "The Assault Collection"}], "max_float": 0.08, "stattrak": True},
+        {"name": "Sticker | Unnamed"},
+        {"name": "★ Bayonet", "rarity": {"name": "Covert"}, "collections": []}
+    ]
+    with LocalServer(lambda handler: send_json(handler, dump)) as server:
+        catalog = SkinCatalog.build(server.url)
+
+    assert len(catalog) == 3
+    assert skin_fields(catalog.get("Glock-18 | Fade")) == (
+        "Glock-18 | Fade", "The Assault Collection", "Mil-Spec", 0.0, 0.08, True, False
+    )
+    assert catalog.get("★ Bayonet").collection is None
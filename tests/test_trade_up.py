@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from conftest import REPO_ROOT
+from listing import Listing, Wear, NO_PRICE
+from listing_table import ListingTable
+from skin_catalog import SkinCatalog, SkinInfo
+from trade_up_calculator import TradeUpCalculator
+
+NOW = "2026-01-01T00:00:00"
+
+
+@pytest.fixture
+def trade_up_config():
+    with open(REPO_ROOT / "config.json", 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def catalog():
+    skins = [
+        SkinInfo("AK-47 | Input", "Test Collection", "Mil-Spec", 0.0, 1.0, True, False),
+        SkinInfo("AK-47 | Listed", "Test Collection", "Restricted", 0.02, 1.0, True, False),
+        SkinInfo("AK-47 | Unlisted", "Test Collection", "Restricted", 0.02, 1.0, True, False),
+    ]
+    return SkinCatalog({skin.name: skin for skin in skins})
+
+
+def listings():
+    inputs = [Listing("AK-47 | Input", 100, Wear.FIELD_TESTED, False, False, NOW) for _ in range(10)]
+    # Only one of the two possible outputs is on the market
+    return inputs + [Listing("AK-47 | Listed", 5000, Wear.FIELD_TESTED, False, False, NOW)]
+
+
+def test_partially_priced_contracts_are_excluded(trade_up_config, catalog):
+    calculator = TradeUpCalculator(trade_up_config, catalog)
+
+    assert calculator.find_trade_up_opportunities(listings()) == []
+
+
+def test_priced_coverage_is_reported(trade_up_config, catalog):
+    trade_up_config['analysis']['price_limits']['min_priced_coverage'] = 0.5
+    calculator = TradeUpCalculator(trade_up_config, catalog)
+
+    contracts = calculator.find_trade_up_opportunities(listings())
+
+    assert contracts
+    best = contracts[0]
+    assert best.priced_coverage == pytest.approx(0.5)
+    assert best.cost == pytest.approx(10.0)
+    # The unlisted output counts as nothing, so EV covers half the outcomes
+    assert best.expected_value == pytest.approx(25.0)
+    assert calculator.get_trade_up_summary(best)["priced_coverage"] == pytest.approx(0.5)
+
+
+def test_float_target_uses_worst_case_floats(trade_up_config, catalog):
+    calculator = TradeUpCalculator(trade_up_config, catalog)
+    engine = calculator.engine
+    # Minimal Wear inputs average 0.11 at mid-band, which fits the ~0.133 budget for Minimal Wear outputs,
+    # but can be up to 0.15, which doesn't
+    table = ListingTable(
+        [Listing("AK-47 | Input", 100, Wear.MINIMAL_WEAR, False, False, NOW) for _ in range(10)]
+        + [Listing("AK-47 | Input", 300, Wear.FACTORY_NEW, False, False, NOW) for _ in range(10)]
+    )
+
+    picks = calculator.float_optimizer.select(table, "Restricted")
+
+    outputs = catalog.collection_skins("Test Collection", "Restricted")
+    budget = engine.max_average_float(outputs, Wear.MINIMAL_WEAR)
+    worst = engine.worst_case_floats(table)
+    assert engine.input_floats(table)[:10].mean() <= budget < worst[:10].mean()
+    # The cheapest inputs that keep Minimal Wear outputs whatever their floats: 7 Minimal Wear + 3 Factory New
+    cost, rows = min((table.price_cents[rows].sum(), rows) for rows in picks.tolist() if worst[rows].mean() <= budget)
+    assert cost == 7 * 100 + 3 * 300
+    assert sum(table[row].wear == Wear.MINIMAL_WEAR for row in rows) == 7
+
+
+def test_unparseable_market_prices_do_not_price_outcomes(trade_up_config, catalog):
+    calculator = TradeUpCalculator(trade_up_config, catalog)
+    outputs = catalog.collection_skins("Test Collection", "Restricted")
+    market = ListingTable([
+        Listing("AK-47 | Listed", NO_PRICE, Wear.FIELD_TESTED, False, False, NOW),
+        Listing("AK-47 | Listed", 5000, Wear.FIELD_TESTED, False, False, NOW),
+        Listing("AK-47 | Unlisted", NO_PRICE, Wear.FIELD_TESTED, False, False, NOW),
+    ])
+
+    prices, rows = calculator.engine.output_prices(outputs, market, stattrak=False)
+
+    assert prices[0, Wear.FIELD_TESTED] == 5000
+    assert rows[0, Wear.FIELD_TESTED] == 1
+    assert prices[1, Wear.FIELD_TESTED] == 0
+    assert rows[1, Wear.FIELD_TESTED] == -1
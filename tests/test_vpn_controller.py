@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+import threading
+import multiprocessing
+from collections import deque
+
+import pytest
+
+from conftest import write_config
+from vpn_controller import VPNRotationController
+
+STUB_MULLVAD = """#!{python}
+import sys
+with open({log!r}, "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1:] == ["status"]:
+    print("Connected to {{}}".format(open({relay!r}).read() if __import__("os").path.exists({relay!r}) else "se-got"))
+if sys.argv[1:4] == ["relay", "set", "location"]:
+    open({relay!r}, "w").write(sys.argv[4])
+"""
+
+
+@pytest.fixture
+def mullvad(tmp_path):
+    """Stub `mullvad` CLI that logs its arguments and always reports Connected."""
+    log, relay = tmp_path / "mullvad.log", tmp_path / "relay"
+    path = tmp_path / "mullvad"
+    path.write_text(STUB_MULLVAD.format(python=sys.executable, log=str(log), relay=str(relay)))
+    path.chmod(0o755)
+    return path
+
+
+def commands(mullvad):
+    log = mullvad.parent / "mullvad.log"
+    return log.read_text().splitlines() if log.exists() else []
+
+
+def make_controller(mullvad, shared_state=None):
+    return VPNRotationController(str(mullvad), ["se-got", "de-fra"], deque(maxlen=1), auto_rotate=False,
+                                 command_timeout=5, drain_timeout=5, verify_timeout=5, shared_state=shared_state)
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_rotation_drains_in_flight_work_and_holds_new_requests(mullvad):
+    controller = make_controller(mullvad)
+    controller.start()
+    try:
+        release = threading.Event()
+        done = []
+
+        def in_flight():
+            with controller.request():
+                release.wait(5)
+                # The tunnel must not be touched while this request is in flight
+                done.append(("in flight", list(commands(mullvad))))
+
+        worker = threading.Thread(target=in_flight)
+        worker.start()
+        assert wait_for(lambda: controller._state.in_flight == 1)
+
+        controller.request_rotation("test")
+        assert wait_for(lambda: controller._state.rotating)
+
+        def held():
+            with controller.request():
+                done.append(("held", list(commands(mullvad))))
+
+        waiter = threading.Thread(target=held)
+        waiter.start()
+        time.sleep(0.2)
+        assert commands(mullvad) == []  # still draining
+        assert done == []
+
+        release.set()
+        worker.join(5)
+        waiter.join(10)
+        assert wait_for(lambda: controller.rotations)
+    finally:
+        controller.stop()
+
+    assert done[0] == ("in flight", [])
+    # The held request only went out once the new tunnel was verified
+    label, seen = done[1]
+    assert label == "held"
+    assert seen[:3] == ["disconnect", f"relay set location {controller.rotations[0]['location']}", "connect"]
+    assert "status" in seen[3:]
+
+    rotation = controller.rotations[0]
+    assert rotation["reason"] == "test"
+    assert rotation["verified"]
+    assert rotation["total_seconds"] >= rotation["drain_seconds"] > 0
+
+
+def test_throttles_trigger_rotation(mullvad):
+    controller = make_controller(mullvad)
+    controller.start()
+    try:
+        for _ in range(controller.throttle_threshold):
+            controller.report_throttle()
+        assert wait_for(lambda: controller.rotations)
+    finally:
+        controller.stop()
+
+    assert controller.rotations[0]["reason"] == "3 consecutive throttles"
+    assert controller.rotations[0]["location"] in ("se-got", "de-fra")
+
+
+def worker_request(mullvad, shared_state, entered, release):
+    """A batch scan worker: gates one request on the parent's rotation state and reports throttles."""
+    controller = make_controller(mullvad, shared_state)
+    with controller.request():
+        entered.set()
+        release.wait(5)
+    for _ in range(controller.throttle_threshold):
+        controller.report_throttle()
+
+
+def test_workers_share_the_parent_rotation_state(mullvad):
+    with multiprocessing.Manager() as manager:
+        shared_state = VPNRotationController.create_shared_state(manager)
+        controller = make_controller(mullvad, shared_state)
+        controller.start()
+        entered, release = manager.Event(), manager.Event()
+        worker = multiprocessing.Process(target=worker_request, args=(mullvad, shared_state, entered, release))
+        worker.start()
+        try:
+            assert entered.wait(5)
+            controller.request_rotation("test")
+            assert wait_for(lambda: controller._state.rotating)
+            time.sleep(0.2)
+            # The worker's request is still in flight, so the parent hasn't touched the tunnel
+            assert commands(mullvad) == []
+
+            release.set()
+            worker.join(10)
+            # The worker's throttles trigger a second rotation in the parent
+            assert wait_for(lambda: len(controller.rotations) == 2, timeout=10)
+        finally:
+            release.set()
+            controller.stop()
+            worker.join(5)
+
+    assert [rotation["reason"] for rotation in controller.rotations] == ["test", "3 consecutive throttles"]
+    assert all(rotation["drain_seconds"] < 5 for rotation in controller.rotations)
+
+
+def test_worker_scraper_neither_rotates_nor_disconnects_the_shared_tunnel(config, mullvad):
+    from scraper import Scraper
+
+    config['scraping']['vpn']['enabled'] = True
+    config['scraping']['vpn']['paths'][os.name] = str(mullvad)
+    write_config(config)
+    with multiprocessing.Manager() as manager:
+        scraper = Scraper("http://127.0.0.1/market/", {}, show_progress=False,
+                          vpn_state=VPNRotationController.create_shared_state(manager))
+        with scraper._vpn_gate():
+            pass
+        scraper.cleanup()
+
+    assert scraper.vpn_controller._thread is None
+    assert commands(mullvad) == []
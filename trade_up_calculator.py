@@ -1,25 +1,50 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import time
 import logging
 from dataclasses import dataclass
-from statistics import mean
+
+import numpy as np
+
+from listing import Listing, FLAG_STAT, FLAG_SOUV
+from listing_table import ListingTable
+from skin_catalog import SkinCatalog
+from trade_up_engine import TradeUpEngine, ContractScores
+from trade_up_search import InputSelector, FloatTargetOptimizer, CompositionSearch
 
 logger = logging.getLogger(__name__)
 
 @dataclass
 class TradeUpContract:
-    input_items: List[Dict[str, Any]]
-    potential_outputs: List[Dict[str, Any]]
+    input_items: List[Listing]
+    potential_outputs: List[Listing]
     cost: float
     expected_value: float
     profit_margin: float
     risk_level: str
     float_range: tuple
     success_chance: float
+    priced_coverage: float  # share of the outcome probability with a market price
+
+@dataclass
+class SearchStats:
+    candidates: int = 0
+    seconds: float = 0.0
 
 class TradeUpCalculator:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, catalog: Optional[SkinCatalog] = None):
         self.config = config
         self.rarity_levels = config['analysis']['trade_up_rules']['rarity_levels']
+        self.catalog = catalog if catalog is not None else SkinCatalog.from_config(config)
+        self.engine = TradeUpEngine(self.catalog, config['analysis']['trade_up_rules']['wear_ranges'])
+        self.selector = InputSelector(self.engine)
+        self.float_optimizer = FloatTargetOptimizer(self.engine)
+        self.composition_search = CompositionSearch(self.engine)
+        self.last_search = SearchStats()
+        
+        price_limits = config['analysis']['price_limits']
+        self.max_cost_cents = round(price_limits['max_price_usd'] * 100)
+        self.min_profit_margin = price_limits['min_profit_margin_percent']
+        self.min_priced_coverage = price_limits['min_priced_coverage']
         
     def _get_next_rarity(self, current_rarity: str) -> str:
         """Get the next rarity level up."""
@@ -31,26 +56,6 @@ class TradeUpCalculator:
             pass
         return None
 
-    def _calculate_float_value(self, min_float: float, max_float: float, wear_value: str) -> float:
-        """Calculate the float value based on wear."""
-        wear_ranges = self.config['analysis']['wear_ranges']
-        if wear_value in wear_ranges:
-            wear_min, wear_max = wear_ranges[wear_value]
-            return min_float + (max_float - min_float) * ((wear_min + wear_max) / 2)
-        return (min_float + max_float) / 2
-
-    def _calculate_success_chance(self, input_items: List[Dict[str, Any]], target_float: float) -> float:
-        """Calculate the chance of getting desired float value."""
-        input_floats = [self._calculate_float_value(0, 1, item['wear']) for item in input_items]
-        avg_float = mean(input_floats)
-        float_diff = abs(avg_float - target_float)
-        
-        if float_diff <= self.config['analysis']['trade_up_rules']['min_float_difference']:
-            return 0.95
-        elif float_diff <= self.config['analysis']['trade_up_rules']['max_float_difference']:
-            return 0.75
-        return 0.5
-
     def _get_risk_level(self, profit_margin: float, success_chance: float) -> str:
         """Determine risk level of trade-up contract."""
         if profit_margin < 0:
@@ -61,17 +66,27 @@ class TradeUpCalculator:
             return "Medium Risk"
         return "High Risk"
 
-    def find_trade_up_opportunities(self, items: List[Dict[str, Any]]) -> List[TradeUpContract]:
-        """Find profitable trade-up contract opportunities."""
-        opportunities = []
-        
-        # Group items by rarity
-        rarity_groups = {}
+    def group_by_rarity(self, items: Iterable[Listing],
+                        rarity_groups: Optional[Dict[str, ListingTable]] = None) -> Dict[str, ListingTable]:
+        """Group items into one ListingTable per rarity as they arrive (accepts a stream, e.g. Scraper.get_items)."""
+        rarity_groups = rarity_groups if rarity_groups is not None else {}
         for item in items:
-            rarity = self._get_item_rarity(item['name'])
+            rarity = self._get_item_rarity(item.name)
             if rarity not in rarity_groups:
-                rarity_groups[rarity] = []
+                rarity_groups[rarity] = ListingTable()
             rarity_groups[rarity].append(item)
+        return rarity_groups
+
+    def find_trade_up_opportunities(self, items: Iterable[Listing]) -> List[TradeUpContract]:
+        """Find profitable trade-up contract opportunities."""
+        opportunities = []
+        self.last_search = SearchStats()
+        
+        # Group items by rarity (consumes streamed items while they are being scraped)
+        rarity_groups = self.group_by_rarity(items)
+        if not len(self.catalog):
+            logger.warning("Skin catalog is empty, trade-up outcomes can't be modelled (build it with: python skin_catalog.py)")
+            return opportunities
 
         # Analyze each rarity group
         for rarity, items_group in rarity_groups.items():
@@ -79,47 +94,92 @@ class TradeUpCalculator:
             if not next_rarity:
                 continue
 
-            # Find potential output items
-            potential_outputs = [item for item in items if self._get_item_rarity(item['name']) == next_rarity]
-            if not potential_outputs:
+            # Next-rarity listings price the possible outcomes
+            market = rarity_groups.get(next_rarity)
+            if market is None:
                 continue
 
-            # Find possible input combinations
-            input_combinations = self._find_input_combinations(items_group)
-            
-            for inputs in input_combinations:
-                cost = sum(float(item['price'].replace('$', '').replace(',', '')) for item in inputs)
-                if cost > self.config['analysis']['max_price']:
+            for stattrak, inputs in self._eligible_inputs(items_group):
+                started = time.perf_counter()
+                candidates = self._find_candidates(inputs, next_rarity, market, stattrak)
+                if not len(candidates):
                     continue
+                
+                # Score every candidate at once
+                scores = self.engine.evaluate(inputs, candidates, next_rarity, market, stattrak)
+                self.last_search.candidates += len(candidates)
+                self.last_search.seconds += time.perf_counter() - started
+                opportunities.extend(self._build_contracts(inputs, candidates, scores, market))
 
-                # Calculate expected value
-                exp_value = self._calculate_expected_value(inputs, potential_outputs)
-                profit_margin = ((exp_value - cost) / cost) * 100
-
-                if profit_margin >= self.config['analysis']['min_profit_margin']:
-                    # Calculate float range and success chance
-                    target_float = self._calculate_float_value(0, 1, "Factory New")
-                    success_chance = self._calculate_success_chance(inputs, target_float)
-                    float_range = (min(self._calculate_float_value(0, 1, item['wear']) for item in inputs),
-                                 max(self._calculate_float_value(0, 1, item['wear']) for item in inputs))
-
-                    contract = TradeUpContract(
-                        input_items=inputs,
-                        potential_outputs=potential_outputs,
-                        cost=cost,
-                        expected_value=exp_value,
-                        profit_margin=profit_margin,
-                        risk_level=self._get_risk_level(profit_margin, success_chance),
-                        float_range=float_range,
-                        success_chance=success_chance
-                    )
-                    opportunities.append(contract)
-
+        logger.info(f"Evaluated {self.last_search.candidates} candidate contracts in {self.last_search.seconds * 1000:.1f} ms")
         return sorted(opportunities, key=lambda x: x.profit_margin, reverse=True)
 
+    def _find_candidates(self, inputs: ListingTable, next_rarity: str, market: ListingTable,
+                         stattrak: bool) -> np.ndarray:
+        """Cheapest inputs per outcome set, the cheapest inputs guaranteeing each output wear
+        and the most profitable mixed-collection compositions."""
+        candidates = np.vstack([
+            self.selector.select(inputs),
+            self.float_optimizer.select(inputs, next_rarity),
+            self.composition_search.select(inputs, next_rarity, market, stattrak)
+        ])
+        return np.unique(candidates, axis=0)
+
+    def _eligible_inputs(self, items: ListingTable) -> Iterator[Tuple[bool, ListingTable]]:
+        """Split a rarity group into non-StatTrak and StatTrak inputs that can go into a contract.
+
+        Souvenirs can't be traded up, inputs need a known collection, and StatTrak
+        and normal items can't be mixed.
+        """
+        known = np.array([bool(skin and skin.collection) for skin in map(self.catalog.get, items.names)], dtype=bool)
+        flags = items.flags
+        usable = known[items.name_ids] & ((flags & FLAG_SOUV) == 0) & (items.price_cents >= 0)
+        stattrak = (flags & FLAG_STAT) != 0
+        yield False, items.filter(usable & ~stattrak)
+        yield True, items.filter(usable & stattrak)
+
+    def _build_contracts(self, inputs: ListingTable, candidates: np.ndarray, scores: ContractScores,
+                         market: ListingTable) -> List[TradeUpContract]:
+        """Turn the candidates within the cost, margin and priced-coverage limits into contracts.
+
+        Unpriced outcomes add nothing to the expected value, so contracts whose
+        outcomes are not priced well enough are dropped rather than ranked on a
+        partial EV.
+        """
+        profit_margin = scores.profit_margin
+        keep = ((scores.cost_cents <= self.max_cost_cents) & (profit_margin >= self.min_profit_margin)
+                & (scores.priced_coverage >= self.min_priced_coverage - 1e-9))
+        
+        contracts = []
+        for index in np.flatnonzero(keep):
+            input_floats = scores.input_floats[index]
+            outputs = [
+                market[int(row)]
+                for row, probability in zip(scores.output_rows[index], scores.probabilities[index])
+                if probability > 0 and row >= 0
+            ]
+            margin = float(profit_margin[index])
+            success_chance = float(scores.success_chance[index])
+            contracts.append(TradeUpContract(
+                input_items=[inputs[int(row)] for row in candidates[index]],
+                potential_outputs=outputs,
+                cost=scores.cost_cents[index] / 100,
+                expected_value=scores.expected_value_cents[index] / 100,
+                profit_margin=margin,
+                risk_level=self._get_risk_level(margin, success_chance),
+                float_range=(float(input_floats.min()), float(input_floats.max())),
+                success_chance=success_chance,
+                priced_coverage=float(scores.priced_coverage[index])
+            ))
+        return contracts
+
     def _get_item_rarity(self, item_name: str) -> str:
-        """Determine item rarity based on name and market data."""
-        # This is a simplified version - you would want to implement proper rarity detection
+        """Determine item rarity from the skin catalog, falling back to name heuristics."""
+        skin = self.catalog.get(item_name)
+        if skin:
+            return skin.rarity
+        
+        # Heuristic for skins missing from the catalog (or no catalog built yet)
         if "Covert" in item_name:
             return "Covert"
         if "Classified" in item_name:
@@ -128,48 +188,6 @@ class TradeUpCalculator:
             return "Restricted"
         return "Mil-Spec"
 
-    def _find_input_combinations(self, items: List[Dict[str, Any]], max_items: int = 10) -> List[List[Dict[str, Any]]]:
-        """Find valid combinations of input items for trade-up contracts."""
-        from itertools import combinations
-        valid_combinations = []
-        
-        # Try different numbers of input items
-        for n in range(max_items, max_items + 1):
-            for combo in combinations(items, n):
-                if self._is_valid_combination(combo):
-                    valid_combinations.append(list(combo))
-                
-                if len(valid_combinations) >= 100:  # Limit number of combinations to analyze
-                    break
-                    
-        return valid_combinations
-
-    def _is_valid_combination(self, items: List[Dict[str, Any]]) -> bool:
-        """Check if a combination of items is valid for trade-up."""
-        if not items:
-            return False
-            
-        # Check if all items are of the same rarity
-        first_rarity = self._get_item_rarity(items[0]['name'])
-        if not all(self._get_item_rarity(item['name']) == first_rarity for item in items):
-            return False
-            
-        # Check total cost
-        total_cost = sum(float(item['price'].replace('$', '').replace(',', '')) for item in items)
-        if total_cost > self.config['analysis']['max_price']:
-            return False
-            
-        return True
-
-    def _calculate_expected_value(self, inputs: List[Dict[str, Any]], potential_outputs: List[Dict[str, Any]]) -> float:
-        """Calculate expected value of trade-up contract."""
-        if not potential_outputs:
-            return 0.0
-            
-        # Calculate average price of potential outputs
-        output_prices = [float(item['price'].replace('$', '').replace(',', '')) for item in potential_outputs]
-        return sum(output_prices) / len(output_prices)
-
     def get_trade_up_summary(self, contract: TradeUpContract) -> Dict[str, Any]:
         """Get a detailed summary of a trade-up contract."""
         return {
@@ -178,9 +196,10 @@ class TradeUpCalculator:
             "profit_margin": contract.profit_margin,
             "risk_level": contract.risk_level,
             "success_chance": contract.success_chance,
+            "priced_coverage": contract.priced_coverage,
             "float_range": contract.float_range,
-            "input_items": [{"name": item["name"], "wear": item["wear"], "price": item["price"]} 
+            "input_items": [{"name": item.name, "wear": item.wear_label, "price": item.price_text} 
                           for item in contract.input_items],
-            "potential_outputs": [{"name": item["name"], "wear": item["wear"], "price": item["price"]} 
+            "potential_outputs": [{"name": item.name, "wear": item.wear_label, "price": item.price_text} 
                                 for item in contract.potential_outputs]
         } 
\ No newline at end of file
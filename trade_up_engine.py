@@ -0,0 +1,208 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional
+
+import numpy as np
+
+from listing import Wear, FLAG_STAT
+from listing_table import ListingTable
+from skin_catalog import SkinCatalog, SkinInfo
+
+logger = logging.getLogger(__name__)
+
+CONTRACT_SIZE = 10
+
+
+@dataclass
+class ContractScores:
+    """Scores of K candidate contracts against their O possible output skins (prices in cents)."""
+    cost_cents: np.ndarray  # (K,)
+    expected_value_cents: np.ndarray  # (K,)
+    success_chance: np.ndarray  # (K,) probability the outcome is worth at least the cost
+    average_float: np.ndarray  # (K,)
+    input_floats: np.ndarray  # (K, CONTRACT_SIZE)
+    outputs: List[SkinInfo]  # (O,)
+    probabilities: np.ndarray  # (K, O)
+    output_floats: np.ndarray  # (K, O)
+    output_wears: np.ndarray  # (K, O) Wear codes
+    output_rows: np.ndarray  # (K, O) row of the cheapest matching market listing, -1 if unpriced
+    priced_coverage: np.ndarray  # (K,) probability the outcome has a market price
+
+    @property
+    def profit_margin(self) -> np.ndarray:
+        """Expected profit in percent of cost."""
+        return (self.expected_value_cents - self.cost_cents) / np.maximum(self.cost_cents, 1) * 100
+
+
+class TradeUpEngine:
+    """Scores many trade-up contracts at once with the CS2 outcome rules.
+
+    Each output skin of the next rarity in an input's collection is equally
+    likely per input, so an outcome's probability is its collection's share of
+    the inputs divided by that collection's number of outputs. The output float
+    is the skin's min float plus its float range times the average input float,
+    and its wear decides which market price the outcome is worth.
+
+    Scraped listings carry a wear but no exact float, so an input's float is
+    estimated as the middle of its wear band clipped to the skin's float caps.
+    """
+
+    def __init__(self, catalog: SkinCatalog, wear_ranges: Dict[str, List[float]]):
+        self.catalog = catalog
+        self.wear_low = np.array([wear_ranges[wear.label][0] for wear in Wear])
+        self.wear_high = np.array([wear_ranges[wear.label][1] for wear in Wear])
+
+    def _skin_columns(self, table: ListingTable) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """Per-name-id float caps and collection codes from the catalog."""
+        collections: Dict[str, int] = {}
+        min_float = np.zeros(len(table.names))
+        max_float = np.ones(len(table.names))
+        collection = np.full(len(table.names), -1, dtype=np.int64)
+        for name_id, name in enumerate(table.names):
+            skin = self.catalog.get(name)
+            if skin is None:
+                continue
+            min_float[name_id] = skin.min_float
+            max_float[name_id] = skin.max_float
+            if skin.collection:
+                collection[name_id] = collections.setdefault(skin.collection, len(collections))
+        return min_float, max_float, collection, list(collections)
+
+    def input_collections(self, table: ListingTable) -> Tuple[np.ndarray, List[str]]:
+        """Collection code of every row in the table (-1 if unknown) and the code -> collection list."""
+        _, _, collection, collections = self._skin_columns(table)
+        return collection[table.name_ids], collections
+
+    def input_floats(self, table: ListingTable) -> np.ndarray:
+        """Estimated float of every row in the table."""
+        min_float, max_float, _, _ = self._skin_columns(table)
+        return self._estimate_floats(table, min_float, max_float)
+
+    def worst_case_floats(self, table: ListingTable) -> np.ndarray:
+        """Highest float every row in the table can have: the top of its wear band clipped to the skin's max float."""
+        min_float, max_float, _, _ = self._skin_columns(table)
+        return self._float_bounds(table, min_float, max_float)[1]
+
+    def _estimate_floats(self, table: ListingTable, min_float: np.ndarray, max_float: np.ndarray) -> np.ndarray:
+        low, high = self._float_bounds(table, min_float, max_float)
+        return (low + high) / 2
+
+    def _float_bounds(self, table: ListingTable, min_float: np.ndarray,
+                      max_float: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Lowest and highest possible float of every row from its wear band and the skin's float caps."""
+        name_ids = table.name_ids
+        wear = table.wear_codes.astype(np.int64)
+        has_wear = wear >= 0
+        band_low = np.where(has_wear, self.wear_low[np.maximum(wear, 0)], 0.0)
+        band_high = np.where(has_wear, self.wear_high[np.maximum(wear, 0)], 1.0)
+        low = np.maximum(band_low, min_float[name_ids])
+        high = np.minimum(band_high, max_float[name_ids])
+        # Catalog caps that don't overlap the listed wear: trust the wear
+        return np.where(low <= high, low, band_low), np.where(low <= high, high, band_high)
+
+    def max_average_float(self, outputs: List[SkinInfo], wear: Wear) -> float:
+        """Highest average input float that keeps every output at `wear` or better (-inf if none can)."""
+        if wear == Wear.BATTLE_SCARRED:
+            return 1.0
+        # Floats on the upper bound already fall into the next wear
+        bound = np.nextafter(self.wear_high[wear], 0.0)
+        limit = np.inf
+        for skin in outputs:
+            span = skin.max_float - skin.min_float
+            if span > 0:
+                limit = min(limit, (bound - skin.min_float) / span)
+            elif skin.min_float > bound:
+                return -np.inf
+        return min(limit, 1.0)
+
+    def output_prices(self, outputs: List[SkinInfo], market: Optional[ListingTable],
+                      stattrak: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Cheapest market price (cents) and its row for every output skin x wear; 0 / -1 when unlisted."""
+        prices = np.full((len(outputs), len(Wear)), np.inf)
+        rows = np.full((len(outputs), len(Wear)), -1, dtype=np.int64)
+        if market is None or not len(market) or not outputs:
+            return np.zeros(prices.shape), rows
+
+        output_index = np.full(len(market.names), -1, dtype=np.int64)
+        for index, skin in enumerate(outputs):
+            name_id = market.name_id(skin.name)
+            if name_id is not None:
+                output_index[name_id] = index
+
+        output = output_index[market.name_ids]
+        wear = market.wear_codes.astype(np.int64)
+        # Unparseable prices (NO_PRICE) would otherwise sort first and pass as the cheapest listing
+        matches = ((output >= 0) & (wear >= 0) & (market.price_cents >= 0)
+                   & (((market.flags & FLAG_STAT) != 0) == stattrak))
+        match_rows = np.flatnonzero(matches)
+        if len(match_rows):
+            # Cheapest listing per (output, wear): sort by price, keep the first of each pair
+            order = match_rows[np.argsort(market.price_cents[match_rows], kind="stable")]
+            keys = output[order] * len(Wear) + wear[order]
+            _, first = np.unique(keys, return_index=True)
+            best = order[first]
+            prices[output[best], wear[best]] = market.price_cents[best]
+            rows[output[best], wear[best]] = best
+        return np.where(np.isfinite(prices), prices, 0.0), rows
+
+    def evaluate(self, table: ListingTable, candidates: np.ndarray, next_rarity: str,
+                 market: Optional[ListingTable], stattrak: bool = False) -> ContractScores:
+        """Score candidate contracts given as a (K, 10) array of row positions in `table`.
+
+        `market` holds the next-rarity listings used to price outcomes; outcomes
+        without a listing for their skin and wear (or from inputs with no known
+        collection) count as worth nothing, and `priced_coverage` reports how
+        much of the outcome probability the expected value actually covers.
+        """
+        candidates = np.asarray(candidates, dtype=np.int64).reshape(-1, CONTRACT_SIZE)
+        contracts = len(candidates)
+        min_float, max_float, collection, collections = self._skin_columns(table)
+
+        cost = table.price_cents[candidates].sum(axis=1)
+        input_floats = self._estimate_floats(table, min_float, max_float)[candidates]
+        average_float = input_floats.mean(axis=1)
+
+        # Inputs per collection: (K, C)
+        input_collections = collection[table.name_ids][candidates]
+        counts = np.zeros((contracts, len(collections) + 1))
+        np.add.at(counts, (np.repeat(np.arange(contracts), CONTRACT_SIZE), input_collections.ravel()), 1)
+        counts = counts[:, :len(collections)]  # drop the bucket of inputs with no known collection (-1)
+
+        outputs: List[SkinInfo] = []
+        output_collection = []
+        for code, name in enumerate(collections):
+            skins = self.catalog.collection_skins(name, next_rarity)
+            outputs.extend(skins)
+            output_collection.extend([code] * len(skins))
+        output_collection = np.array(output_collection, dtype=np.int64)
+        outputs_per_collection = np.bincount(output_collection, minlength=len(collections))
+
+        # P(output) = inputs from its collection / 10 / outputs in that collection: (K, O)
+        probabilities = (counts[:, output_collection] / CONTRACT_SIZE
+                         / np.maximum(outputs_per_collection[output_collection], 1))
+
+        output_min = np.array([skin.min_float for skin in outputs])
+        output_range = np.array([skin.max_float - skin.min_float for skin in outputs])
+        output_floats = output_min + output_range * average_float[:, None]
+        output_wears = np.minimum(np.searchsorted(self.wear_high, output_floats, side="right"), len(Wear) - 1)
+
+        prices, price_rows = self.output_prices(outputs, market, stattrak)
+        output_index = np.arange(len(outputs))
+        values = prices[output_index, output_wears]
+        output_rows = price_rows[output_index, output_wears]
+        expected_value = (probabilities * values).sum(axis=1)
+        success_chance = (probabilities * (values >= cost[:, None])).sum(axis=1)
+
+        return ContractScores(
+            cost_cents=cost,
+            expected_value_cents=expected_value,
+            success_chance=success_chance,
+            average_float=average_float,
+            input_floats=input_floats,
+            outputs=outputs,
+            probabilities=probabilities,
+            output_floats=output_floats,
+            output_wears=output_wears,
+            output_rows=output_rows,
+            priced_coverage=(probabilities * (output_rows >= 0)).sum(axis=1)
+        )
@@ -0,0 +1,384 @@
+import heapq
+import logging
+from bisect import insort, bisect_right
+from itertools import islice, accumulate, count as count_from
+from typing import List, Dict, Tuple, Iterator, Optional
+
+import numpy as np
+
+from listing import Wear
+from listing_table import ListingTable
+from trade_up_engine import TradeUpEngine, CONTRACT_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Heap key for inputs from any collection of the rarity
+ANY_COLLECTION = -1
+
+# (price cents, estimated float, row position)
+HeapEntry = Tuple[int, float, int]
+
+
+def _heap_smallest(heap: List[HeapEntry], count: int) -> Iterator[HeapEntry]:
+    """The `count` smallest entries of a binary heap in order, without popping (O(count log count))."""
+    if not heap:
+        return
+    frontier = [(heap[0], 0)]
+    while frontier and count:
+        entry, index = heapq.heappop(frontier)
+        yield entry
+        count -= 1
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(heap):
+                heapq.heappush(frontier, (heap[child], child))
+
+
+class InputSelector:
+    """Builds the cheapest valid 10-item inputs for each target outcome set.
+
+    The outcomes a contract can produce depend on the collections of its
+    inputs, and their wear on how low the input floats are. Listings go into
+    min-heaps keyed by (price, float) per collection and wear, plus one per
+    wear for the whole rarity. For every collection (and the rarity as a
+    whole) and every wear cap, the 10 cheapest listings at or below that wear
+    are read off the heaps, so after an O(n log n) build each target costs
+    O(10 log 10) instead of enumerating C(n, 10) combinations.
+    """
+
+    def __init__(self, engine: TradeUpEngine):
+        self.engine = engine
+
+    def build_heaps(self, table: ListingTable) -> Dict[int, Dict[int, List[HeapEntry]]]:
+        """Heaps of a table's listings by collection code (or ANY_COLLECTION), then wear code."""
+        collection, _ = self.engine.input_collections(table)
+        floats = self.engine.input_floats(table)
+        heaps: Dict[int, Dict[int, List[HeapEntry]]] = {}
+        rows = zip(collection.tolist(), table.wear_codes.tolist(), table.price_cents.tolist(), floats.tolist())
+        for row, (code, wear, price, value) in enumerate(rows):
+            if code < 0 or wear < 0:
+                continue
+            for key in (code, ANY_COLLECTION):
+                heaps.setdefault(key, {}).setdefault(wear, []).append((price, value, row))
+
+        for by_wear in heaps.values():
+            for heap in by_wear.values():
+                heapq.heapify(heap)
+        return heaps
+
+    @staticmethod
+    def cheapest(by_wear: Dict[int, List[HeapEntry]], wear_cap: int, count: int = CONTRACT_SIZE) -> List[HeapEntry]:
+        """The `count` cheapest entries with a wear code at or below `wear_cap`."""
+        streams = [_heap_smallest(heap, count) for wear, heap in by_wear.items() if wear <= wear_cap]
+        return list(islice(heapq.merge(*streams), count))
+
+    def select(self, table: ListingTable) -> np.ndarray:
+        """Cheapest inputs per (collection, wear cap) as a (K, 10) array of row positions in `table`."""
+        candidates: Dict[Tuple[int, ...], None] = {}
+        for by_wear in self.build_heaps(table).values():
+            for wear_cap in sorted(by_wear):
+                picks = self.cheapest(by_wear, wear_cap)
+                if len(picks) == CONTRACT_SIZE:
+                    candidates.setdefault(tuple(sorted(row for _, _, row in picks)), None)
+        return np.array(list(candidates), dtype=np.int64).reshape(-1, CONTRACT_SIZE)
+
+
+class FloatTargetOptimizer:
+    """Finds the cheapest 10 inputs from one collection that guarantee a target output wear.
+
+    Every output is at the target wear or better when the average input float
+    stays at or below `TradeUpEngine.max_average_float`, so this is a knapsack
+    with exactly 10 items, minimizing price under a float-sum budget. Listings
+    with 10 or more others both cheaper and lower-float can never be needed,
+    which leaves a small frontier; that is searched depth-first in price
+    order, pruning branches whose cheapest completion can't beat the best
+    contract so far or whose lowest-float completion breaks the budget.
+    Scraped listings have no exact float, so each one counts at its worst
+    case (the top of its wear band clipped to the skin's max float) and the
+    target wear holds whatever the listings' actual floats are.
+    """
+
+    def __init__(self, engine: TradeUpEngine, max_nodes: int = 200_000):
+        self.engine = engine
+        self.max_nodes = max_nodes
+
+    @staticmethod
+    def frontier(prices: np.ndarray, floats: np.ndarray) -> np.ndarray:
+        """Positions of listings dominated (cheaper and lower float) by fewer than 10 others, by price."""
+        keep = []
+        lowest: List[float] = []  # max-heap (negated) of the 10 lowest floats seen so far
+        for position in np.lexsort((floats, prices)).tolist():
+            value = floats[position]
+            if len(lowest) < CONTRACT_SIZE:
+                heapq.heappush(lowest, -value)
+            elif value < -lowest[0]:
+                heapq.heapreplace(lowest, -value)
+            else:
+                continue
+            keep.append(position)
+        return np.array(keep, dtype=np.int64)
+
+    def optimize(self, prices: np.ndarray, floats: np.ndarray, max_average: float) -> Optional[np.ndarray]:
+        """Positions of the cheapest 10 listings with an average float of at most `max_average`."""
+        candidates = self.frontier(prices, floats)
+        count = len(candidates)
+        budget = max_average * CONTRACT_SIZE + 1e-12
+        if count < CONTRACT_SIZE:
+            return None
+        item_prices = prices[candidates].tolist()
+        item_floats = floats[candidates].tolist()
+        price_sums = [0, *accumulate(item_prices)]
+
+        # low_floats[i][r]: sum of the r lowest floats among candidates i..
+        low_floats = [[0.0] * (CONTRACT_SIZE + 1) for _ in range(count + 1)]
+        lowest: List[float] = []
+        for index in range(count - 1, -1, -1):
+            insort(lowest, item_floats[index])
+            del lowest[CONTRACT_SIZE:]
+            sums = low_floats[index]
+            for size in range(1, CONTRACT_SIZE + 1):
+                sums[size] = sums[size - 1] + lowest[size - 1] if size <= len(lowest) else np.inf
+        if low_floats[0][CONTRACT_SIZE] > budget:
+            return None
+
+        # Start from the 10 lowest-float listings, which are feasible
+        best = sorted(range(count), key=item_floats.__getitem__)[:CONTRACT_SIZE]
+        best_cost = sum(item_prices[index] for index in best)
+        chosen: List[int] = []
+        nodes = 0
+
+        def search(start: int, float_sum: float, cost: int):
+            nonlocal best, best_cost, nodes
+            remaining = CONTRACT_SIZE - len(chosen)
+            if not remaining:
+                if cost < best_cost:
+                    best, best_cost = list(chosen), cost
+                return
+            for index in range(start, count - remaining + 1):
+                nodes += 1
+                # Both bounds only grow with `index`, so the rest of the loop is pruned too
+                if cost + price_sums[index + remaining] - price_sums[index] >= best_cost:
+                    return
+                if float_sum + low_floats[index][remaining] > budget or nodes > self.max_nodes:
+                    return
+                if float_sum + item_floats[index] + low_floats[index + 1][remaining - 1] > budget:
+                    continue
+                chosen.append(index)
+                search(index + 1, float_sum + item_floats[index], cost + item_prices[index])
+                chosen.pop()
+
+        search(0, 0.0, 0)
+        if nodes > self.max_nodes:
+            logger.debug(f"Float target search stopped after {self.max_nodes} nodes, using the best contract found")
+        return candidates[best]
+
+    def select(self, table: ListingTable, next_rarity: str) -> np.ndarray:
+        """Cheapest inputs per (collection, guaranteed output wear) as a (K, 10) array of row positions."""
+        collection, collections = self.engine.input_collections(table)
+        floats = self.engine.worst_case_floats(table)
+        prices = table.price_cents
+        has_wear = table.wear_codes >= 0
+
+        candidates: Dict[Tuple[int, ...], None] = {}
+        for code, name in enumerate(collections):
+            outputs = self.engine.catalog.collection_skins(name, next_rarity)
+            rows = np.flatnonzero((collection == code) & has_wear)
+            if not outputs or len(rows) < CONTRACT_SIZE:
+                continue
+            for wear in Wear:
+                picks = self.optimize(prices[rows], floats[rows], self.engine.max_average_float(outputs, wear))
+                if picks is not None:
+                    candidates.setdefault(tuple(sorted(rows[picks].tolist())), None)
+        return np.array(list(candidates), dtype=np.int64).reshape(-1, CONTRACT_SIZE)
+
+
+class CompositionSearch:
+    """Searches how to split the 10 input slots across collections for the top-k profits.
+
+    A composition takes the n cheapest listings of each collection it uses.
+    Its expected value is the sum over collections of n/10 times the mean
+    value of that collection's outputs, at the wear the average input float
+    gives them. Outputs only change wear at a few breakpoints of the average
+    float, and between two breakpoints every input slot of a collection is
+    worth a fixed amount. Within such an interval profit is separable and
+    concave per collection (its cheapest listings get dearer), so the best
+    profit for the slots still open is the sum of the largest marginal gains
+    left: an exact upper bound when the float constraint is relaxed.
+    Branches whose average float can't land in the interval are left to the
+    search of their own interval. Intervals and branches whose bound can't beat the k-th best profit found
+    so far are pruned, which keeps hundreds of collections tractable.
+    """
+
+    def __init__(self, engine: TradeUpEngine, top_k: int = 50):
+        self.engine = engine
+        self.top_k = top_k
+
+    def _collection_inputs(self, table: ListingTable) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Per collection, its 10 cheapest rows with their price and float prefix sums."""
+        collection, collections = self.engine.input_collections(table)
+        floats = self.engine.input_floats(table)
+        prices = table.price_cents
+        usable = np.flatnonzero((collection >= 0) & (table.wear_codes >= 0))
+        order = usable[np.lexsort((floats[usable], prices[usable], collection[usable]))]
+
+        inputs = {}
+        codes, starts = np.unique(collection[order], return_index=True)
+        for code, start in zip(codes.tolist(), starts.tolist()):
+            rows = order[start:start + CONTRACT_SIZE]
+            rows = rows[collection[rows] == code]
+            inputs[collections[code]] = (
+                rows,
+                np.concatenate(([0], np.cumsum(prices[rows]))),
+                np.concatenate(([0.0], np.cumsum(floats[rows])))
+            )
+        return inputs
+
+    def search(self, table: ListingTable, next_rarity: str, market: Optional[ListingTable],
+               stattrak: bool = False) -> List[Tuple[float, Dict[str, int]]]:
+        """Top-k compositions as (profit cents, {collection: inputs}), best first."""
+        return self._search(self._collection_inputs(table), next_rarity, market, stattrak)
+
+    def _search(self, inputs: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]], next_rarity: str,
+                market: Optional[ListingTable], stattrak: bool) -> List[Tuple[float, Dict[str, int]]]:
+        collections = [name for name in inputs if self.engine.catalog.collection_skins(name, next_rarity)]
+        if not collections:
+            return []
+        outputs = [self.engine.catalog.collection_skins(name, next_rarity) for name in collections]
+        skins = [skin for collection_outputs in outputs for skin in collection_outputs]
+        output_collection = np.repeat(np.arange(len(collections)), [len(group) for group in outputs])
+        outputs_per_collection = np.bincount(output_collection, minlength=len(collections))
+        prices, _ = self.engine.output_prices(skins, market, stattrak)
+        low = np.array([skin.min_float for skin in skins])
+        span = np.array([skin.max_float - skin.min_float for skin in skins])
+        wear_high = self.engine.wear_high
+
+        def slot_values(average: np.ndarray) -> np.ndarray:
+            """Value of one input slot per collection for each average input float: (A, C)."""
+            wears = np.minimum(np.searchsorted(wear_high, low + span * average[:, None], side="right"), len(Wear) - 1)
+            values = np.zeros((len(average), len(collections)))
+            np.add.at(values.T, output_collection, prices[np.arange(len(skins)), wears].T)
+            return values / outputs_per_collection / CONTRACT_SIZE
+
+        # Average floats where some output moves to another wear split [0, 1] into intervals
+        with np.errstate(divide="ignore", invalid="ignore"):
+            breaks = (wear_high[None, :-1] - low[:, None]) / span[:, None]
+        breaks = np.unique(np.concatenate(([0.0, 1.0], breaks[(breaks > 0) & (breaks < 1)])))
+        interval_values = slot_values((breaks[:-1] + breaks[1:]) / 2)
+
+        # Price of each collection's j-th cheapest listing, inf where it has fewer than 10
+        costs = np.full((len(collections), CONTRACT_SIZE), np.inf)
+        for position, name in enumerate(collections):
+            listing_prices = np.diff(inputs[name][1])
+            costs[position, :len(listing_prices)] = listing_prices
+        price_sums = [inputs[name][1].tolist() for name in collections]
+        float_sums = [inputs[name][2].tolist() for name in collections]
+        pick_floats = [np.diff(inputs[name][2]) for name in collections]
+
+        # Per collection (min float, float span, price by wear) of each output, to score leaves without NumPy
+        boundaries = wear_high[:-1].tolist()
+        output_models = [[] for _ in collections]
+        for index, (skin_low, skin_span, skin_prices) in enumerate(zip(low.tolist(), span.tolist(), prices.tolist())):
+            output_models[output_collection[index]].append((skin_low, skin_span, skin_prices))
+
+        # Profit bound per interval: the 10 largest marginal gains over all collections
+        marginals = (interval_values[:, :, None] - costs[None]).reshape(len(interval_values), -1)
+        if marginals.shape[1] < CONTRACT_SIZE:
+            return []
+        interval_bounds = -np.partition(-marginals, CONTRACT_SIZE - 1, axis=1)[:, :CONTRACT_SIZE].sum(axis=1)
+
+        best: List[Tuple[float, int, Tuple[Tuple[int, int], ...]]] = []  # min-heap of the top-k leaves
+        seen = set()
+        leaves = count_from()
+
+        def threshold() -> float:
+            return best[0][0] if len(best) >= self.top_k else -np.inf
+
+        def keep(composition: Tuple[Tuple[int, int], ...]):
+            """Score a complete composition exactly and keep it if it is among the top k."""
+            if composition in seen:
+                return
+            seen.add(composition)
+            average = sum(float_sums[position][amount] for position, amount in composition) / CONTRACT_SIZE
+            profit = 0.0
+            for position, amount in composition:
+                models = output_models[position]
+                value = sum(skin_prices[bisect_right(boundaries, skin_low + skin_span * average)]
+                            for skin_low, skin_span, skin_prices in models)
+                profit += amount * value / len(models) / CONTRACT_SIZE - price_sums[position][amount]
+            entry = (profit, next(leaves), composition)
+            if len(best) < self.top_k:
+                heapq.heappush(best, entry)
+            elif profit > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+        for interval in np.argsort(-interval_bounds).tolist():
+            if interval_bounds[interval] <= threshold():
+                break
+            values = interval_values[interval]
+            float_low, float_high = breaks[interval] * CONTRACT_SIZE, breaks[interval + 1] * CONTRACT_SIZE
+
+            # Largest first gain first, so good compositions are found early
+            order = np.argsort(-(values - costs[:, 0])).tolist()
+            gains = values[order][:, None] - costs[order]
+            # Over r slots spread across order[i:]: best_gain[i][r] is the largest gain and
+            # low_floats / high_floats[i][r] bound the float sum (-inf / inf if too few listings)
+            best_gain = [[0.0] + [-np.inf] * CONTRACT_SIZE for _ in range(len(order) + 1)]
+            low_floats = [[0.0] + [np.inf] * CONTRACT_SIZE for _ in range(len(order) + 1)]
+            high_floats = [[0.0] + [-np.inf] * CONTRACT_SIZE for _ in range(len(order) + 1)]
+            largest: List[float] = []
+            lowest: List[float] = []
+            highest: List[float] = []
+            for index in range(len(order) - 1, -1, -1):
+                floats = pick_floats[order[index]].tolist()
+                largest = sorted([*largest, *gains[index].tolist()], reverse=True)[:CONTRACT_SIZE]
+                lowest = sorted([*lowest, *floats])[:CONTRACT_SIZE]
+                highest = sorted([*highest, *floats], reverse=True)[:CONTRACT_SIZE]
+                for size in range(1, CONTRACT_SIZE + 1):
+                    best_gain[index][size] = best_gain[index][size - 1] + largest[size - 1]
+                for size in range(1, len(lowest) + 1):
+                    low_floats[index][size] = low_floats[index][size - 1] + lowest[size - 1]
+                    high_floats[index][size] = high_floats[index][size - 1] + highest[size - 1]
+            gain_sums = [np.concatenate(([0.0], np.cumsum(row))).tolist() for row in gains]
+            composition: List[Tuple[int, int]] = []
+
+            def branch(start: int, remaining: int, gain: float, float_sum: float):
+                if not remaining:
+                    if gain > threshold():
+                        keep(tuple(sorted(composition)))
+                    return
+                for index in range(start, len(order)):
+                    # The bounds only get tighter as collections are left out, so later ones are pruned too.
+                    # Compositions whose average float can't land in this interval are searched in their own.
+                    if gain + best_gain[index][remaining] <= threshold():
+                        return
+                    if (float_sum + low_floats[index][remaining] > float_high
+                            or float_sum + high_floats[index][remaining] < float_low):
+                        return
+                    position = order[index]
+                    for amount in range(min(remaining, len(price_sums[position]) - 1), 0, -1):
+                        bound = gain + gain_sums[index][amount]
+                        if bound + best_gain[index + 1][remaining - amount] <= threshold():
+                            continue
+                        picked = float_sum + float_sums[position][amount]
+                        left = remaining - amount
+                        if picked + low_floats[index + 1][left] > float_high or picked + high_floats[index + 1][left] < float_low:
+                            continue
+                        composition.append((position, amount))
+                        branch(index + 1, left, bound, picked)
+                        composition.pop()
+
+            branch(0, CONTRACT_SIZE, 0.0, 0.0)
+
+        return [
+            (profit, {collections[position]: amount for position, amount in composition})
+            for profit, _, composition in sorted(best, reverse=True)
+        ]
+
+    def select(self, table: ListingTable, next_rarity: str, market: Optional[ListingTable],
+               stattrak: bool = False) -> np.ndarray:
+        """Inputs of the top-k compositions as a (K, 10) array of row positions in `table`."""
+        inputs = self._collection_inputs(table)
+        candidates = [
+            sorted(row for name, amount in composition.items() for row in inputs[name][0][:amount].tolist())
+            for _, composition in self._search(inputs, next_rarity, market, stattrak)
+        ]
+        return np.array(candidates, dtype=np.int64).reshape(-1, CONTRACT_SIZE)
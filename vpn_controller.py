@@ -0,0 +1,244 @@
+import os
+import time
+import random
+import logging
+import threading
+import subprocess
+from collections import deque
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class VPNRotationController:
+    """Rotate the Mullvad relay on a background thread without stalling the scraper.
+
+    Rotations trigger every `rotation_interval` seconds (when auto-rotating) or
+    after `throttle_threshold` consecutive HTTP 429s. Requests go through
+    `request()`, which holds new work while a rotation is pending, lets work in
+    flight drain, and resumes once the new tunnel reports as connected.
+
+    The tunnel is system-wide, so processes sharing it (batch scan workers)
+    share one rotation state from `create_shared_state`: the owning process
+    starts the controller and rotates, the others only gate their requests on
+    it and report throttles.
+    """
+
+    def __init__(self, mullvad_path: str, locations: List[str], used_locations: deque,
+                 rotation_interval: float = 300.0, auto_rotate: bool = True, throttle_threshold: int = 3,
+                 command_timeout: float = 30.0, drain_timeout: float = 30.0, verify_timeout: float = 30.0,
+                 shared_state: Optional[Dict[str, Any]] = None):
+        self.mullvad_path = mullvad_path
+        self.locations = locations
+        self.used_locations = used_locations
+        self.rotation_interval = rotation_interval
+        self.auto_rotate = auto_rotate
+        self.throttle_threshold = throttle_threshold
+        self.command_timeout = command_timeout
+        self.drain_timeout = drain_timeout
+        self.verify_timeout = verify_timeout
+
+        self.rotations: List[Dict[str, Any]] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if shared_state is None:
+            shared_state = {
+                "condition": threading.Condition(),
+                "trigger": threading.Event(),
+                "state": SimpleNamespace(**self._initial_state())
+            }
+        self._condition = shared_state["condition"]
+        self._trigger = shared_state["trigger"]
+        # rotating, in_flight, throttles (consecutive) and the pending rotation reason
+        self._state = shared_state["state"]
+
+    @staticmethod
+    def _initial_state() -> Dict[str, Any]:
+        return {"rotating": False, "in_flight": 0, "throttles": 0, "reason": None}
+
+    @classmethod
+    def create_shared_state(cls, manager) -> Dict[str, Any]:
+        """Create rotation state that can be shared with other processes through a multiprocessing manager."""
+        return {
+            "condition": manager.Condition(),
+            "trigger": manager.Event(),
+            "state": manager.Namespace(**cls._initial_state())
+        }
+
+    @classmethod
+    def from_config(cls, vpn_config: Dict[str, Any], mullvad_path: str, locations: List[str],
+                    used_locations: deque, shared_state: Optional[Dict[str, Any]] = None) -> "VPNRotationController":
+        """Create a controller from the scraping.vpn settings."""
+        settings = vpn_config['settings']
+        return cls(
+            mullvad_path=mullvad_path,
+            locations=locations,
+            used_locations=used_locations,
+            rotation_interval=settings['rotation_interval'],
+            auto_rotate=settings['auto_rotate'],
+            throttle_threshold=settings['rotate_after_throttles'],
+            command_timeout=settings['connection_timeout'],
+            drain_timeout=settings['drain_timeout_seconds'],
+            verify_timeout=settings['verify_timeout_seconds'],
+            shared_state=shared_state
+        )
+
+    @classmethod
+    def for_platform(cls, vpn_config: Dict[str, Any],
+                     shared_state: Optional[Dict[str, Any]] = None) -> "VPNRotationController":
+        """Create a controller for this OS's Mullvad CLI and the preferred regions' locations."""
+        locations = []
+        for region in vpn_config['settings']['preferred_regions']:
+            locations.extend(vpn_config['locations'].get(region, []))
+        return cls.from_config(
+            vpn_config,
+            mullvad_path=vpn_config['paths'].get(os.name, ''),
+            locations=locations,
+            used_locations=deque(maxlen=vpn_config['settings']['max_used_locations']),
+            shared_state=shared_state
+        )
+
+    def ensure_connected(self) -> bool:
+        """Connect the tunnel if it is down; False if the CLI is missing or it doesn't connect."""
+        if not os.path.exists(self.mullvad_path):
+            logger.warning("VPN executable not found")
+            return False
+        try:
+            if "Disconnected" in self._mullvad("status").stdout:
+                logger.info("Connecting to VPN...")
+                self._mullvad("connect")
+            return self._verify_connected()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Failed to connect VPN: {str(e)}")
+            return False
+
+    def start(self):
+        """Start the background rotation thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="vpn-rotation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the rotation thread and release any waiting requests."""
+        self._stopped.set()
+        self._trigger.set()
+        with self._condition:
+            self._state.rotating = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout=self.command_timeout)
+
+    def request_rotation(self, reason: str = "requested"):
+        """Ask the background thread to rotate as soon as possible (non-blocking)."""
+        with self._condition:
+            if self._state.reason is None:
+                self._state.reason = reason
+        self._trigger.set()
+
+    def report_throttle(self):
+        """Count a 429 response; rotate after too many in a row."""
+        with self._condition:
+            self._state.throttles += 1
+            should_rotate = self._state.throttles >= self.throttle_threshold
+        if should_rotate:
+            self.request_rotation(f"{self.throttle_threshold} consecutive throttles")
+
+    def report_success(self):
+        with self._condition:
+            self._state.throttles = 0
+
+    @contextmanager
+    def request(self):
+        """Hold a request while the tunnel rotates, and track it as in flight.
+
+        Enter this before taking any shared request slot (e.g. the cross-process
+        semaphore), so requests held here don't block others from finishing.
+        """
+        with self._condition:
+            # Checked and counted under one lock, so a rotation can't start in between
+            while self._state.rotating and not self._stopped.is_set():
+                self._condition.wait()
+            self._state.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._state.in_flight -= 1
+                self._condition.notify_all()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            timeout = self.rotation_interval if self.auto_rotate else None
+            triggered = self._trigger.wait(timeout)
+            if self._stopped.is_set():
+                break
+            self._trigger.clear()
+            with self._condition:
+                reason = self._state.reason or ("interval" if not triggered else "requested")
+                self._state.reason = None
+            self._rotate(reason)
+
+    def _mullvad(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run([self.mullvad_path, *args], capture_output=True, text=True,
+                              timeout=self.command_timeout)
+
+    def _pick_location(self) -> str:
+        available = [loc for loc in self.locations if loc not in self.used_locations] or self.locations
+        location = random.choice(available)
+        self.used_locations.append(location)
+        return location
+
+    def _verify_connected(self) -> bool:
+        """Poll `mullvad status` until the tunnel reports connected."""
+        deadline = time.monotonic() + self.verify_timeout
+        while time.monotonic() < deadline:
+            try:
+                status = self._mullvad("status").stdout
+                if "Connected" in status and "Disconnected" not in status:
+                    return True
+            except subprocess.SubprocessError:
+                pass
+            time.sleep(0.25)
+        return False
+
+    def _rotate(self, reason: str):
+        """Pause new work, drain work in flight, switch relay and resume once verified."""
+        started = time.monotonic()
+        try:
+            with self._condition:
+                self._state.rotating = True
+                drained = self._condition.wait_for(lambda: self._state.in_flight == 0, timeout=self.drain_timeout)
+            drain_seconds = time.monotonic() - started
+            if not drained:
+                logger.warning(f"VPN rotation: {self._state.in_flight} requests still in flight after {self.drain_timeout}s")
+
+            location = self._pick_location()
+            self._mullvad("disconnect")
+            self._mullvad("relay", "set", "location", location)
+            self._mullvad("connect")
+            verified = self._verify_connected()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Failed to rotate VPN: {str(e)}")
+            location, verified, drain_seconds = None, False, time.monotonic() - started
+        finally:
+            with self._condition:
+                self._state.rotating = False
+                self._state.throttles = 0
+                self._condition.notify_all()
+
+        duration = time.monotonic() - started
+        self.rotations.append({
+            "reason": reason,
+            "location": location,
+            "verified": verified,
+            "drain_seconds": drain_seconds,
+            "total_seconds": duration
+        })
+        if verified:
+            logger.info(f"Rotated VPN to {location} ({reason}) in {duration:.1f}s (drain {drain_seconds:.1f}s)")
+        else:
+            logger.warning(f"VPN rotation to {location} ({reason}) not verified after {duration:.1f}s")